@@ -0,0 +1,354 @@
+'''
+Module for class Accumulator, which accumulates face totals, jackpot counts, and counts of face combinations of chunks of rolls without keeping the rolls
+'''
+
+from montecarlosimulator.Coding import count_codes_of_rows
+from montecarlosimulator.Coding import get_smallest_unsigned_integer_type
+import numpy as np
+
+class Accumulator:
+    '''
+    Accumulates face totals, jackpot counts, and counts of face combinations of chunks of rolls without keeping the rolls.
+    Uses memory proportional to the number of faces and the number of distinct face combinations rolled, not to the number of rolls.
+    A face combination is the sorted codes of the faces of one roll; it is packed into one unsigned 64-bit key when every combination fits, and is otherwise kept as the raw bytes of its sorted codes or of its face counts, whichever are shorter.
+
+    Instance variables:
+        _number_of_faces: int -- the number of faces that codes index
+        _number_of_dice: int -- the number of dice in a roll
+        _type_of_code: np.dtype -- the unsigned integer data type of the codes of accumulated rolls
+        _form_of_keys: str -- 'packed' if face combinations are packed into unsigned 64-bit keys, 'codes' if they are kept as the bytes of their sorted codes, or 'face_counts' if they are kept as the bytes of their face counts
+        _type_of_face_count: np.dtype -- the smallest unsigned integer data type that can hold the number of dice with a face
+        _number_of_rolls: int -- the number of accumulated rolls
+        _array_of_totals_of_faces: np.ndarray -- a 1D numpy array of the number of times each face was rolled by any die
+        _number_of_jackpots: int -- the number of accumulated rolls where all dice have the same face
+        _array_of_keys_of_combinations: np.ndarray -- a sorted 1D numpy array of the distinct keys of accumulated face combinations
+        _array_of_counts_of_combinations: np.ndarray -- a 1D numpy array of the number of times the face combination of each key was rolled
+
+    Public methods:
+        __init__
+        add
+        add_face_counts
+        merge
+        get_number_of_rolls
+        get_array_of_totals_of_faces
+        get_number_of_jackpots
+        get_combinations_and_counts
+    '''
+
+    def __init__(self, number_of_faces, number_of_dice, type_of_code):
+        '''
+        Initializes an Accumulator object without any rolls
+
+        Keyword arguments:
+            number_of_faces: int -- the number of faces that codes index
+            number_of_dice: int -- the number of dice in a roll
+            type_of_code: type -- the unsigned integer data type of the codes of rolls to be accumulated
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this Accumulator object's empty totals, jackpot count, and counts of face combinations
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        self._number_of_faces = number_of_faces
+        self._number_of_dice = number_of_dice
+        self._type_of_code = np.dtype(type_of_code)
+        self._type_of_face_count = np.dtype(get_smallest_unsigned_integer_type(number_of_dice + 1))
+        if number_of_faces ** number_of_dice <= 2 ** 64:
+            self._form_of_keys = 'packed'
+            type_of_key = np.dtype(np.uint64)
+        elif number_of_faces * self._type_of_face_count.itemsize < number_of_dice * self._type_of_code.itemsize:
+            self._form_of_keys = 'face_counts'
+            type_of_key = np.dtype((np.void, number_of_faces * self._type_of_face_count.itemsize))
+        else:
+            self._form_of_keys = 'codes'
+            type_of_key = np.dtype((np.void, number_of_dice * self._type_of_code.itemsize))
+        self._number_of_rolls = 0
+        self._array_of_totals_of_faces = np.zeros(number_of_faces, dtype = np.int64)
+        self._number_of_jackpots = 0
+        self._array_of_keys_of_combinations = np.empty(0, dtype = type_of_key)
+        self._array_of_counts_of_combinations = np.empty(0, dtype = np.int64)
+
+    def add(self, matrix_of_codes):
+        '''
+        Accumulates a chunk of rolls
+
+        Keyword arguments:
+            matrix_of_codes: np.ndarray -- a 2D numpy array of codes of rolled faces, where the number of rows is the number of rolls in the chunk and the number of columns is the number of dice
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the rolls of the chunk to the totals, jackpot count, and counts of face combinations of this Accumulator object
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._form_of_keys == 'face_counts':
+            self.add_face_counts(count_codes_of_rows(matrix_of_codes, self._number_of_faces))
+            return
+        self._number_of_rolls += len(matrix_of_codes)
+        self._array_of_totals_of_faces += np.bincount(matrix_of_codes.ravel(), minlength = self._number_of_faces)
+        matrix_of_sorted_codes = np.sort(matrix_of_codes, axis = 1)
+        self._number_of_jackpots += int(np.count_nonzero(matrix_of_sorted_codes[:, 0] == matrix_of_sorted_codes[:, -1]))
+        array_of_keys, array_of_counts = np.unique(self._generate_keys(matrix_of_sorted_codes), return_counts = True)
+        self._merge_keys_and_counts(array_of_keys, array_of_counts)
+
+    def add_face_counts(self, matrix_of_face_counts):
+        '''
+        Accumulates a chunk of rolls described only by how many dice rolled each face, as drawn by Die.roll_face_counts
+
+        Keyword arguments:
+            matrix_of_face_counts: np.ndarray -- a 2D numpy array of nonnegative integer counts, where the number of rows is the number of rolls in the chunk, the number of columns is the number of faces, and each row sums to the number of dice
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the rolls of the chunk to the totals, jackpot count, and counts of face combinations of this Accumulator object
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if len(matrix_of_face_counts) == 0:
+            return
+        self._number_of_rolls += len(matrix_of_face_counts)
+        self._array_of_totals_of_faces += matrix_of_face_counts.sum(axis = 0, dtype = np.int64)
+        self._number_of_jackpots += int(np.count_nonzero(matrix_of_face_counts.max(axis = 1) == self._number_of_dice))
+        if self._form_of_keys == 'packed':
+            # The sorted codes of a roll hold each face in one run of positions, so the key of the roll is a sum over faces of the face times a difference of geometric sums of powers of the number of faces, computed without expanding any roll.
+            array_of_geometric_sums = np.zeros(self._number_of_dice + 1, dtype = np.uint64)
+            for exponent in range(0, self._number_of_dice):
+                array_of_geometric_sums[exponent + 1] = array_of_geometric_sums[exponent] * np.uint64(self._number_of_faces) + np.uint64(1)
+            matrix_of_face_counts = matrix_of_face_counts.astype(np.intp)
+            matrix_of_numbers_of_positions_after_runs = self._number_of_dice - np.cumsum(matrix_of_face_counts, axis = 1)
+            matrix_of_numbers_of_positions_from_runs = matrix_of_numbers_of_positions_after_runs + matrix_of_face_counts
+            matrix_of_weights_of_runs = array_of_geometric_sums[matrix_of_numbers_of_positions_from_runs] - array_of_geometric_sums[matrix_of_numbers_of_positions_after_runs]
+            array_of_keys = matrix_of_weights_of_runs @ np.arange(self._number_of_faces, dtype = np.uint64)
+            array_of_keys, array_of_counts = np.unique(array_of_keys, return_counts = True)
+        else:
+            matrix_of_face_counts = np.ascontiguousarray(matrix_of_face_counts, dtype = self._type_of_face_count)
+            type_of_row = np.dtype((np.void, self._number_of_faces * self._type_of_face_count.itemsize))
+            array_of_keys, array_of_counts = np.unique(matrix_of_face_counts.view(type_of_row).ravel(), return_counts = True)
+            if self._form_of_keys == 'codes':
+                # Rolls with equal face counts have the same face combination, so only distinct rows are expanded into sorted codes.
+                array_of_keys = self._generate_keys(self._expand_face_counts(array_of_keys))
+        self._merge_keys_and_counts(array_of_keys, array_of_counts)
+
+    def _generate_keys(self, matrix_of_sorted_codes):
+        '''
+        Generates the keys of the face combinations of rolls
+
+        Keyword arguments:
+            matrix_of_sorted_codes: np.ndarray -- a 2D numpy array where each row is the sorted codes of the faces of a roll
+
+        Return values:
+            array_of_keys: np.ndarray -- a 1D numpy array of the key of each roll, packed into unsigned 64-bit integers or viewing the bytes of the sorted codes
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._form_of_keys == 'packed':
+            array_of_keys = np.zeros(len(matrix_of_sorted_codes), dtype = np.uint64)
+            for index_of_die in range(0, self._number_of_dice):
+                array_of_keys *= np.uint64(self._number_of_faces)
+                array_of_keys += matrix_of_sorted_codes[:, index_of_die]
+            return array_of_keys
+        return np.ascontiguousarray(matrix_of_sorted_codes, dtype = self._type_of_code).view(self._array_of_keys_of_combinations.dtype).ravel()
+
+    def merge(self, accumulator):
+        '''
+        Accumulates the rolls accumulated by another Accumulator object, such as one filled by a worker process
+
+        Keyword arguments:
+            accumulator: Accumulator -- an Accumulator object with the same number of faces, number of dice, and data type of codes
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the totals, jackpot count, and counts of face combinations of the other Accumulator object to those of this Accumulator object
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        self._number_of_rolls += accumulator._number_of_rolls
+        self._array_of_totals_of_faces += accumulator._array_of_totals_of_faces
+        self._number_of_jackpots += accumulator._number_of_jackpots
+        self._merge_keys_and_counts(accumulator._array_of_keys_of_combinations, accumulator._array_of_counts_of_combinations)
+
+    def _merge_keys_and_counts(self, array_of_keys, array_of_counts):
+        '''
+        Merges distinct keys of face combinations and their counts into those of this Accumulator object
+
+        Keyword arguments:
+            array_of_keys: np.ndarray -- a 1D numpy array of distinct keys of face combinations
+            array_of_counts: np.ndarray -- a 1D numpy array of the counts of the keys
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the counts to the counts of face combinations of this Accumulator object
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_merged_keys, array_of_inverse_indices = np.unique(np.concatenate([self._array_of_keys_of_combinations, array_of_keys]), return_inverse = True)
+        array_of_merged_counts = np.zeros(len(array_of_merged_keys), dtype = np.int64)
+        np.add.at(array_of_merged_counts, array_of_inverse_indices, np.concatenate([self._array_of_counts_of_combinations, array_of_counts]))
+        self._array_of_keys_of_combinations = array_of_merged_keys
+        self._array_of_counts_of_combinations = array_of_merged_counts
+
+    def _expand_face_counts(self, array_of_keys):
+        '''
+        Expands keys that are the bytes of face counts into the sorted codes of their face combinations
+
+        Keyword arguments:
+            array_of_keys: np.ndarray -- a 1D numpy array of keys that view the face counts of face combinations
+
+        Return values:
+            matrix_of_sorted_codes: np.ndarray -- a 2D numpy array where each row is the sorted codes of the face combination of a key
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        matrix_of_face_counts = np.ascontiguousarray(array_of_keys).view(self._type_of_face_count).reshape(-1, self._number_of_faces)
+        array_of_codes = np.tile(np.arange(self._number_of_faces, dtype = self._type_of_code), len(matrix_of_face_counts))
+        return np.repeat(array_of_codes, matrix_of_face_counts.ravel()).reshape(-1, self._number_of_dice)
+
+    def get_number_of_rolls(self):
+        '''
+        Gets the number of accumulated rolls
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _number_of_rolls: int -- the number of accumulated rolls
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._number_of_rolls
+
+    def get_array_of_totals_of_faces(self):
+        '''
+        Gets the number of times each face was rolled by any die
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _array_of_totals_of_faces: np.ndarray -- a 1D numpy array of totals, where the total at an index is that of the face with that code
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._array_of_totals_of_faces
+
+    def get_number_of_jackpots(self):
+        '''
+        Gets the number of accumulated rolls where all dice have the same face
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _number_of_jackpots: int -- the number of jackpots
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._number_of_jackpots
+
+    def get_combinations_and_counts(self):
+        '''
+        Gets the distinct face combinations of accumulated rolls and how many times each was rolled
+
+        Keyword arguments:
+            none
+
+        Return values:
+            matrix_of_combinations: np.ndarray -- a 2D numpy array where each row is the sorted codes of a distinct face combination
+            array_of_counts: np.ndarray -- a 1D numpy array of the number of times each face combination was rolled
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._form_of_keys == 'packed':
+            matrix_of_combinations = np.empty((len(self._array_of_keys_of_combinations), self._number_of_dice), dtype = self._type_of_code)
+            array_of_keys = self._array_of_keys_of_combinations.copy()
+            for index_of_die in range(self._number_of_dice - 1, -1, -1):
+                array_of_keys, matrix_of_combinations[:, index_of_die] = np.divmod(array_of_keys, np.uint64(self._number_of_faces))
+        elif self._form_of_keys == 'codes':
+            matrix_of_combinations = self._array_of_keys_of_combinations.view(self._type_of_code).reshape(-1, self._number_of_dice)
+        else:
+            matrix_of_combinations = self._expand_face_counts(self._array_of_keys_of_combinations)
+        return matrix_of_combinations, self._array_of_counts_of_combinations
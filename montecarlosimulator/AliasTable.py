@@ -0,0 +1,91 @@
+'''
+Module for class AliasTable, which samples indices of faces in constant time per sample according to an array of weights
+'''
+
+from montecarlosimulator.Sampler import Sampler
+import numpy as np
+
+class AliasTable(Sampler):
+    '''
+    Samples indices of faces in constant time per sample according to an array of weights.
+    Is built once in linear time by Vose's alias method and may be sampled any number of times, which suits dice with many faces and large numbers of rolls.
+
+    Instance variables:
+        _number_of_faces: int -- the number of weights from which this AliasTable object was built
+        _array_of_probabilities: np.ndarray -- a 1D numpy array of probabilities with which an index drawn uniformly is kept rather than replaced by its alias
+        _array_of_aliases: np.ndarray -- a 1D numpy array of the indices that replace indices drawn uniformly that are not kept
+
+    Public methods:
+        __init__
+        sample
+    '''
+
+    def __init__(self, array_of_weights):
+        '''
+        Initializes an AliasTable object by Vose's alias method
+
+        Keyword arguments:
+            array_of_weights: np.ndarray -- a 1D numpy array of nonnegative, finite weights with a positive sum
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this AliasTable object's number of faces and arrays of probabilities and aliases
+
+        Exceptions raised:
+            ValueError, if the array of weights is empty, contains a negative or non-finite weight, or sums to zero
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        super().__init__(array_of_weights)
+        array_of_weights = np.asarray(array_of_weights, dtype = np.float64)
+        number_of_weights = len(array_of_weights)
+        sum_of_weights = array_of_weights.sum()
+        # Scales weights so that their mean is 1; a scaled weight below 1 is topped up by an alias with a scaled weight above 1.
+        list_of_scaled_weights = (array_of_weights * (number_of_weights / sum_of_weights)).tolist()
+        list_of_probabilities = [1.0] * number_of_weights
+        list_of_aliases = list(range(number_of_weights))
+        list_of_indices_of_small_weights = [i for i, scaled_weight in enumerate(list_of_scaled_weights) if scaled_weight < 1.0]
+        list_of_indices_of_large_weights = [i for i, scaled_weight in enumerate(list_of_scaled_weights) if scaled_weight >= 1.0]
+        while list_of_indices_of_small_weights and list_of_indices_of_large_weights:
+            index_of_small_weight = list_of_indices_of_small_weights.pop()
+            index_of_large_weight = list_of_indices_of_large_weights[-1]
+            list_of_probabilities[index_of_small_weight] = list_of_scaled_weights[index_of_small_weight]
+            list_of_aliases[index_of_small_weight] = index_of_large_weight
+            list_of_scaled_weights[index_of_large_weight] += list_of_scaled_weights[index_of_small_weight] - 1.0
+            if list_of_scaled_weights[index_of_large_weight] < 1.0:
+                list_of_indices_of_large_weights.pop()
+                list_of_indices_of_small_weights.append(index_of_large_weight)
+        # Any indices left over differ from 1 only by rounding error and are always kept.
+        self._array_of_probabilities = np.array(list_of_probabilities, dtype = np.float64)
+        self._array_of_aliases = np.array(list_of_aliases, dtype = np.intp)
+
+    def sample(self, number_of_samples, generator):
+        '''
+        Samples indices of faces according to the weights with which this AliasTable object was built
+
+        Keyword arguments:
+            number_of_samples: int -- An integer
+            generator: np.random.Generator -- A numpy random number generator
+
+        Return values:
+            array_of_indices: np.ndarray -- A 1D numpy array of sampled indices of faces
+
+        Side effects:
+            Advances the provided random number generator
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_indices = generator.integers(0, self._number_of_faces, size = number_of_samples)
+        array_of_uniform_numbers = generator.random(number_of_samples)
+        array_of_indices_are_replaced = array_of_uniform_numbers >= self._array_of_probabilities[array_of_indices]
+        array_of_indices[array_of_indices_are_replaced] = self._array_of_aliases[array_of_indices[array_of_indices_are_replaced]]
+        return array_of_indices
@@ -2,27 +2,70 @@
 Module for class Analyzer, which generates structures of descriptive statistics for a game that has been played
 '''
 
+from montecarlosimulator.Accumulator import Accumulator
+from montecarlosimulator.Coding import count_bits_of_rows
+from montecarlosimulator.Coding import count_codes_of_rows
+from montecarlosimulator.Coding import decode_keys_of_rows
+from montecarlosimulator.Coding import generate_keys_of_rows
+from montecarlosimulator.Coding import get_smallest_unsigned_integer_type
+from montecarlosimulator.Coding import get_type_of_keys_of_rows
+from montecarlosimulator.CombinationIndex import CombinationIndex
+import numpy as np
 import pandas as pd
 
+# Scanning the matrix of codes of a game in chunks of about this many codes bounds the temporary memory of a scan while keeping each chunk large enough for numpy to be fast.
+number_of_codes_per_chunk_of_scanned_rolls = 1048576
+
+def _get_number_of_rolls_per_chunk(number_of_dice):
+    '''
+    Gets the number of rolls in every chunk but the last of a scan of the matrix of codes of a game
+
+    Keyword arguments:
+        number_of_dice: int -- the number of dice in each roll
+
+    Return values:
+        int -- the number of rolls whose codes number about number_of_codes_per_chunk_of_scanned_rolls, and at least 1
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    return max(1, number_of_codes_per_chunk_of_scanned_rolls // max(1, number_of_dice))
+
 class Analyzer:
     '''
     Encapsulates structures of descriptive statistics for a game that has been played and methods to generate these structures of descriptive statistics
 
     Instance variables:
         _data_frame_of_rolls_and_face_counts: pd.DataFrame -- a data frame of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
+        _accumulator_of_scanned_rolls: Accumulator -- an accumulator of the rolls scanned from the matrix of codes of a game, or None if no rolls have been scanned
+        _version_of_scanned_rolls: int -- the version of the rolls of the game when they were scanned, so that only rolls appended since then are scanned
+        _array_of_indices_of_rolls_of_jackpots: np.ndarray -- a 1D numpy array of the indices of the scanned rolls where all dice have the same face, or None if no rolls have been scanned for jackpots
+        _array_of_codes_of_faces_of_jackpots: np.ndarray -- a 1D numpy array of the code of the face of each of those rolls
+        _version_and_number_of_rolls_of_jackpots: tuple -- the version of the rolls of the game and the number of rolls when they were scanned for jackpots, so that only rolls appended since then are scanned
+        _combination_index: CombinationIndex -- a combination index of the face combinations of the rolls of the game, or None if none has been generated
+        _accumulator_and_number_of_rolls_of_combination_index: tuple -- the accumulator from which the combination index was generated and its number of rolls then, so that the combination index is regenerated only after rolls change
 
     Public methods:
         __init__
         generate_data_frame_of_rolls_and_face_counts
         get_number_of_rolls_where_all_dice_have_the_same_face
+        find_rolls_where_all_dice_have_the_same_face
+        generate_combination_index
         generate_data_frame_of_face_combinations_and_counts
+        generate_data_frame_of_face_permutations_and_counts
         play
     '''
 
     def __init__(self, game):
         '''
-        Initializes an Analyzer object with a Game object, and
-        infers the data type of each face of each die in the Game object's list of dice
+        Initializes an Analyzer object with a Game object
         
         Keyword arguments:
             game: Game -- a Game object
@@ -41,48 +84,64 @@ class Analyzer:
         '''
 
         self._game = game
-        data_frame_of_rolls_and_dice = self._game.show('wide')
-        face = data_frame_of_rolls_and_dice.at[0, 0]
-        self._type_of_face = type(face)
         self._data_frame_of_face_combinations_and_counts_needs_to_be_generated = True
+        self._accumulator_of_scanned_rolls = None
+        self._version_of_scanned_rolls = None
+        self._array_of_indices_of_rolls_of_jackpots = None
+        self._array_of_codes_of_faces_of_jackpots = None
+        self._version_and_number_of_rolls_of_jackpots = None
+        self._combination_index = None
+        self._accumulator_and_number_of_rolls_of_combination_index = None
 
     def generate_data_frame_of_rolls_and_face_counts(self):
         '''
-        Generates a data frame of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
+        Generates a data frame of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face.
+        Counts the codes of each chunk of rolls with one offset bincount instead of counting the faces of each roll separately.
 
         Keyword arguments:
             none
 
         Return values:
-            a data frame of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
+            a data frame of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces of the game in the order of its array of faces, including faces that were never rolled, and each cell value is an unsigned integer count of the number of dice for one roll with a face
 
         Side effects:
             Stores a data frame of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
 
         Exceptions raised:
-            none
+            ValueError if the game stores only counts of its rolls without face counts, which do not keep the faces of each roll
 
         Restrictions are when this method can be called:
             none
         '''
 
-        data_frame_of_rolls_and_dice = self._game.show('wide')
-        self.data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).fillna(0).astype(dtype = self._type_of_face).rename_axis(columns = 'face')
+        array_of_faces = self._game.get_array_of_faces()
+        matrix_of_face_counts = self._game.get_matrix_of_face_counts()
+        if matrix_of_face_counts is None:
+            matrix_of_codes = self._game.get_matrix_of_codes()
+            number_of_rolls, number_of_dice = matrix_of_codes.shape
+            matrix_of_face_counts = np.empty((number_of_rolls, len(array_of_faces)), dtype = get_smallest_unsigned_integer_type(number_of_dice + 1))
+            # Counting chunk by chunk bounds the memory of the offset codes and reads a matrix of codes in a file once.
+            number_of_rolls_per_chunk = _get_number_of_rolls_per_chunk(number_of_dice)
+            for index_of_first_roll in range(0, number_of_rolls, number_of_rolls_per_chunk):
+                matrix_of_codes_of_chunk = np.asarray(matrix_of_codes[index_of_first_roll:index_of_first_roll + number_of_rolls_per_chunk])
+                matrix_of_face_counts[index_of_first_roll:index_of_first_roll + len(matrix_of_codes_of_chunk)] = count_codes_of_rows(matrix_of_codes_of_chunk, len(array_of_faces))
+        self.data_frame_of_rolls_and_face_counts = pd.DataFrame(matrix_of_face_counts, index = pd.RangeIndex(len(matrix_of_face_counts), name = 'roll_index'), columns = pd.Index(array_of_faces, name = 'face'), copy = False)
         return self.data_frame_of_rolls_and_face_counts
 
     def get_number_of_rolls_where_all_dice_have_the_same_face(self, data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same_should_be_created = True):
         '''
-        Gets the number of rolls where all dice for one roll have the same face
+        Gets the number of rolls where all dice for one roll have the same face.
+        Reads the jackpots of a game that stores counts from its accumulator and finds the jackpots of other games with one pass over their rolls, as for find_rolls_where_all_dice_have_the_same_face, instead of generating the data frame of face combinations and counts.
 
         Keyword arguments:
-            none
+            data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same_should_be_created: bool -- an indicator of whether a data frame of the face combinations where all faces are the same and their counts is created. Defaults to True.
 
         Return values:
             a number of rolls where all dice have the same face
 
         Side effects:
-            May call generate_data_frame_of_face_combinations_and_counts
-            Creates a data frame of face combinations and counts where combinations have all faces the same
+            Creates a data frame of face combinations and counts where combinations have all faces the same, in order of face combination
+            Scans the rolls of a game that does not store counts that have not been scanned for jackpots since the version of the rolls last changed
 
         Exceptions raised:
             none
@@ -91,33 +150,159 @@ class Analyzer:
             none
         '''
 
-        if self._data_frame_of_face_combinations_and_counts_needs_to_be_generated:
-            self.generate_data_frame_of_face_combinations_and_counts()
-            self._data_frame_of_face_combinations_and_counts_needs_to_be_generated = False
+        array_of_faces = self._game.get_array_of_faces()
+        accumulator = self._game.get_accumulator()
+        if accumulator is None:
+            array_of_numbers_of_jackpots_of_faces = np.bincount(self._find_jackpots()[1], minlength = len(array_of_faces))
+        elif data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same_should_be_created:
+            matrix_of_combinations, array_of_counts = accumulator.get_combinations_and_counts()
+            array_of_combinations_are_jackpots = matrix_of_combinations.min(axis = 1) == matrix_of_combinations.max(axis = 1)
+            array_of_numbers_of_jackpots_of_faces = np.zeros(len(array_of_faces), dtype = np.int64)
+            np.add.at(array_of_numbers_of_jackpots_of_faces, matrix_of_combinations[array_of_combinations_are_jackpots, 0].astype(np.intp), array_of_counts[array_of_combinations_are_jackpots])
+        else:
+            return accumulator.get_number_of_jackpots()
         if (data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same_should_be_created):
-            list_with_elements_face = ['face'] * len(self.data_frame_of_face_combinations_and_counts.index[0])
-            empty_multiIndex = pd.MultiIndex.from_tuples([], names = list_with_elements_face)
-            self.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same = pd.DataFrame(index = empty_multiIndex, columns = ['count'])
-        number_of_rolls_where_all_dice_have_the_same_face = 0
-        for face_combination, series_of_face_combination_and_count in self.data_frame_of_face_combinations_and_counts.iterrows():
-            if len(set(face_combination)) == 1:
-                number_of_rolls_where_all_dice_have_the_same_face += series_of_face_combination_and_count['count']
-                if (data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same_should_be_created):
-                    self.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.loc[face_combination, :] = series_of_face_combination_and_count['count']
-        return number_of_rolls_where_all_dice_have_the_same_face
+            array_of_faces_of_jackpots = array_of_faces[array_of_numbers_of_jackpots_of_faces > 0]
+            number_of_dice = self._game.get_number_of_dice()
+            multiIndex = pd.MultiIndex.from_arrays([array_of_faces_of_jackpots] * number_of_dice, names = ['face'] * number_of_dice)
+            self.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same = pd.DataFrame({'count': array_of_numbers_of_jackpots_of_faces[array_of_numbers_of_jackpots_of_faces > 0].astype(np.int64)}, index = multiIndex).sort_index()
+        return int(array_of_numbers_of_jackpots_of_faces.sum())
+
+    def find_rolls_where_all_dice_have_the_same_face(self):
+        '''
+        Finds the rolls where all dice for one roll have the same face, with one pass over the rolls of the game chunk by chunk.
+        A roll of codes is a jackpot where the code of every die equals that of the first die, a roll of face counts where one face was rolled by all dice, and a roll of bits where its number of bits is zero or the number of dice.
+
+        Keyword arguments:
+            none
+
+        Return values:
+            number_of_rolls_where_all_dice_have_the_same_face: int -- the number of rolls where all dice have the same face
+            data_frame_of_rolls_where_all_dice_have_the_same_face: pd.DataFrame -- a data frame with the index roll_index of the rolls where all dice have the same face, in order, and the column face of the face of each of those rolls
+
+        Side effects:
+            Stores the data frame of rolls where all dice have the same face
+            Scans the rolls that have not been scanned for jackpots since the version of the rolls last changed
+
+        Exceptions raised:
+            ValueError if the game stores only counts of its rolls without face counts, which do not keep the faces of each roll
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_indices_of_rolls, array_of_codes_of_faces = self._find_jackpots()
+        self.data_frame_of_rolls_where_all_dice_have_the_same_face = pd.DataFrame({'face': self._game.get_array_of_faces()[array_of_codes_of_faces]}, index = pd.Index(array_of_indices_of_rolls, name = 'roll_index'))
+        return len(array_of_indices_of_rolls), self.data_frame_of_rolls_where_all_dice_have_the_same_face
+
+    def _find_jackpots(self):
+        '''
+        Finds the indices of the rolls of this analyzer's game where all dice have the same face and the codes of those faces, scanning only rolls that have not been scanned
+
+        Keyword arguments:
+            none
+
+        Return values:
+            array_of_indices_of_rolls_of_jackpots: np.ndarray -- a 1D numpy array of the indices of the rolls where all dice have the same face, in order
+            array_of_codes_of_faces_of_jackpots: np.ndarray -- a 1D numpy array with data type np.intp of the code of the face of each of those rolls
+
+        Side effects:
+            Reads the bits, face counts, or codes of the rolls that have not been scanned for jackpots since the version of the rolls last changed, and keeps the jackpots found
+
+        Exceptions raised:
+            ValueError if the game stores only counts of its rolls without face counts
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        number_of_rolls = self._game.get_number_of_rolls()
+        number_of_dice = self._game.get_number_of_dice()
+        if self._array_of_indices_of_rolls_of_jackpots is None or self._version_and_number_of_rolls_of_jackpots[0] != self._game.get_version():
+            self._array_of_indices_of_rolls_of_jackpots = np.empty(0, dtype = np.intp)
+            self._array_of_codes_of_faces_of_jackpots = np.empty(0, dtype = np.intp)
+            self._version_and_number_of_rolls_of_jackpots = (self._game.get_version(), 0)
+        index_of_first_unscanned_roll = self._version_and_number_of_rolls_of_jackpots[1]
+        if index_of_first_unscanned_roll == number_of_rolls:
+            return self._array_of_indices_of_rolls_of_jackpots, self._array_of_codes_of_faces_of_jackpots
+        matrix_of_packed_codes = self._game.get_matrix_of_packed_codes()
+        matrix_of_face_counts = self._game.get_matrix_of_face_counts() if matrix_of_packed_codes is None else None
+        matrix_of_codes = self._game.get_matrix_of_codes() if matrix_of_packed_codes is None and matrix_of_face_counts is None else None
+        list_of_arrays_of_indices_of_rolls = [self._array_of_indices_of_rolls_of_jackpots]
+        list_of_arrays_of_codes_of_faces = [self._array_of_codes_of_faces_of_jackpots]
+        number_of_rolls_per_chunk = _get_number_of_rolls_per_chunk(number_of_dice)
+        for index_of_first_roll in range(index_of_first_unscanned_roll, number_of_rolls, number_of_rolls_per_chunk):
+            slice_of_rolls = slice(index_of_first_roll, min(index_of_first_roll + number_of_rolls_per_chunk, number_of_rolls))
+            if matrix_of_packed_codes is not None:
+                array_of_numbers_of_second_faces = count_bits_of_rows(matrix_of_packed_codes[slice_of_rolls])
+                array_of_rolls_are_jackpots = (array_of_numbers_of_second_faces == 0) | (array_of_numbers_of_second_faces == number_of_dice)
+                array_of_codes_of_faces = (array_of_numbers_of_second_faces == number_of_dice).astype(np.intp)
+            elif matrix_of_face_counts is not None:
+                matrix_of_face_counts_of_chunk = matrix_of_face_counts[slice_of_rolls]
+                array_of_rolls_are_jackpots = matrix_of_face_counts_of_chunk.max(axis = 1) == number_of_dice
+                array_of_codes_of_faces = matrix_of_face_counts_of_chunk.argmax(axis = 1)
+            else:
+                # Comparing each column with the first is several times faster than reducing a few codes per row with min and max.
+                matrix_of_codes_of_chunk = np.asarray(matrix_of_codes[slice_of_rolls])
+                array_of_rolls_are_jackpots = np.ones(len(matrix_of_codes_of_chunk), dtype = bool)
+                for index_of_die in range(1, number_of_dice):
+                    array_of_rolls_are_jackpots &= matrix_of_codes_of_chunk[:, index_of_die] == matrix_of_codes_of_chunk[:, 0]
+                array_of_codes_of_faces = matrix_of_codes_of_chunk[:, 0].astype(np.intp)
+            array_of_indices_of_rolls_in_chunk = np.flatnonzero(array_of_rolls_are_jackpots)
+            list_of_arrays_of_indices_of_rolls.append(array_of_indices_of_rolls_in_chunk + index_of_first_roll)
+            list_of_arrays_of_codes_of_faces.append(array_of_codes_of_faces[array_of_indices_of_rolls_in_chunk])
+        self._array_of_indices_of_rolls_of_jackpots = np.concatenate(list_of_arrays_of_indices_of_rolls)
+        self._array_of_codes_of_faces_of_jackpots = np.concatenate(list_of_arrays_of_codes_of_faces)
+        self._version_and_number_of_rolls_of_jackpots = (self._game.get_version(), number_of_rolls)
+        return self._array_of_indices_of_rolls_of_jackpots, self._array_of_codes_of_faces_of_jackpots
+
+    def generate_combination_index(self):
+        '''
+        Generates a combination index of the face combinations of the rolls of this analyzer's game, which ranks each face combination into an integer in [0, C(F + D - 1, D)) for F faces and D dice and counts face combinations by rank.
+        Looks up how many times a face combination was rolled in constant time while there are few enough face combinations for dense counts, and can merge the combination indices of many games with the same faces and number of dice.
+
+        Keyword arguments:
+            none
+
+        Return values:
+            combination_index: CombinationIndex -- a combination index of the face combinations of the rolls of this analyzer's game
+
+        Side effects:
+            Stores the combination index, which is regenerated only after the rolls of the game change
+            Accumulates the rolls of a game that stores codes that have not been accumulated since the version of the rolls last changed
+
+        Exceptions raised:
+            ValueError, if there are more than 2 ** 64 face combinations
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        accumulator = self._get_accumulator()
+        accumulator_and_number_of_rolls = (accumulator, accumulator.get_number_of_rolls())
+        if self._combination_index is None or self._accumulator_and_number_of_rolls_of_combination_index[0] is not accumulator or self._accumulator_and_number_of_rolls_of_combination_index[1] != accumulator_and_number_of_rolls[1]:
+            matrix_of_combinations, array_of_counts = accumulator.get_combinations_and_counts()
+            self._combination_index = CombinationIndex(len(self._game.get_array_of_faces()), matrix_of_combinations.shape[1])
+            self._combination_index.add(matrix_of_combinations, array_of_counts)
+            self._accumulator_and_number_of_rolls_of_combination_index = accumulator_and_number_of_rolls
+        return self._combination_index
 
     def generate_data_frame_of_face_combinations_and_counts(self):
         '''
-        Generates a data frame of face combinations and counts of how many times each face combination was rolled
+        Generates a data frame of face combinations and counts of how many times each face combination was rolled.
+        Sorts the codes of each roll, packs each sorted row into one key, and counts the distinct keys with np.unique, chunk by chunk, instead of looking up each roll in the face combinations found so far.
+        Unranks the face combinations of the combination index of this analyzer when their ranks fit in unsigned 64-bit integers.
 
         Keyword arguments:
             none
 
         Return values:
-            a data frame of face combinations and counts of how many times each face combination was rolled
+            a data frame of face combinations and counts of how many times each face combination was rolled, in order of face combination
 
         Side effects:
             Stores a data frame of face combinations and counts of how many times each face combination was rolled
+            Stores a combination index of the face combinations of the rolls, as for generate_combination_index
+            Accumulates the rolls of a game that stores codes that have not been accumulated since the version of the rolls last changed
 
         Exceptions raised:
             none
@@ -126,34 +311,94 @@ class Analyzer:
             none
         '''
 
-        data_frame_of_rolls_and_dice = self._game.show('wide')
-        number_of_faces = data_frame_of_rolls_and_dice.shape[1]
-        list_with_elements_face = ['face'] * number_of_faces
-        empty_multiIndex = pd.MultiIndex.from_tuples([], names = list_with_elements_face)
-        self.data_frame_of_face_combinations_and_counts = pd.DataFrame(index = empty_multiIndex, columns = ['count'])
-        for roll_index, series_of_faces in data_frame_of_rolls_and_dice.iterrows():
-            list_of_faces = series_of_faces.to_list()
-            list_of_sorted_faces = sorted(list_of_faces)
-            face_combination = tuple(list_of_sorted_faces)
-            if self.data_frame_of_face_combinations_and_counts.index.isin([face_combination]).any():
-                self.data_frame_of_face_combinations_and_counts.at[face_combination, 'count'] += 1
-            else:
-                self.data_frame_of_face_combinations_and_counts.at[face_combination, 'count'] = 1
+        try:
+            matrix_of_combinations, array_of_counts = self.generate_combination_index().get_combinations_and_counts()
+        except ValueError:
+            matrix_of_combinations, array_of_counts = self._get_accumulator().get_combinations_and_counts()
+        matrix_of_face_combinations = np.sort(self._game.get_array_of_faces()[matrix_of_combinations], axis = 1)
+        multiIndex = pd.MultiIndex.from_arrays(list(matrix_of_face_combinations.T), names = ['face'] * matrix_of_face_combinations.shape[1])
+        self.data_frame_of_face_combinations_and_counts = pd.DataFrame({'count': array_of_counts}, index = multiIndex).sort_index()
         self._data_frame_of_face_combinations_and_counts_needs_to_be_generated = False
         return self.data_frame_of_face_combinations_and_counts
 
-    def play(self, number_of_rolls):
+    def generate_data_frame_of_face_permutations_and_counts(self):
         '''
-        Plays this analyzer's game and indicates that this analyzer's data frame of face combinations and counts needs to be generated
+        Generates a data frame of face permutations, which are the faces of the dice of a roll in the order of the dice, and counts of how many times each face permutation was rolled.
+        Packs the unsorted codes of each roll into one key, in the smallest unsigned integer data type that holds every permutation or as the bytes of the codes when permutations do not fit in 64 bits, and counts the distinct keys of each chunk of rolls with np.unique, merging the counts of chunks only when the keys awaiting a merge outnumber the keys merged so far.
+        Codes are first replaced by the positions of their faces among the sorted faces, so that the sorted keys are in order of face permutation and the index is built from them without factorizing or sorting faces.
 
         Keyword arguments:
             none
 
         Return values:
+            a data frame of face permutations and counts of how many times each face permutation was rolled, with one level of the index for each die, in order of face permutation
+
+        Side effects:
+            Stores a data frame of face permutations and counts of how many times each face permutation was rolled
+
+        Exceptions raised:
+            ValueError if the game stores only counts of its rolls or face counts, which do not keep the order of the faces of each roll
+
+        Restrictions on when this method can be called:
             none
+        '''
+
+        array_of_faces = self._game.get_array_of_faces()
+        number_of_faces = len(array_of_faces)
+        number_of_dice = self._game.get_number_of_dice()
+        matrix_of_packed_codes = self._game.get_matrix_of_packed_codes()
+        matrix_of_codes = self._game.get_matrix_of_codes() if matrix_of_packed_codes is None else None
+        type_of_code = np.dtype(np.uint8) if matrix_of_packed_codes is not None else matrix_of_codes.dtype
+        type_of_key = get_type_of_keys_of_rows(number_of_faces, number_of_dice, type_of_code)
+        array_of_codes_of_sorted_faces = np.argsort(array_of_faces, kind = 'stable')
+        array_of_positions_of_codes = np.empty(number_of_faces, dtype = type_of_code)
+        array_of_positions_of_codes[array_of_codes_of_sorted_faces] = np.arange(number_of_faces)
+        faces_are_sorted = bool(np.all(array_of_codes_of_sorted_faces == np.arange(number_of_faces)))
+        array_of_keys = np.empty(0, dtype = type_of_key)
+        array_of_counts = np.empty(0, dtype = np.int64)
+        list_of_arrays_of_keys_awaiting_merge = []
+        list_of_arrays_of_counts_awaiting_merge = []
+        number_of_keys_awaiting_merge = 0
+        number_of_rolls = self._game.get_number_of_rolls()
+        number_of_rolls_per_chunk = _get_number_of_rolls_per_chunk(number_of_dice)
+        for index_of_first_roll in range(0, number_of_rolls, number_of_rolls_per_chunk):
+            slice_of_rolls = slice(index_of_first_roll, min(index_of_first_roll + number_of_rolls_per_chunk, number_of_rolls))
+            if matrix_of_packed_codes is not None:
+                matrix_of_codes_of_chunk = np.unpackbits(matrix_of_packed_codes[slice_of_rolls], axis = 1, count = number_of_dice)
+            else:
+                matrix_of_codes_of_chunk = np.asarray(matrix_of_codes[slice_of_rolls])
+            if not faces_are_sorted:
+                matrix_of_codes_of_chunk = array_of_positions_of_codes[matrix_of_codes_of_chunk]
+            array_of_keys_of_chunk, array_of_counts_of_chunk = np.unique(generate_keys_of_rows(matrix_of_codes_of_chunk, number_of_faces, type_of_key), return_counts = True)
+            list_of_arrays_of_keys_awaiting_merge.append(array_of_keys_of_chunk)
+            list_of_arrays_of_counts_awaiting_merge.append(array_of_counts_of_chunk)
+            number_of_keys_awaiting_merge += len(array_of_keys_of_chunk)
+            # Merging only when the keys awaiting a merge outnumber the merged keys sorts each key a bounded number of times, however many chunks there are.
+            if number_of_keys_awaiting_merge > max(len(array_of_keys), 4194304) or slice_of_rolls.stop == number_of_rolls:
+                array_of_keys, array_of_inverse_indices = np.unique(np.concatenate([array_of_keys] + list_of_arrays_of_keys_awaiting_merge), return_inverse = True)
+                array_of_merged_counts = np.zeros(len(array_of_keys), dtype = np.int64)
+                np.add.at(array_of_merged_counts, array_of_inverse_indices.ravel(), np.concatenate([array_of_counts] + list_of_arrays_of_counts_awaiting_merge))
+                array_of_counts = array_of_merged_counts
+                list_of_arrays_of_keys_awaiting_merge = []
+                list_of_arrays_of_counts_awaiting_merge = []
+                number_of_keys_awaiting_merge = 0
+        matrix_of_positions_of_faces = decode_keys_of_rows(array_of_keys, number_of_faces, number_of_dice, type_of_code)
+        multiIndex = pd.MultiIndex(levels = [array_of_faces[array_of_codes_of_sorted_faces]] * number_of_dice, codes = list(matrix_of_positions_of_faces.T), names = ['face'] * number_of_dice, verify_integrity = False)
+        self.data_frame_of_face_permutations_and_counts = pd.DataFrame({'count': array_of_counts}, index = multiIndex)
+        return self.data_frame_of_face_permutations_and_counts
+
+    def _get_accumulator(self):
+        '''
+        Gets an accumulator of the rolls of this analyzer's game, scanning the matrix of codes of a game that stores codes chunk by chunk, so that the matrix of codes of a game in a file need not fit in memory
+
+        Keyword arguments:
+            none
+
+        Return values:
+            accumulator: Accumulator -- the accumulator of the game, or an accumulator of the codes of a game that stores codes in memory or in a file
 
         Side effects:
-            Plays this analyzer's game and indicates that this analyzer's data frame of face combinations and counts needs to be generated
+            Reads the rolls of the matrix of codes of a game that stores codes that have not been scanned since the version of the rolls last changed, and keeps their accumulator
 
         Exceptions raised:
             none
@@ -162,5 +407,41 @@ class Analyzer:
             none
         '''
 
-        self._game.play(number_of_rolls)
+        accumulator = self._game.get_accumulator()
+        if accumulator is not None:
+            return accumulator
+        matrix_of_codes = self._game.get_matrix_of_codes()
+        if self._accumulator_of_scanned_rolls is None or self._version_of_scanned_rolls != self._game.get_version():
+            self._accumulator_of_scanned_rolls = Accumulator(len(self._game.get_array_of_faces()), matrix_of_codes.shape[1], matrix_of_codes.dtype)
+            self._version_of_scanned_rolls = self._game.get_version()
+        number_of_rolls_per_chunk = _get_number_of_rolls_per_chunk(matrix_of_codes.shape[1])
+        for index_of_first_roll in range(self._accumulator_of_scanned_rolls.get_number_of_rolls(), len(matrix_of_codes), number_of_rolls_per_chunk):
+            self._accumulator_of_scanned_rolls.add(np.asarray(matrix_of_codes[index_of_first_roll:index_of_first_roll + number_of_rolls_per_chunk]))
+        return self._accumulator_of_scanned_rolls
+
+    def play(self, number_of_rolls, seed = None, append = False, chunk_size = None, store = None):
+        '''
+        Plays this analyzer's game and indicates that this analyzer's data frame of face combinations and counts needs to be generated
+
+        Keyword arguments:
+            number_of_rolls: int -- An integer
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed accepted by Game.play. Defaults to None.
+            append: bool -- an indicator of whether the rolls are appended to the rolls of the game, as for Game.play, so that only they are rolled and, for a game in a file, scanned. Defaults to False.
+            chunk_size: int -- a chunk size accepted by Game.play. Defaults to None, for the chunk size of the last play of the game when appending and the default of Game.play otherwise.
+            store: str -- a store accepted by Game.play. Defaults to None, for the store of the last play of the game when appending and the default of Game.play otherwise.
+
+        Return values:
+            none
+
+        Side effects:
+            Plays this analyzer's game and indicates that this analyzer's data frame of face combinations and counts needs to be generated
+
+        Exceptions raised:
+            ValueError, for the reasons that Game.play raises ValueError
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        self._game.play(number_of_rolls, seed = seed, chunk_size = chunk_size, store = store, append = append)
         self._data_frame_of_face_combinations_and_counts_needs_to_be_generated = True
\ No newline at end of file
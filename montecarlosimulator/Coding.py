@@ -0,0 +1,175 @@
+'''
+Module for functions that encode faces as unsigned integer codes, where the code of a face is the index of the face in an array of faces
+'''
+
+import numpy as np
+
+# The number of bits set in each of the 256 values of a byte, for versions of numpy without np.bitwise_count.
+array_of_numbers_of_bits_of_bytes = np.unpackbits(np.arange(256, dtype = np.uint8)[:, np.newaxis], axis = 1).sum(axis = 1, dtype = np.uint8)
+
+def get_smallest_unsigned_integer_type(number_of_codes):
+    '''
+    Gets the smallest unsigned integer type that can represent every code in [0, number_of_codes)
+
+    Keyword arguments:
+        number_of_codes: int -- a nonnegative integer
+
+    Return values:
+        type_of_code: type -- np.uint8, np.uint16, np.uint32, or np.uint64
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    for type_of_code in (np.uint8, np.uint16, np.uint32):
+        if number_of_codes <= np.iinfo(type_of_code).max + 1:
+            return type_of_code
+    return np.uint64
+
+def count_codes_of_rows(matrix_of_codes, number_of_codes):
+    '''
+    Counts how many times each code appears in each row of a matrix of codes with one count of all codes, offsetting the codes of each row by the number of codes times the index of the row
+
+    Keyword arguments:
+        matrix_of_codes: np.ndarray -- a 2D numpy array of unsigned integer codes in [0, number_of_codes)
+        number_of_codes: int -- the number of distinct codes
+
+    Return values:
+        matrix_of_counts: np.ndarray -- a 2D numpy array of counts with data type np.int64, where the number of rows is that of the matrix of codes, the number of columns is the number of codes, and the count at a column is the number of times the code equal to the index of the column appears in the row
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    number_of_rows = len(matrix_of_codes)
+    array_of_offsets = np.arange(0, number_of_rows * number_of_codes, number_of_codes, dtype = np.intp)
+    array_of_offset_codes = (matrix_of_codes + array_of_offsets[:, np.newaxis]).ravel()
+    return np.bincount(array_of_offset_codes, minlength = number_of_rows * number_of_codes).reshape(number_of_rows, number_of_codes)
+
+def count_bits_of_rows(matrix_of_packed_codes):
+    '''
+    Counts the bits that are set in each row of a matrix of codes of two faces packed into bytes by np.packbits, where a set bit is the code 1
+
+    Keyword arguments:
+        matrix_of_packed_codes: np.ndarray -- a 2D numpy array with data type np.uint8, where each row holds the codes of one roll packed eight to a byte and padded with zero bits
+
+    Return values:
+        array_of_numbers_of_bits: np.ndarray -- a 1D numpy array with data type np.int64 of the number of bits set in each row
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    # np.bitwise_count counts the bits of each byte with one population count instruction, and is available from numpy 2.0.
+    if hasattr(np, 'bitwise_count'):
+        matrix_of_numbers_of_bits = np.bitwise_count(matrix_of_packed_codes)
+    else:
+        matrix_of_numbers_of_bits = array_of_numbers_of_bits_of_bytes[matrix_of_packed_codes]
+    return matrix_of_numbers_of_bits.sum(axis = 1, dtype = np.int64)
+
+def get_type_of_keys_of_rows(number_of_codes, number_of_columns, type_of_code):
+    '''
+    Gets the data type of keys that identify rows of codes, which is the smallest unsigned integer data type that can hold every row packed as a number in base number_of_codes, or a void data type viewing the bytes of a row if packed rows do not fit in unsigned 64-bit integers
+
+    Keyword arguments:
+        number_of_codes: int -- the number of distinct codes
+        number_of_columns: int -- the number of codes in a row
+        type_of_code: type -- the unsigned integer data type of the codes
+
+    Return values:
+        type_of_key: np.dtype -- np.uint8, np.uint16, np.uint32, or np.uint64, or a void data type as long as a row of codes
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    # The type must also hold the number of codes itself, which is the multiplier of each column.
+    if number_of_codes ** number_of_columns <= 2 ** 64:
+        return np.dtype(get_smallest_unsigned_integer_type(max(number_of_codes ** number_of_columns, number_of_codes + 1)))
+    return np.dtype((np.void, number_of_columns * np.dtype(type_of_code).itemsize))
+
+def generate_keys_of_rows(matrix_of_codes, number_of_codes, type_of_key):
+    '''
+    Generates one key for each row of a matrix of codes, so that rows with the same codes in the same order, and only they, have equal keys, and sorted keys are in lexicographic order of rows
+
+    Keyword arguments:
+        matrix_of_codes: np.ndarray -- a 2D numpy array of unsigned integer codes in [0, number_of_codes)
+        number_of_codes: int -- the number of distinct codes
+        type_of_key: np.dtype -- a data type provided by get_type_of_keys_of_rows for the number of codes, number of columns, and data type of the matrix
+
+    Return values:
+        array_of_keys: np.ndarray -- a 1D numpy array with the data type of keys of the key of each row
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    # Big-endian codes make the bytes of rows compare in the same order as the rows.
+    if type_of_key.kind == 'V':
+        return np.ascontiguousarray(matrix_of_codes, dtype = matrix_of_codes.dtype.newbyteorder('>')).view(type_of_key).ravel()
+    array_of_keys = np.zeros(len(matrix_of_codes), dtype = type_of_key)
+    for index_of_column in range(0, matrix_of_codes.shape[1]):
+        array_of_keys *= type_of_key.type(number_of_codes)
+        array_of_keys += matrix_of_codes[:, index_of_column]
+    return array_of_keys
+
+def decode_keys_of_rows(array_of_keys, number_of_codes, number_of_columns, type_of_code):
+    '''
+    Decodes keys generated by generate_keys_of_rows into the rows of codes they identify
+
+    Keyword arguments:
+        array_of_keys: np.ndarray -- a 1D numpy array of keys
+        number_of_codes: int -- the number of distinct codes
+        number_of_columns: int -- the number of codes in a row
+        type_of_code: type -- the unsigned integer data type of the codes
+
+    Return values:
+        matrix_of_codes: np.ndarray -- a 2D numpy array of codes, where each row is the row of the key at the same index
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    if array_of_keys.dtype.kind == 'V':
+        return np.ascontiguousarray(array_of_keys).view(np.dtype(type_of_code).newbyteorder('>')).reshape(-1, number_of_columns).astype(type_of_code)
+    matrix_of_codes = np.empty((len(array_of_keys), number_of_columns), dtype = type_of_code)
+    array_of_remaining_keys = array_of_keys.copy()
+    for index_of_column in range(number_of_columns - 1, -1, -1):
+        array_of_remaining_keys, matrix_of_codes[:, index_of_column] = np.divmod(array_of_remaining_keys, array_of_keys.dtype.type(number_of_codes))
+    return matrix_of_codes
@@ -0,0 +1,424 @@
+'''
+Module for class CombinationIndex, which ranks face combinations into consecutive integers with the combinatorial number system and counts them by rank
+'''
+
+from montecarlosimulator.Coding import get_smallest_unsigned_integer_type
+import math
+import numpy as np
+
+# Counts of face combinations are kept in a dense array indexed by rank when there are at most this many combinations, which takes at most 8 MiB, and as sorted arrays of ranks and counts otherwise.
+maximum_number_of_combinations_with_dense_counts = 2 ** 20
+
+def get_number_of_combinations(number_of_faces, number_of_dice):
+    '''
+    Gets the number of face combinations of a number of dice with a number of faces, which are the multisets of that many faces
+
+    Keyword arguments:
+        number_of_faces: int -- a positive integer
+        number_of_dice: int -- a positive integer
+
+    Return values:
+        number_of_combinations: int -- the binomial coefficient of the number of faces plus the number of dice minus one choose the number of dice
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    return math.comb(number_of_faces + number_of_dice - 1, number_of_dice)
+
+class CombinationIndex:
+    '''
+    Ranks face combinations into consecutive integers and counts them by rank.
+    A face combination is the sorted codes c_0 <= c_1 <= ... <= c_(D-1) of the faces of a roll of D dice. Adding the position of each code gives a strictly increasing sequence c_i + i, which the combinatorial number system ranks as the sum of the binomial coefficients C(c_i + i, i + 1).
+    Ranking is therefore a bijection from the face combinations of F faces and D dice onto [0, C(F + D - 1, D)), computed for a whole matrix of rolls with one table lookup per die, and counting by rank answers how often a combination occurred in constant time.
+
+    Instance variables:
+        _number_of_faces: int -- the number of faces that codes index
+        _number_of_dice: int -- the number of dice in a roll
+        _number_of_combinations: int -- the number of face combinations, which is the number of ranks
+        _type_of_code: type -- the smallest unsigned integer data type that can index all faces, with which unranked codes are provided
+        _matrix_of_binomial_coefficients: np.ndarray -- a 2D numpy array with data type np.uint64, where the element at row s and column i is C(s, i + 1) for the rows s <= F - 1 + i that ranking reads, and the largest unsigned 64-bit integer at the rows after them
+        _matrix_of_prefix_sums_of_runs: np.ndarray -- a 2D numpy array with data type np.uint64, where the element at row f and column j is the sum of C(f + i, i + 1) over the positions i < j, so that a run of one face over a range of positions of a sorted roll contributes a difference of two elements to its rank
+        _array_of_counts: np.ndarray -- a 1D numpy array of the count of each rank, or None if counts are sparse
+        _array_of_ranks: np.ndarray -- a sorted 1D numpy array of the distinct ranks counted, or None if counts are dense
+        _array_of_counts_of_ranks: np.ndarray -- a 1D numpy array of the count of each distinct rank counted, or None if counts are dense
+
+    Public methods:
+        __init__
+        get_number_of_combinations
+        rank
+        rank_face_counts
+        unrank
+        add
+        add_face_counts
+        merge
+        get_count
+        get_counts
+        get_ranks_and_counts
+        get_combinations_and_counts
+    '''
+
+    def __init__(self, number_of_faces, number_of_dice):
+        '''
+        Initializes a CombinationIndex object without any counts
+
+        Keyword arguments:
+            number_of_faces: int -- the number of faces that codes index
+            number_of_dice: int -- the number of dice in a roll
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this CombinationIndex object's tables of binomial coefficients and its empty counts, which are dense if there are at most maximum_number_of_combinations_with_dense_counts combinations
+
+        Exceptions raised:
+            ValueError, if the number of faces or dice is not positive, or if there are more than 2 ** 64 face combinations, whose ranks would not fit in unsigned 64-bit integers
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        if number_of_faces <= 0 or number_of_dice <= 0:
+            raise ValueError('the numbers of faces and dice must be positive')
+        self._number_of_combinations = get_number_of_combinations(number_of_faces, number_of_dice)
+        if self._number_of_combinations > 2 ** 64:
+            raise ValueError('the ranks of the face combinations of ' + str(number_of_faces) + ' faces and ' + str(number_of_dice) + ' dice do not fit in unsigned 64-bit integers')
+        self._number_of_faces = number_of_faces
+        self._number_of_dice = number_of_dice
+        self._type_of_code = get_smallest_unsigned_integer_type(number_of_faces)
+        # Ranking reads column i only at rows s = c_i + i <= F - 1 + i, where C(s, i + 1) is at most the number of combinations and fits. Other coefficients, such as C(68, 34) for 2 faces and 70 dice, may not fit, so they are capped at the largest unsigned 64-bit integer, which keeps every column nondecreasing for searchsorted.
+        self._matrix_of_binomial_coefficients = np.full((number_of_faces + number_of_dice - 1, number_of_dice), np.iinfo(np.uint64).max, dtype = np.uint64)
+        for position in range(number_of_dice):
+            self._matrix_of_binomial_coefficients[:number_of_faces + position, position] = [math.comb(s, position + 1) for s in range(number_of_faces + position)]
+        self._matrix_of_prefix_sums_of_runs = np.zeros((number_of_faces, number_of_dice + 1), dtype = np.uint64)
+        array_of_positions = np.arange(number_of_dice)
+        for face in range(number_of_faces):
+            self._matrix_of_prefix_sums_of_runs[face, 1:] = np.cumsum(self._matrix_of_binomial_coefficients[face + array_of_positions, array_of_positions], dtype = np.uint64)
+        if self._number_of_combinations <= maximum_number_of_combinations_with_dense_counts:
+            self._array_of_counts = np.zeros(self._number_of_combinations, dtype = np.int64)
+            self._array_of_ranks = None
+            self._array_of_counts_of_ranks = None
+        else:
+            self._array_of_counts = None
+            self._array_of_ranks = np.empty(0, dtype = np.uint64)
+            self._array_of_counts_of_ranks = np.empty(0, dtype = np.int64)
+
+    def get_number_of_combinations(self):
+        '''
+        Gets the number of face combinations of this CombinationIndex object, which is one more than its largest rank
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _number_of_combinations: int -- the number of face combinations
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._number_of_combinations
+
+    def rank(self, matrix_of_codes):
+        '''
+        Ranks the face combinations of rolls
+
+        Keyword arguments:
+            matrix_of_codes: np.ndarray -- a 2D numpy array of codes of rolled faces, where the number of rows is the number of rolls and the number of columns is the number of dice, in any order within a roll
+
+        Return values:
+            array_of_ranks: np.ndarray -- a 1D numpy array with data type np.uint64 of the rank of the face combination of each roll
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            May be called only with codes less than the number of faces
+        '''
+
+        matrix_of_sorted_codes = np.sort(matrix_of_codes, axis = 1).astype(np.intp)
+        array_of_positions = np.arange(self._number_of_dice)
+        return self._matrix_of_binomial_coefficients[matrix_of_sorted_codes + array_of_positions, array_of_positions].sum(axis = 1, dtype = np.uint64)
+
+    def rank_face_counts(self, matrix_of_face_counts):
+        '''
+        Ranks the face combinations of rolls described by how many dice rolled each face, without expanding any roll into codes
+
+        Keyword arguments:
+            matrix_of_face_counts: np.ndarray -- a 2D numpy array of nonnegative integer counts, where the number of rows is the number of rolls, the number of columns is the number of faces, and each row sums to the number of dice
+
+        Return values:
+            array_of_ranks: np.ndarray -- a 1D numpy array with data type np.uint64 of the rank of the face combination of each roll
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        # The sorted codes of a roll hold each face in one run of positions, which contributes the difference of the prefix sums at the ends of the run.
+        matrix_of_face_counts = np.asarray(matrix_of_face_counts, dtype = np.intp)
+        matrix_of_ends_of_runs = np.cumsum(matrix_of_face_counts, axis = 1)
+        matrix_of_starts_of_runs = matrix_of_ends_of_runs - matrix_of_face_counts
+        array_of_faces = np.arange(self._number_of_faces)
+        matrix_of_contributions = self._matrix_of_prefix_sums_of_runs[array_of_faces, matrix_of_ends_of_runs] - self._matrix_of_prefix_sums_of_runs[array_of_faces, matrix_of_starts_of_runs]
+        return matrix_of_contributions.sum(axis = 1, dtype = np.uint64)
+
+    def unrank(self, array_of_ranks):
+        '''
+        Unranks ranks into the face combinations they rank, finding the code at each position from the last with one binary search per position for all ranks at once
+
+        Keyword arguments:
+            array_of_ranks: np.ndarray -- a 1D numpy array of ranks less than the number of combinations
+
+        Return values:
+            matrix_of_sorted_codes: np.ndarray -- a 2D numpy array with the smallest unsigned integer data type that can index all faces, where each row is the sorted codes of the face combination of a rank
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_remainders = np.array(array_of_ranks, dtype = np.uint64)
+        matrix_of_sorted_codes = np.empty((len(array_of_remainders), self._number_of_dice), dtype = self._type_of_code)
+        for position in range(self._number_of_dice - 1, -1, -1):
+            # The element at position i of the increasing sequence is the largest s with C(s, i + 1) not greater than the remainder.
+            array_of_elements = np.searchsorted(self._matrix_of_binomial_coefficients[:, position], array_of_remainders, side = 'right') - 1
+            array_of_remainders = array_of_remainders - self._matrix_of_binomial_coefficients[array_of_elements, position]
+            matrix_of_sorted_codes[:, position] = array_of_elements - position
+        return matrix_of_sorted_codes
+
+    def add(self, matrix_of_codes, array_of_counts = None):
+        '''
+        Counts the face combinations of rolls
+
+        Keyword arguments:
+            matrix_of_codes: np.ndarray -- a 2D numpy array of codes of rolled faces, as for rank
+            array_of_counts: np.ndarray -- a 1D numpy array of the number of times each row was rolled. Defaults to None, for once each.
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the rolls to the counts of this CombinationIndex object
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        self._add_ranks(self.rank(matrix_of_codes), array_of_counts)
+
+    def add_face_counts(self, matrix_of_face_counts, array_of_counts = None):
+        '''
+        Counts the face combinations of rolls described by how many dice rolled each face
+
+        Keyword arguments:
+            matrix_of_face_counts: np.ndarray -- a 2D numpy array of face counts, as for rank_face_counts
+            array_of_counts: np.ndarray -- a 1D numpy array of the number of times each row was rolled. Defaults to None, for once each.
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the rolls to the counts of this CombinationIndex object
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        self._add_ranks(self.rank_face_counts(matrix_of_face_counts), array_of_counts)
+
+    def merge(self, combination_index):
+        '''
+        Counts the face combinations counted by another CombinationIndex object, such as one of another game
+
+        Keyword arguments:
+            combination_index: CombinationIndex -- a CombinationIndex object with the same number of faces and number of dice
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the counts of the other CombinationIndex object to those of this CombinationIndex object
+
+        Exceptions raised:
+            ValueError, if the other CombinationIndex object has another number of faces or dice
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if (combination_index._number_of_faces, combination_index._number_of_dice) != (self._number_of_faces, self._number_of_dice):
+            raise ValueError('only a combination index with the same numbers of faces and dice may be merged')
+        if self._array_of_counts is not None:
+            self._array_of_counts += combination_index._array_of_counts
+        else:
+            self._add_ranks(combination_index._array_of_ranks, combination_index._array_of_counts_of_ranks)
+
+    def _add_ranks(self, array_of_ranks, array_of_counts):
+        '''
+        Adds counts to ranks
+
+        Keyword arguments:
+            array_of_ranks: np.ndarray -- a 1D numpy array of ranks, which may repeat
+            array_of_counts: np.ndarray -- a 1D numpy array of the count to add to each rank, or None for one each
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the counts to the dense or sparse counts of this CombinationIndex object
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._array_of_counts is not None:
+            array_of_ranks = np.asarray(array_of_ranks).astype(np.intp)
+            if array_of_counts is None:
+                self._array_of_counts += np.bincount(array_of_ranks, minlength = self._number_of_combinations)
+            else:
+                np.add.at(self._array_of_counts, array_of_ranks, np.asarray(array_of_counts, dtype = np.int64))
+            return
+        if array_of_counts is None:
+            array_of_counts = np.ones(len(array_of_ranks), dtype = np.int64)
+        array_of_merged_ranks, array_of_inverse_indices = np.unique(np.concatenate([self._array_of_ranks, np.asarray(array_of_ranks, dtype = np.uint64)]), return_inverse = True)
+        array_of_merged_counts = np.zeros(len(array_of_merged_ranks), dtype = np.int64)
+        np.add.at(array_of_merged_counts, array_of_inverse_indices, np.concatenate([self._array_of_counts_of_ranks, np.asarray(array_of_counts, dtype = np.int64)]))
+        self._array_of_ranks = array_of_merged_ranks
+        self._array_of_counts_of_ranks = array_of_merged_counts
+
+    def get_count(self, combination):
+        '''
+        Gets how many times a face combination was counted, in constant time if counts are dense and logarithmic time in the number of distinct combinations counted otherwise
+
+        Keyword arguments:
+            combination: list -- a list, tuple, or 1D numpy array of the codes of the faces of one roll, in any order
+
+        Return values:
+            count: int -- the number of times the face combination was counted
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            May be called only with as many codes as dice, each less than the number of faces
+        '''
+
+        return int(self.get_counts(np.asarray(combination).reshape(1, self._number_of_dice))[0])
+
+    def get_counts(self, matrix_of_codes):
+        '''
+        Gets how many times the face combination of each of many rolls was counted
+
+        Keyword arguments:
+            matrix_of_codes: np.ndarray -- a 2D numpy array of codes of rolled faces, as for rank
+
+        Return values:
+            array_of_counts: np.ndarray -- a 1D numpy array with data type np.int64 of the count of the face combination of each row
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_ranks = self.rank(matrix_of_codes)
+        if self._array_of_counts is not None:
+            return self._array_of_counts[array_of_ranks.astype(np.intp)]
+        array_of_positions = np.minimum(np.searchsorted(self._array_of_ranks, array_of_ranks), max(len(self._array_of_ranks) - 1, 0))
+        if len(self._array_of_ranks) == 0:
+            return np.zeros(len(array_of_ranks), dtype = np.int64)
+        return np.where(self._array_of_ranks[array_of_positions] == array_of_ranks, self._array_of_counts_of_ranks[array_of_positions], 0)
+
+    def get_ranks_and_counts(self):
+        '''
+        Gets the ranks of the face combinations that were counted and their counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            array_of_ranks: np.ndarray -- a sorted 1D numpy array with data type np.uint64 of the ranks with positive counts
+            array_of_counts: np.ndarray -- a 1D numpy array with data type np.int64 of the count of each rank
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._array_of_counts is not None:
+            array_of_ranks = np.flatnonzero(self._array_of_counts)
+            return array_of_ranks.astype(np.uint64), self._array_of_counts[array_of_ranks]
+        array_of_ranks_are_counted = self._array_of_counts_of_ranks != 0
+        return self._array_of_ranks[array_of_ranks_are_counted], self._array_of_counts_of_ranks[array_of_ranks_are_counted]
+
+    def get_combinations_and_counts(self):
+        '''
+        Gets the face combinations that were counted, unranked into sorted codes, and their counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            matrix_of_combinations: np.ndarray -- a 2D numpy array where each row is the sorted codes of a face combination that was counted, in order of rank
+            array_of_counts: np.ndarray -- a 1D numpy array of the number of times each face combination was counted
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_ranks, array_of_counts = self.get_ranks_and_counts()
+        return self.unrank(array_of_ranks), array_of_counts
@@ -2,8 +2,92 @@
 Module for class Die, which may be rolled to select a face
 '''
 
+from montecarlosimulator.AliasTable import AliasTable
+from montecarlosimulator.Coding import get_smallest_unsigned_integer_type
+from montecarlosimulator.Sampler import CumulativeDistributionSampler
+from montecarlosimulator.Sampler import UniformSampler
+from montecarlosimulator.Seeding import generate_generator
+from montecarlosimulator.Seeding import generate_generator_for_chunk
+from montecarlosimulator.Seeding import generate_seed_sequence
+import hashlib
+import itertools
 import numpy as np
 import pandas as pd
+import weakref
+
+dictionary_of_names_and_types_of_samplers = {
+    'uniform': UniformSampler,
+    'cumulative_distribution': CumulativeDistributionSampler,
+    'alias_table': AliasTable
+}
+
+def select_type_of_sampler(number_of_faces, weights_are_equal, number_of_rolls = None):
+    '''
+    Selects the fastest type of sampler for a die from its number of faces, whether its weights are equal, and a number of rolls
+
+    Keyword arguments:
+        number_of_faces: int -- a positive integer
+        weights_are_equal: bool -- an indicator of whether all weights of the die are equal
+        number_of_rolls: int -- the number of rolls to be sampled. Defaults to None, for an unknown, large number of rolls.
+
+    Return values:
+        type_of_sampler: type -- UniformSampler for equal weights, which needs only bulk integer generation;
+                                 CumulativeDistributionSampler for few faces or fewer rolls than twice the faces, too few to amortize building an alias table, since a binary search over few cumulative weights is as fast as a table lookup; or
+                                 AliasTable for many faces and many rolls, where constant time per roll outweighs the linear time to build the table
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    if weights_are_equal:
+        return UniformSampler
+    if number_of_faces <= 8:
+        return CumulativeDistributionSampler
+    # Building an alias table costs about as much as two binary searches per face, so it pays off from about twice as many rolls as faces.
+    if number_of_rolls is not None and number_of_rolls < 2 * number_of_faces:
+        return CumulativeDistributionSampler
+    return AliasTable
+
+# Maps a pair of a fingerprint and a type of sampler to a sampler shared by all dice with that fingerprint; a sampler is dropped when no die refers to it.
+weak_dictionary_of_keys_and_shared_samplers = weakref.WeakValueDictionary()
+
+def get_shared_sampler(type_of_sampler, array_of_weights, fingerprint):
+    '''
+    Gets the sampler of a type shared by all dice with a fingerprint, building and freezing it if no die refers to it yet
+
+    Keyword arguments:
+        type_of_sampler: type -- a type of sampler in dictionary_of_names_and_types_of_samplers
+        array_of_weights: np.ndarray -- a 1D numpy array of weights from which the sampler is built if it needs to be built
+        fingerprint: bytes -- the fingerprint of the faces and weights of a die, as provided by Die.get_fingerprint
+
+    Return values:
+        sampler: Sampler -- a sampler whose numpy arrays are read only, so that it may be shared by dice with equal fingerprints
+
+    Side effects:
+        Builds and caches the sampler if it needs to be built
+
+    Exceptions raised:
+        ValueError, for the reasons that the type of sampler raises ValueError
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    key = (fingerprint, type_of_sampler)
+    sampler = weak_dictionary_of_keys_and_shared_samplers.get(key)
+    if sampler is None:
+        sampler = type_of_sampler(array_of_weights)
+        for value in vars(sampler).values():
+            if isinstance(value, np.ndarray):
+                value.setflags(write = False)
+        weak_dictionary_of_keys_and_shared_samplers[key] = sampler
+    return sampler
 
 class Die:
     '''
@@ -11,34 +95,55 @@ class Die:
     Has N sides.
     Each side is associated with a face and a weight.
     Weights default to 1.0 and may be changed.
-
-    Class variables:
-        _roll_is_being_tested: bool -- an indicator of whether roll is being tested
+    Is rolled with the type of sampler that is fastest for its weights and the number of rolls, unless a type of sampler is forced.
+    Shares its samplers with all other dice whose faces and weights are equal.
 
     Instance variables:
-        _data_frame_of_faces_and_weights: pd.DataFrame -- a data frame with an index of faces and a column of weights. A face has a data type of str, int, or float. All faces in the column named 'face' have the same data type. The faces must be unique. A weight has a data type of float.
+        _array_of_faces: np.ndarray -- a contiguous 1D numpy array of faces. A face has a data type of str, int, or float. All faces have the same data type. The faces must be unique.
+        _array_of_weights: np.ndarray -- a contiguous 1D numpy array of weights with data type np.float64, where the weight at an index is the weight of the face at the same index of the array of faces
+        _dictionary_of_faces_and_indices: dict -- a dictionary mapping each face to its index in the array of faces
+        _data_frame_of_faces_and_weights: pd.DataFrame -- a data frame with a column of faces and a column of weights built the first time this Die object is shown, or None if the data frame needs to be built
+        _weights_are_equal: bool -- an indicator of whether all weights of this Die object are equal, or None if the indicator needs to be computed
+        _dictionary_of_types_and_samplers: dict -- a dictionary mapping each type of sampler with which this Die object has been rolled since its weights last changed to a shared sampler of that type built from the weights
+        _fingerprint: bytes -- a digest of the faces and weights of this Die object, or None if the digest needs to be computed
+        _type_of_forced_sampler: type -- the type of sampler with which this Die object is always rolled, or None if the type of sampler is selected automatically for each roll
+        _generator: np.random.Generator -- the random number generator with which this Die object is rolled unless another generator is provided
 
     Public methods:
         __init__
+        from_weights
+        from_data_frame
+        from_file
         change_weight
+        change_weights
+        set_sampler
         roll
+        roll_codes
+        roll_face_counts
+        iter_rolls
+        get_array_of_faces
+        get_generator
+        get_fingerprint
         show
     '''
 
-    _roll_is_being_tested = False
+    __slots__ = ('_array_of_faces', '_array_of_weights', '_dictionary_of_faces_and_indices', '_data_frame_of_faces_and_weights', '_weights_are_equal', '_dictionary_of_types_and_samplers', '_fingerprint', '_type_of_forced_sampler', '_generator')
 
-    def __init__(self, array_of_faces):
+    def __init__(self, array_of_faces, seed = None):
         '''
         Initializes a Die object
         
         Keyword arguments:
             array_of_faces: np.ndarray -- a 1D numpy array of faces. A face must have a data type of str, int, or float. All faces in the numpy array have the same data type. The faces in the numpy array must be unique.
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed from which the random number generator of this Die object is generated, or a random number generator to use as is. Defaults to None, for a generator seeded with fresh entropy from the operating system.
 
         Return values:
             none
 
         Side effects:
-            Initializes this Die object's data frame of faces and weights
+            Initializes this Die object's arrays of faces and weights and dictionary of faces and indices
+            Initializes this Die object's random number generator
+            Indicates that this Die object's data frame of faces and weights and samplers need to be built and that its type of sampler is selected automatically
 
         Exceptions raised:
             none
@@ -47,8 +152,109 @@ class Die:
             May not be called directly
         '''
 
-        array_of_weights = np.ones(len(array_of_faces))
-        self._data_frame_of_faces_and_weights = pd.DataFrame({'face': array_of_faces, 'weight': array_of_weights})
+        self._array_of_faces = np.array(array_of_faces, order = 'C')
+        self._array_of_weights = np.ones(len(self._array_of_faces))
+        self._dictionary_of_faces_and_indices = {face: index for index, face in enumerate(self._array_of_faces.tolist())}
+        self._data_frame_of_faces_and_weights = None
+        self._weights_are_equal = True
+        self._dictionary_of_types_and_samplers = {}
+        self._fingerprint = None
+        self._type_of_forced_sampler = None
+        self._generator = generate_generator(seed)
+
+    @classmethod
+    def from_weights(cls, array_of_faces, array_of_weights, seed = None):
+        '''
+        Creates a Die object with provided faces and weights, validating all faces and weights in bulk and directly building the sampler that would be selected for a large number of rolls
+
+        Keyword arguments:
+            array_of_faces: np.ndarray -- a 1D numpy array of unique faces. A face must have a data type of str, int, or float.
+            array_of_weights: np.ndarray -- a 1D numpy array of nonnegative, finite weights with a positive sum, where the weight at an index is the weight of the face at the same index of the array of faces
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed accepted by __init__. Defaults to None.
+
+        Return values:
+            die: Die -- a Die object with the provided faces and weights
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            ValueError, if the faces are not unique, if the numbers of faces and weights differ, if a weight cannot be converted to a np.float64 object, if a weight is negative or not finite, or if the weights sum to zero
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        die = cls(array_of_faces, seed = seed)
+        if len(die._dictionary_of_faces_and_indices) != len(die._array_of_faces):
+            raise ValueError('faces must be unique')
+        array_of_weights = np.asarray(array_of_weights, dtype = np.float64)
+        if array_of_weights.shape != die._array_of_weights.shape:
+            raise ValueError('there must be one weight per face')
+        die._set_weights(slice(None), array_of_weights)
+        die._get_sampler()
+        return die
+
+    @classmethod
+    def from_data_frame(cls, data_frame, face_column = 'face', weight_column = 'weight', seed = None):
+        '''
+        Creates a Die object from a data frame with a column of faces and a column of weights, such as the data frame provided by show
+
+        Keyword arguments:
+            data_frame: pd.DataFrame -- a data frame with a column of unique faces and a column of weights
+            face_column: str, int -- the label of the column of faces. Defaults to 'face'.
+            weight_column: str, int -- the label of the column of weights. Defaults to 'weight'.
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed accepted by __init__. Defaults to None.
+
+        Return values:
+            die: Die -- a Die object with the faces and weights in the data frame
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            KeyError, if the data frame does not have the column of faces or the column of weights
+            ValueError, for the reasons that from_weights raises ValueError
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        series_of_faces = data_frame[face_column]
+        # is_string_dtype is true for any object column, so the values are inspected; only faces that are all strings are stored in a fixed-width numpy array rather than an array of Python objects.
+        if pd.api.types.infer_dtype(series_of_faces, skipna = False) == 'string':
+            array_of_faces = series_of_faces.to_numpy(dtype = str)
+        else:
+            array_of_faces = series_of_faces.to_numpy()
+        return cls.from_weights(array_of_faces, data_frame[weight_column].to_numpy(dtype = np.float64), seed = seed)
+
+    @classmethod
+    def from_file(cls, path_to_file, delimiter = '\t', memory_map = False, seed = None):
+        '''
+        Creates a Die object from a delimited text file without a header, such as Letter_Weights.txt, where each line holds a face and its weight
+
+        Keyword arguments:
+            path_to_file: str -- the path to a delimited text file whose first column holds faces and whose second column holds weights
+            delimiter: str -- the delimiter between a face and its weight. Defaults to a tab.
+            memory_map: bool -- an indicator of whether the file should be memory-mapped and parsed directly from the mapping, which avoids buffered reads for files with millions of faces. Defaults to False.
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed accepted by __init__. Defaults to None.
+
+        Return values:
+            die: Die -- a Die object with the faces and weights in the file
+
+        Side effects:
+            Reads the file once with the C parser of pandas
+
+        Exceptions raised:
+            FileNotFoundError, if there is no file at the provided path
+            ValueError, for the reasons that from_weights raises ValueError
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        data_frame_of_faces_and_weights = pd.read_csv(path_to_file, sep = delimiter, header = None, usecols = [0, 1], names = ['face', 'weight'], dtype = {'weight': np.float64}, engine = 'c', memory_map = memory_map)
+        return cls.from_data_frame(data_frame_of_faces_and_weights, seed = seed)
 
     def change_weight(self, face, weight):
         '''
@@ -63,52 +269,375 @@ class Die:
 
         Side effects:
             Changes the weight of the provided face to the provided weight
+            Indicates that this Die object's data frame of faces and weights and samplers need to be rebuilt
 
         Exceptions raised:
-            ValueError, if the provided face is not in the index of this Die object's data frame of faces and weights, or if the provided weight cannot be converted to a np.float64 object
+            ValueError, if the provided face is not a face of this Die object, or if the provided weight cannot be converted to a np.float64 object
 
         Restrictions on when this method can be called:
             none
         '''
 
-        if not face in self._data_frame_of_faces_and_weights['face'].to_list():
+        try:
+            index_of_face = self._dictionary_of_faces_and_indices[face]
+        except (KeyError, TypeError):
             raise ValueError('face is not in index of faces')
         # Checks to see if weight can be converted to np.float64.
         # If not, raises ValueError: could not convert <weight type> to float: <weight value>
         weight = np.float64(weight)
-        mask_face_column_equals_face = self._data_frame_of_faces_and_weights['face'] == face
-        index_of_row_with_face = self._data_frame_of_faces_and_weights.index[mask_face_column_equals_face][0]
-        self._data_frame_of_faces_and_weights.at[index_of_row_with_face, 'weight'] = weight
+        self._set_weights(index_of_face, weight)
+
+    def change_weights(self, weights):
+        '''
+        Changes the weights of many faces in one vectorized assignment
+
+        Keyword arguments:
+            weights: dict, pd.Series, np.ndarray, list -- A dictionary mapping faces to weights, a pandas series of weights with an index of faces, or an array of weights aligned with the array of faces provided by get_array_of_faces
+
+        Return values:
+            none
+
+        Side effects:
+            Changes the weights of the provided faces to the provided weights
+            Indicates that this Die object's data frame of faces and weights and samplers need to be rebuilt
+
+        Exceptions raised:
+            ValueError, if a provided face is not a face of this Die object, if an aligned array of weights does not have one weight per face, or if a provided weight cannot be converted to a np.float64 object. No weight is changed when ValueError is raised.
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if isinstance(weights, dict):
+            iterable_of_faces = weights.keys()
+            iterable_of_weights = list(weights.values())
+        elif isinstance(weights, pd.Series):
+            iterable_of_faces = weights.index
+            iterable_of_weights = weights.to_numpy()
+        else:
+            iterable_of_faces = None
+            iterable_of_weights = weights
+        array_of_weights = np.asarray(iterable_of_weights, dtype = np.float64)
+        if iterable_of_faces is None:
+            if array_of_weights.shape != self._array_of_weights.shape:
+                raise ValueError('an aligned array of weights must have one weight per face')
+            self._set_weights(slice(None), array_of_weights)
+            return
+        try:
+            array_of_indices_of_faces = np.fromiter((self._dictionary_of_faces_and_indices[face] for face in iterable_of_faces), dtype = np.intp, count = len(array_of_weights))
+        except (KeyError, TypeError):
+            raise ValueError('face is not in index of faces')
+        self._set_weights(array_of_indices_of_faces, array_of_weights)
+
+    def _set_weights(self, indices_of_faces, weights):
+        '''
+        Writes weights into this Die object's array of weights and invalidates everything derived from the weights
+
+        Keyword arguments:
+            indices_of_faces: int, np.ndarray, slice -- An index, an array of indices, or a slice of the array of weights
+            weights: np.float64, np.ndarray -- A weight or an array of weights with data type np.float64
+
+        Return values:
+            none
+
+        Side effects:
+            Changes weights of this Die object
+            Indicates that this Die object's data frame of faces and weights, samplers, and fingerprint need to be rebuilt
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            May be called only by methods of this Die object that have validated the indices and weights
+        '''
+
+        self._array_of_weights[indices_of_faces] = weights
+        self._data_frame_of_faces_and_weights = None
+        self._weights_are_equal = None
+        self._dictionary_of_types_and_samplers = {}
+        self._fingerprint = None
+
+    def set_sampler(self, name_of_sampler = None):
+        '''
+        Forces this Die object to be rolled with one type of sampler, for example for benchmarking, or restores automatic selection
+
+        Keyword arguments:
+            name_of_sampler: str -- 'uniform', 'cumulative_distribution', or 'alias_table', or None to select the type of sampler automatically for each roll from the weights and the number of rolls. Defaults to None.
+
+        Return values:
+            none
+
+        Side effects:
+            Sets the type of sampler with which this Die object is rolled
+
+        Exceptions raised:
+            ValueError, if the name of the sampler is not None or a key of dictionary_of_names_and_types_of_samplers
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if name_of_sampler is None:
+            self._type_of_forced_sampler = None
+        elif name_of_sampler in dictionary_of_names_and_types_of_samplers:
+            self._type_of_forced_sampler = dictionary_of_names_and_types_of_samplers[name_of_sampler]
+        else:
+            raise ValueError('the name of a sampler must be one of ' + ', '.join(dictionary_of_names_and_types_of_samplers))
+
+    def _get_sampler(self, number_of_rolls = None):
+        '''
+        Gets the sampler with which this Die object is rolled a number of times, building it if it needs to be built
+
+        Keyword arguments:
+            number_of_rolls: int -- the number of rolls to be sampled. Defaults to None, for an unknown, large number of rolls.
+
+        Return values:
+            sampler: Sampler -- the forced sampler of this Die object, an alias table already built for the weights of this Die object if select_type_of_sampler selects a cumulative distribution sampler, or the sampler selected by select_type_of_sampler
 
-    def roll(self, number_of_rolls = 1):
+        Side effects:
+            Computes whether the weights of this Die object are equal if the indicator needs to be computed
+            Gets the sampler shared by dice with the fingerprint of this Die object, building it if it needs to be built, and caches it
+
+        Exceptions raised:
+            ValueError, if a weight of this Die object is negative or not finite, if the weights of this Die object sum to zero, or if a forced uniform sampler is used with unequal weights
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._type_of_forced_sampler is None:
+            if self._weights_are_equal is None:
+                self._weights_are_equal = bool(np.all(self._array_of_weights == self._array_of_weights[0])) if len(self._array_of_weights) > 0 else True
+            type_of_sampler = select_type_of_sampler(len(self._array_of_weights), self._weights_are_equal, number_of_rolls)
+            # An alias table that has already been built costs nothing more to use and samples faster than a search of cumulative weights, whatever the number of rolls.
+            if type_of_sampler is CumulativeDistributionSampler and (AliasTable in self._dictionary_of_types_and_samplers or (self.get_fingerprint(), AliasTable) in weak_dictionary_of_keys_and_shared_samplers):
+                type_of_sampler = AliasTable
+        else:
+            type_of_sampler = self._type_of_forced_sampler
+        if type_of_sampler not in self._dictionary_of_types_and_samplers:
+            self._dictionary_of_types_and_samplers[type_of_sampler] = get_shared_sampler(type_of_sampler, self._array_of_weights, self.get_fingerprint())
+        return self._dictionary_of_types_and_samplers[type_of_sampler]
+
+    def roll(self, number_of_rolls = 1, generator = None):
         '''
         Rolls this Die object one or more times
 
         Keyword arguments:
             number_of_rolls: int -- An integer. Defaults to 1.
+            generator: np.random.Generator -- A random number generator. Defaults to None, for the random number generator of this Die object.
 
         Return values:
             list_of_rolled_faces: list -- A list of rolled faces
 
         Side effects:
-            Samples rows from the data frame of faces and weights of this Die object according to the weights
+            Builds the sampler of this Die object selected for the number of rolls if it needs to be built
+            Samples indices of faces from the sampler according to the weights
+            Advances the random number generator
         
         Exceptions raised:
-            none
+            ValueError, if a weight of this Die object is negative or not finite, if the weights of this Die object sum to zero, or if this Die object is forced to use a uniform sampler with unequal weights
 
         Restrictions on when this method can be called:
             none
         '''
         
-        the_random_state = 0 if Die._roll_is_being_tested else None
-        if self._data_frame_of_faces_and_weights.shape[0] > 0:
-            type_of_face = type(self._data_frame_of_faces_and_weights.at[0, 'face'])
-        else:
-            type_of_face = None
-        data_frame_of_rolled_faces_and_weights = self._data_frame_of_faces_and_weights.sample(n = number_of_rolls, replace = True, weights = 'weight', random_state = the_random_state, axis = None, ignore_index = False).reset_index(drop = True)
-        list_of_rolled_faces = [type_of_face(element) for element in data_frame_of_rolled_faces_and_weights['face'].to_list()]
+        array_of_codes_of_rolled_faces = self.roll_codes(number_of_rolls, generator)
+        list_of_rolled_faces = self._array_of_faces[array_of_codes_of_rolled_faces].tolist()
         return list_of_rolled_faces
 
+    def roll_codes(self, number_of_rolls = 1, generator = None):
+        '''
+        Rolls this Die object one or more times without boxing rolled faces as Python objects
+
+        Keyword arguments:
+            number_of_rolls: int -- An integer. Defaults to 1.
+            generator: np.random.Generator -- A random number generator. Defaults to None, for the random number generator of this Die object.
+
+        Return values:
+            array_of_codes_of_rolled_faces: np.ndarray -- A 1D numpy array of codes of rolled faces, where the code of a face is the index of the face in the array of faces provided by get_array_of_faces. The array has the smallest unsigned integer data type that can represent the code of every face of this Die object.
+
+        Side effects:
+            Builds the sampler of this Die object selected for the number of rolls if it needs to be built
+            Samples indices of faces from the sampler according to the weights
+            Advances the random number generator
+
+        Exceptions raised:
+            ValueError, if a weight of this Die object is negative or not finite, if the weights of this Die object sum to zero, or if this Die object is forced to use a uniform sampler with unequal weights
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if generator is None:
+            generator = self._generator
+        array_of_indices_of_rolled_faces = self._get_sampler(number_of_rolls).sample(number_of_rolls, generator)
+        type_of_code = get_smallest_unsigned_integer_type(len(self._array_of_faces))
+        array_of_codes_of_rolled_faces = array_of_indices_of_rolled_faces.astype(type_of_code)
+        return array_of_codes_of_rolled_faces
+
+    def roll_face_counts(self, number_of_rolls = 1, number_of_dice = 1, generator = None):
+        '''
+        Rolls one or more copies of this Die object together one or more times, drawing the number of copies with each face in each roll from a multinomial distribution without rolling any copy
+
+        Keyword arguments:
+            number_of_rolls: int -- An integer. Defaults to 1.
+            number_of_dice: int -- the number of copies of this Die object rolled in each roll. Defaults to 1.
+            generator: np.random.Generator -- A random number generator. Defaults to None, for the random number generator of this Die object.
+
+        Return values:
+            matrix_of_face_counts: np.ndarray -- A 2D numpy array of counts with data type np.int64, where the number of rows is the number of rolls, the number of columns is the number of faces, and the count at a column is the number of copies that rolled the face at the same index of the array of faces provided by get_array_of_faces
+
+        Side effects:
+            Advances the random number generator
+
+        Exceptions raised:
+            ValueError, if the weights of this Die object sum to zero
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if generator is None:
+            generator = self._generator
+        total = self._array_of_weights.sum()
+        if total <= 0:
+            raise ValueError('weights must have a positive sum')
+        return generator.multinomial(number_of_dice, self._array_of_weights / total, size = number_of_rolls)
+
+    def iter_rolls(self, total_number_of_rolls = None, chunk_size = 1048576, seed = None):
+        '''
+        Rolls this Die object in chunks of codes of rolled faces, so that any number of rolls, including an unbounded number, may be processed in bounded memory
+
+        Keyword arguments:
+            total_number_of_rolls: int -- the total number of rolls over all chunks, or None for an unbounded stream of chunks. Defaults to None.
+            chunk_size: int -- the number of rolls in every chunk but the last. Defaults to 1048576.
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed from which the random number generator of each chunk is derived. Defaults to None, for a seed spawned from the random number generator of this Die object.
+
+        Return values:
+            generator_of_arrays_of_codes_of_rolled_faces: generator -- a generator yielding 1D numpy arrays of codes of rolled faces like those provided by roll_codes. For a given seed and chunk size, the chunk at each position is always the same and is drawn from its own statistically independent stream.
+
+        Side effects:
+            Advances the spawn counter of the seed sequence of the random number generator of this Die object if no seed is provided
+            Builds samplers of this Die object as roll_codes does
+
+        Exceptions raised:
+            ValueError, if the chunk size is not positive, or for the reasons that roll_codes raises ValueError
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if chunk_size <= 0:
+            raise ValueError('the chunk size must be positive')
+        seed_sequence = generate_seed_sequence(self._generator if seed is None else seed)
+        return self._generate_chunks_of_codes_of_rolled_faces(total_number_of_rolls, chunk_size, seed_sequence)
+
+    def _generate_chunks_of_codes_of_rolled_faces(self, total_number_of_rolls, chunk_size, seed_sequence):
+        '''
+        Yields the chunks of codes of rolled faces described by iter_rolls
+
+        Keyword arguments:
+            total_number_of_rolls: int -- the total number of rolls over all chunks, or None for an unbounded stream of chunks
+            chunk_size: int -- a positive number of rolls in every chunk but the last
+            seed_sequence: np.random.SeedSequence -- the seed sequence from which the random number generator of each chunk is derived
+
+        Return values:
+            generator_of_arrays_of_codes_of_rolled_faces: generator -- a generator yielding 1D numpy arrays of codes of rolled faces
+
+        Side effects:
+            Builds samplers of this Die object as roll_codes does
+
+        Exceptions raised:
+            ValueError, for the reasons that roll_codes raises ValueError
+
+        Restrictions on when this method can be called:
+            May be called only by iter_rolls, which validates the chunk size and seed before the first chunk is requested
+        '''
+
+        for index_of_chunk in itertools.count():
+            if total_number_of_rolls is None:
+                number_of_rolls_in_chunk = chunk_size
+            else:
+                number_of_rolls_in_chunk = min(chunk_size, total_number_of_rolls - index_of_chunk * chunk_size)
+                if number_of_rolls_in_chunk <= 0:
+                    return
+            yield self.roll_codes(number_of_rolls_in_chunk, generate_generator_for_chunk(seed_sequence, index_of_chunk))
+
+    def get_array_of_faces(self):
+        '''
+        Gets the faces of this Die object, which is the vocabulary that maps codes of rolled faces provided by roll_codes to faces
+
+        Keyword arguments:
+            none
+
+        Return values:
+            array_of_faces: np.ndarray -- A 1D numpy array of the faces of this Die object, in the order of their codes
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._array_of_faces
+
+    def get_generator(self):
+        '''
+        Gets the random number generator with which this Die object is rolled unless another generator is provided
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _generator: np.random.Generator -- the random number generator of this Die object
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._generator
+
+    def get_fingerprint(self):
+        '''
+        Gets a digest of the faces and weights of this Die object, which is equal for dice with equal faces and weights
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _fingerprint: bytes -- a digest of the data type and values of the faces and the values of the weights of this Die object
+
+        Side effects:
+            Computes and caches the fingerprint of this Die object if it needs to be computed
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._fingerprint is None:
+            hash_object = hashlib.blake2b(digest_size = 16)
+            hash_object.update(self._array_of_faces.dtype.str.encode())
+            if self._array_of_faces.dtype == object:
+                hash_object.update(repr(self._array_of_faces.tolist()).encode())
+            else:
+                hash_object.update(self._array_of_faces.tobytes())
+            hash_object.update(self._array_of_weights.tobytes())
+            self._fingerprint = hash_object.digest()
+        return self._fingerprint
+
     def show(self):
         '''
         Displays and provides the data frame of faces and weights of this Die object
@@ -120,6 +649,7 @@ class Die:
             _data_frame_of_faces_and_weights: pd.DataFrame -- The data frame of faces and weights of this Die object
 
         Side effects:
+            Builds the data frame of faces and weights of this Die object if it needs to be built
             Displays the data frame of faces and weights of this Die object
 
         Exceptions raised:
@@ -129,5 +659,7 @@ class Die:
             none
         '''
 
+        if self._data_frame_of_faces_and_weights is None:
+            self._data_frame_of_faces_and_weights = pd.DataFrame({'face': self._array_of_faces, 'weight': self._array_of_weights})
         #print(self._data_frame_of_faces_and_weights)
         return self._data_frame_of_faces_and_weights
\ No newline at end of file
@@ -0,0 +1,143 @@
+'''
+Module for class DynamicDie, which is a Die whose weights may change after every roll
+'''
+
+from montecarlosimulator.Die import Die
+from montecarlosimulator.FenwickTree import FenwickTree
+import numpy as np
+
+class DynamicDie(Die):
+    '''
+    Is a Die whose weights may change after every roll, as in an urn that is reinforced by each draw.
+    Keeps its weights in a Fenwick tree, so that changing a weight and rolling a face both take logarithmic time in the number of faces instead of rebuilding a sampler after each change.
+
+    Instance variables:
+        _fenwick_tree: FenwickTree -- a Fenwick tree over the weights of this DynamicDie object, whose array of values is this DynamicDie object's array of weights
+        Also the instance variables of Die
+
+    Public methods:
+        __init__
+        roll_and_reinforce
+        Also the public methods of Die
+    '''
+
+    __slots__ = ('_fenwick_tree',)
+
+    def __init__(self, array_of_faces, seed = None):
+        '''
+        Initializes a DynamicDie object
+
+        Keyword arguments:
+            array_of_faces: np.ndarray -- a 1D numpy array of faces, as for Die.__init__
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed accepted by Die.__init__. Defaults to None.
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this DynamicDie object as a Die object
+            Initializes this DynamicDie object's Fenwick tree over its weights
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        super().__init__(array_of_faces, seed = seed)
+        self._fenwick_tree = FenwickTree(self._array_of_weights)
+        self._array_of_weights = self._fenwick_tree.get_array_of_values()
+
+    def _set_weights(self, indices_of_faces, weights):
+        '''
+        Writes weights into the Fenwick tree of this DynamicDie object and invalidates everything else derived from the weights
+
+        Keyword arguments:
+            indices_of_faces: int, np.ndarray, slice -- An index, an array of indices, or a slice of the array of weights
+            weights: np.float64, np.ndarray -- A weight or an array of weights with data type np.float64
+
+        Return values:
+            none
+
+        Side effects:
+            Changes weights of this DynamicDie object in logarithmic time per weight
+            Indicates that this DynamicDie object's data frame of faces and weights and any forced samplers need to be rebuilt
+
+        Exceptions raised:
+            ValueError, if a weight is negative or not finite. No weight is changed when ValueError is raised.
+
+        Restrictions on when this method can be called:
+            May be called only by methods of this DynamicDie object that have validated the indices
+        '''
+
+        if isinstance(indices_of_faces, slice):
+            array_of_indices_of_faces = np.arange(len(self._array_of_weights))[indices_of_faces]
+        else:
+            array_of_indices_of_faces = np.atleast_1d(indices_of_faces)
+        self._fenwick_tree.set(array_of_indices_of_faces, weights)
+        super()._set_weights(indices_of_faces, self._array_of_weights[indices_of_faces])
+
+    def _get_sampler(self, number_of_rolls = None):
+        '''
+        Gets the sampler with which this DynamicDie object is rolled
+
+        Keyword arguments:
+            number_of_rolls: int -- the number of rolls to be sampled. Defaults to None.
+
+        Return values:
+            sampler: Sampler -- the Fenwick tree of this DynamicDie object, or a forced sampler as for Die._get_sampler
+
+        Side effects:
+            Builds and caches a forced sampler if it needs to be built
+
+        Exceptions raised:
+            ValueError, for the reasons that Die._get_sampler raises ValueError for a forced sampler
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._type_of_forced_sampler is not None:
+            return super()._get_sampler(number_of_rolls)
+        return self._fenwick_tree
+
+    def roll_and_reinforce(self, number_of_rolls = 1, reinforcement = 1.0, batch_size = 1, generator = None):
+        '''
+        Rolls this DynamicDie object one or more times, adding a reinforcement to the weight of each rolled face, as in a Polya urn
+
+        Keyword arguments:
+            number_of_rolls: int -- An integer. Defaults to 1.
+            reinforcement: float -- the amount added to the weight of a face each time it is rolled, which may be negative to remove weight. Defaults to 1.0.
+            batch_size: int -- the number of rolls drawn with the same weights before their reinforcements are applied together. A batch size of 1 reinforces after every roll exactly; a larger batch size trades that exactness for vectorized speed. Defaults to 1.
+            generator: np.random.Generator -- A random number generator. Defaults to None, for the random number generator of this DynamicDie object.
+
+        Return values:
+            array_of_codes_of_rolled_faces: np.ndarray -- A 1D numpy array of codes of rolled faces, as provided by roll_codes
+
+        Side effects:
+            Changes the weights of the rolled faces
+            Advances the random number generator
+
+        Exceptions raised:
+            ValueError, if the batch size is not positive, if the weights sum to zero before a batch, or if a reinforcement would make a weight negative or not finite. Reinforcements of earlier batches remain applied when ValueError is raised.
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if batch_size <= 0:
+            raise ValueError('the batch size must be positive')
+        if generator is None:
+            generator = self._generator
+        list_of_arrays_of_codes_of_rolled_faces = []
+        for index_of_first_roll_in_batch in range(0, number_of_rolls, batch_size):
+            number_of_rolls_in_batch = min(batch_size, number_of_rolls - index_of_first_roll_in_batch)
+            array_of_codes_of_rolled_faces = self.roll_codes(number_of_rolls_in_batch, generator)
+            array_of_indices_of_rolled_faces, array_of_numbers_of_times_rolled = np.unique(array_of_codes_of_rolled_faces, return_counts = True)
+            array_of_reinforced_weights = self._array_of_weights[array_of_indices_of_rolled_faces] + reinforcement * array_of_numbers_of_times_rolled
+            self._set_weights(array_of_indices_of_rolled_faces.astype(np.intp), array_of_reinforced_weights)
+            list_of_arrays_of_codes_of_rolled_faces.append(array_of_codes_of_rolled_faces)
+        if len(list_of_arrays_of_codes_of_rolled_faces) == 0:
+            return self.roll_codes(0, generator)
+        return np.concatenate(list_of_arrays_of_codes_of_rolled_faces)
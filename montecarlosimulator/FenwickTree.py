@@ -0,0 +1,298 @@
+'''
+Module for class FenwickTree, which samples indices of faces according to an array of weights that may change between samples
+'''
+
+from montecarlosimulator.Sampler import Sampler
+import numpy as np
+
+class FenwickTree(Sampler):
+    '''
+    Samples indices of faces according to an array of weights that may change between samples.
+    Stores partial sums of the weights in a Fenwick tree, also known as a binary indexed tree, so that both changing a weight and sampling an index take logarithmic time.
+    Changes and samples are batched: each level of the tree is processed for a whole array of indices at once.
+
+    Instance variables:
+        _number_of_faces: int -- the number of weights in this FenwickTree object
+        _array_of_values: np.ndarray -- a 1D numpy array of the weights, which this FenwickTree object keeps up to date
+        _array_of_partial_sums: np.ndarray -- a 1D numpy array of length one more than the number of weights, where the element at a one-based position i is the sum of the weights at the one-based positions in (i - lowbit(i), i]
+        _largest_power_of_two: int -- the largest power of two not greater than the number of weights, from which a search for a prefix sum descends
+        _index_of_last_positive_weight: int -- the largest index with a positive weight, to which a target that rounds up to the total is clipped, or -1 if no weight is positive
+        _number_of_updates_since_rebuild: int -- the number of weights changed by adding deltas to partial sums since the partial sums were last rebuilt, which bounds the rounding error accumulated in them
+
+    Public methods:
+        __init__
+        get_array_of_values
+        get_total
+        add
+        set
+        find
+        sample
+    '''
+
+    def __init__(self, array_of_values):
+        '''
+        Initializes a FenwickTree object in one vectorized pass over the cumulative sums of an array of weights
+
+        Keyword arguments:
+            array_of_values: np.ndarray -- a 1D numpy array of nonnegative, finite weights. An array with data type np.float64 is kept by reference and updated in place by add and set.
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this FenwickTree object's number of faces, array of values, array of partial sums, largest power of two, and index of its last positive weight
+
+        Exceptions raised:
+            ValueError, if a weight is negative or not finite
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        self._array_of_values = np.asarray(array_of_values, dtype = np.float64)
+        if not np.all(np.isfinite(self._array_of_values)) or np.any(self._array_of_values < 0):
+            raise ValueError('weights must be nonnegative and finite')
+        self._number_of_faces = len(self._array_of_values)
+        self._rebuild()
+        self._largest_power_of_two = 1 << (self._number_of_faces.bit_length() - 1) if self._number_of_faces > 0 else 0
+
+    def _rebuild(self):
+        '''
+        Rebuilds the partial sums of this FenwickTree object from its array of values, discarding the rounding error accumulated by adding deltas
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Recomputes the array of partial sums and the index of the last positive weight of this FenwickTree object
+            Resets the number of updates since the partial sums were last rebuilt
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_cumulative_sums = np.concatenate(([0.0], np.cumsum(self._array_of_values)))
+        array_of_positions = np.arange(self._number_of_faces + 1)
+        array_of_lowest_bits = array_of_positions & -array_of_positions
+        self._array_of_partial_sums = array_of_cumulative_sums - array_of_cumulative_sums[array_of_positions - array_of_lowest_bits]
+        array_of_indices_of_positive_weights = np.flatnonzero(self._array_of_values > 0)
+        self._index_of_last_positive_weight = int(array_of_indices_of_positive_weights[-1]) if len(array_of_indices_of_positive_weights) > 0 else -1
+        self._number_of_updates_since_rebuild = 0
+
+    def _update_index_of_last_positive_weight(self, array_of_indices):
+        '''
+        Updates the index of the last positive weight of this FenwickTree object after the weights at indices changed
+
+        Keyword arguments:
+            array_of_indices: np.ndarray -- a 1D numpy array of zero-based indices of changed weights
+
+        Return values:
+            none
+
+        Side effects:
+            Moves the index of the last positive weight up to a changed weight that became positive, or down past a last weight that became zero
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_indices_of_positive_weights = array_of_indices[self._array_of_values[array_of_indices] > 0]
+        if len(array_of_indices_of_positive_weights) > 0:
+            self._index_of_last_positive_weight = max(self._index_of_last_positive_weight, int(array_of_indices_of_positive_weights.max()))
+        if self._index_of_last_positive_weight >= 0 and self._array_of_values[self._index_of_last_positive_weight] <= 0:
+            array_of_indices_of_positive_weights = np.flatnonzero(self._array_of_values[:self._index_of_last_positive_weight] > 0)
+            self._index_of_last_positive_weight = int(array_of_indices_of_positive_weights[-1]) if len(array_of_indices_of_positive_weights) > 0 else -1
+
+    def get_array_of_values(self):
+        '''
+        Gets the weights of this FenwickTree object
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _array_of_values: np.ndarray -- the 1D numpy array of weights of this FenwickTree object, which is updated in place by add and set
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._array_of_values
+
+    def get_total(self):
+        '''
+        Gets the sum of the weights of this FenwickTree object from its partial sums in logarithmic time
+
+        Keyword arguments:
+            none
+
+        Return values:
+            total: float -- the sum of the weights
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        total = 0.0
+        position = self._number_of_faces
+        while position > 0:
+            total += self._array_of_partial_sums[position]
+            position -= position & -position
+        return total
+
+    def add(self, array_of_indices, array_of_deltas):
+        '''
+        Adds deltas to the weights at indices, where an index may appear more than once
+
+        Keyword arguments:
+            array_of_indices: np.ndarray -- a 1D numpy array of zero-based indices of weights
+            array_of_deltas: np.ndarray -- a 1D numpy array of deltas aligned with the array of indices, or a single delta for every index
+
+        Return values:
+            none
+
+        Side effects:
+            Adds the deltas to the array of values and partial sums of this FenwickTree object, or rebuilds the partial sums once as many weights have been changed by deltas since the last rebuild as there are weights, so that rounding error does not accumulate without bound
+            Updates the index of the last positive weight
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            May be called only with deltas that leave every weight nonnegative and finite
+        '''
+
+        array_of_indices = np.asarray(array_of_indices, dtype = np.intp)
+        array_of_deltas = np.broadcast_to(np.asarray(array_of_deltas, dtype = np.float64), array_of_indices.shape)
+        np.add.at(self._array_of_values, array_of_indices, array_of_deltas)
+        self._number_of_updates_since_rebuild += len(array_of_indices)
+        # Rebuilding after as many updates as weights costs amortized constant time per update.
+        if self._number_of_updates_since_rebuild >= self._number_of_faces:
+            self._rebuild()
+            return
+        self._update_index_of_last_positive_weight(array_of_indices)
+        array_of_positions = array_of_indices + 1
+        while len(array_of_positions) > 0:
+            np.add.at(self._array_of_partial_sums, array_of_positions, array_of_deltas)
+            array_of_positions = array_of_positions + (array_of_positions & -array_of_positions)
+            array_of_positions_are_in_tree = array_of_positions <= self._number_of_faces
+            array_of_positions = array_of_positions[array_of_positions_are_in_tree]
+            array_of_deltas = array_of_deltas[array_of_positions_are_in_tree]
+
+    def set(self, array_of_indices, array_of_values):
+        '''
+        Sets the weights at indices to values, where the last value wins for an index that appears more than once
+
+        Keyword arguments:
+            array_of_indices: np.ndarray -- a 1D numpy array of zero-based indices of weights
+            array_of_values: np.ndarray -- a 1D numpy array of nonnegative, finite weights aligned with the array of indices, or a single weight for every index
+
+        Return values:
+            none
+
+        Side effects:
+            Sets weights in the array of values of this FenwickTree object and updates its partial sums, rebuilding them if more than half of the weights or any weight set to zero change, so that no rounding error is left in the partial sums over a weight of zero
+            Updates the index of the last positive weight
+
+        Exceptions raised:
+            ValueError, if a weight is negative or not finite
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_indices = np.asarray(array_of_indices, dtype = np.intp)
+        array_of_values = np.broadcast_to(np.asarray(array_of_values, dtype = np.float64), array_of_indices.shape)
+        if not np.all(np.isfinite(array_of_values)) or np.any(array_of_values < 0):
+            raise ValueError('weights must be nonnegative and finite')
+        # Keeps only the last occurrence of each index, so that each weight receives exactly one delta.
+        array_of_reversed_unique_positions = np.unique(array_of_indices[::-1], return_index = True)[1]
+        array_of_positions_of_last_occurrences = len(array_of_indices) - 1 - array_of_reversed_unique_positions
+        array_of_indices = array_of_indices[array_of_positions_of_last_occurrences]
+        array_of_values = array_of_values[array_of_positions_of_last_occurrences]
+        if len(array_of_indices) > self._number_of_faces // 2 or np.any(array_of_values == 0):
+            self._array_of_values[array_of_indices] = array_of_values
+            self._rebuild()
+        else:
+            self.add(array_of_indices, array_of_values - self._array_of_values[array_of_indices])
+
+    def find(self, array_of_targets):
+        '''
+        Finds, for each target, the smallest index whose prefix sum of weights exceeds the target, by descending the tree once for all targets
+
+        Keyword arguments:
+            array_of_targets: np.ndarray -- a 1D numpy array of targets in [0, total)
+
+        Return values:
+            array_of_indices: np.ndarray -- a 1D numpy array of zero-based indices of weights. A target that rounds up to the total is clipped to the index of the last positive weight.
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_targets = np.array(array_of_targets, dtype = np.float64)
+        array_of_positions = np.zeros(len(array_of_targets), dtype = np.intp)
+        step = self._largest_power_of_two
+        while step > 0:
+            array_of_next_positions = array_of_positions + step
+            array_of_next_positions_are_in_tree = array_of_next_positions <= self._number_of_faces
+            array_of_partial_sums = self._array_of_partial_sums[np.minimum(array_of_next_positions, self._number_of_faces)]
+            array_of_steps_are_taken = array_of_next_positions_are_in_tree & (array_of_partial_sums <= array_of_targets)
+            array_of_positions[array_of_steps_are_taken] = array_of_next_positions[array_of_steps_are_taken]
+            array_of_targets[array_of_steps_are_taken] -= array_of_partial_sums[array_of_steps_are_taken]
+            step >>= 1
+        # A target that rounds up to the total would fall past the last positive weight.
+        return np.minimum(array_of_positions, max(self._index_of_last_positive_weight, 0))
+
+    def sample(self, number_of_samples, generator):
+        '''
+        Samples indices of faces according to the current weights of this FenwickTree object
+
+        Keyword arguments:
+            number_of_samples: int -- An integer
+            generator: np.random.Generator -- A numpy random number generator
+
+        Return values:
+            array_of_indices: np.ndarray -- A 1D numpy array of sampled indices of faces
+
+        Side effects:
+            Advances the provided random number generator
+
+        Exceptions raised:
+            ValueError, if the weights of this FenwickTree object sum to zero
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        total = self.get_total()
+        if total <= 0:
+            raise ValueError('weights must have a positive sum')
+        return self.find(generator.random(number_of_samples) * total)
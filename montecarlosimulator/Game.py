@@ -2,19 +2,403 @@
 Module for class Game, which plays by rolling one or more times all dice in a list of one or more dice with the same set of faces
 '''
 
+from concurrent.futures import ProcessPoolExecutor
+from montecarlosimulator.Accumulator import Accumulator
+from montecarlosimulator.Coding import count_bits_of_rows
+from montecarlosimulator.Coding import count_codes_of_rows
+from montecarlosimulator.Coding import get_smallest_unsigned_integer_type
+from montecarlosimulator.Seeding import generate_generator_for_chunk
+from montecarlosimulator.Seeding import generate_seed_sequence
+from montecarlosimulator.Sharing import attach_shared_matrix_of_codes
+from montecarlosimulator.Sharing import create_shared_matrix_of_codes
+from montecarlosimulator.Storing import create_memory_mapped_matrix_of_codes
+from montecarlosimulator.Storing import extend_memory_mapped_matrix_of_codes
+from montecarlosimulator.Storing import open_memory_mapped_matrix_of_codes
+import itertools
+import numpy as np
 import pandas as pd
+import weakref
+
+# The dice, the matrix of codes in shared memory or in a file, and the codes of faces of dice whose faces are not in the order of the array of faces of the game played by a worker process, set once per process by _initialize_worker.
+_list_of_dice_of_worker = None
+_block_of_shared_memory_of_worker = None
+_matrix_of_codes_of_worker = None
+_dictionary_of_indices_and_arrays_of_codes_of_faces_of_worker = None
+
+def _initialize_worker(list_of_dice, name_of_shared_memory, path_to_file, dictionary_of_indices_and_arrays_of_codes_of_faces):
+    '''
+    Initializes a worker process of a parallel play with the dice of the game and the matrix of codes in shared memory or in a file, so that each chunk needs only its description
+
+    Keyword arguments:
+        list_of_dice: list -- the list of dice of the game
+        name_of_shared_memory: str -- the name of the block of shared memory holding the matrix of codes of the game, or None if the matrix of codes is in a file or the game stores only counts
+        path_to_file: str -- the path to the file holding the matrix of codes of the game, or None if the matrix of codes is in shared memory or the game stores only counts
+        dictionary_of_indices_and_arrays_of_codes_of_faces: dict -- a dictionary mapping the index of each die whose faces are not in the order of the array of faces of the game to the codes of its faces in that array
+
+    Return values:
+        none
+
+    Side effects:
+        Sets the dice, matrix of codes, and codes of faces of the game played by this worker process
+        Maps the block of shared memory or the file, if any, into this worker process
+
+    Exceptions raised:
+        FileNotFoundError, if no block of shared memory has the name or no file has the path
+
+    Restrictions on when this function can be called:
+        May be called only as the initializer of a worker process
+    '''
+
+    global _list_of_dice_of_worker, _block_of_shared_memory_of_worker, _matrix_of_codes_of_worker, _dictionary_of_indices_and_arrays_of_codes_of_faces_of_worker
+    _list_of_dice_of_worker = list_of_dice
+    if name_of_shared_memory is not None:
+        _block_of_shared_memory_of_worker, _, _matrix_of_codes_of_worker = attach_shared_matrix_of_codes(name_of_shared_memory)
+    elif path_to_file is not None:
+        _, _matrix_of_codes_of_worker, _ = open_memory_mapped_matrix_of_codes(path_to_file, mode = 'r+')
+    _dictionary_of_indices_and_arrays_of_codes_of_faces_of_worker = dictionary_of_indices_and_arrays_of_codes_of_faces
+
+def _roll_and_write_chunk(matrix_of_codes, die, chunk, array_of_codes_of_faces):
+    '''
+    Rolls one chunk of codes of rolled faces with the random number generator for that chunk and writes them into a matrix of codes
+
+    Keyword arguments:
+        matrix_of_codes: np.ndarray -- the 2D numpy array of codes of rolled faces of a game
+        die: Die -- the die that rolls the chunk
+        chunk: tuple -- the index of the die that rolls the chunk, the seed sequence of its stream of chunks, the index of the chunk in that stream, the first row of the chunk, the number of rows of the chunk, and the list of indices of the dice whose columns the chunk fills
+        array_of_codes_of_faces: np.ndarray -- a 1D numpy array of the codes in the matrix of the faces of the die, or None if the faces of the die are in the order of the codes
+
+    Return values:
+        none
+
+    Side effects:
+        Writes codes of rolled faces, which depend only on the die and the chunk, into the rows and columns of the chunk in the matrix of codes
+
+    Exceptions raised:
+        ValueError, for the reasons that Die.roll_codes raises ValueError
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    _, seed_sequence, index_of_chunk, index_of_first_roll, number_of_rolls_in_chunk, list_of_indices_of_dice = chunk
+    array_of_codes_of_rolled_faces = die.roll_codes(number_of_rolls_in_chunk * len(list_of_indices_of_dice), generate_generator_for_chunk(seed_sequence, index_of_chunk))
+    matrix_of_codes_of_rolled_faces = array_of_codes_of_rolled_faces.reshape(number_of_rolls_in_chunk, len(list_of_indices_of_dice))
+    if array_of_codes_of_faces is not None:
+        matrix_of_codes_of_rolled_faces = array_of_codes_of_faces[matrix_of_codes_of_rolled_faces]
+    matrix_of_codes[index_of_first_roll:index_of_first_roll + number_of_rolls_in_chunk, list_of_indices_of_dice] = matrix_of_codes_of_rolled_faces
+
+def _roll_and_write_chunk_in_worker(chunk):
+    '''
+    Rolls one chunk of codes of rolled faces in a worker process and writes them directly into the matrix of codes in shared memory or in a file
+
+    Keyword arguments:
+        chunk: tuple -- a description of a chunk, as for _roll_and_write_chunk
+
+    Return values:
+        none
+
+    Side effects:
+        Writes codes of rolled faces into the matrix of codes in shared memory or in a file
+
+    Exceptions raised:
+        ValueError, for the reasons that Die.roll_codes raises ValueError
+
+    Restrictions on when this function can be called:
+        May be called only in a worker process initialized by _initialize_worker
+    '''
+
+    index_of_die = chunk[0]
+    _roll_and_write_chunk(_matrix_of_codes_of_worker, _list_of_dice_of_worker[index_of_die], chunk, _dictionary_of_indices_and_arrays_of_codes_of_faces_of_worker.get(index_of_die))
+
+# Drawing the face counts of a roll of identical dice from a multinomial distribution costs about one binomial draw per face, so it is faster than rolling each die only when there are many more dice than faces.
+minimum_number_of_dice_per_face_for_drawing_face_counts = 8
+
+def _roll_chunks_of_rows(list_of_dice, list_of_chunks_of_rows, dictionary_of_indices_and_arrays_of_codes_of_faces, type_of_code):
+    '''
+    Rolls the chunks of all groups of dice that share one range of rows into a temporary matrix of codes
+
+    Keyword arguments:
+        list_of_dice: list -- the list of dice of the game
+        list_of_chunks_of_rows: list -- a list of descriptions of chunks with the same rows, one per group of dice, as for _roll_and_write_chunk
+        dictionary_of_indices_and_arrays_of_codes_of_faces: dict -- a dictionary mapping the index of each die whose faces are not in the order of the array of faces of the game to the codes of its faces in that array
+        type_of_code: type -- the unsigned integer data type of the codes of the game
+
+    Return values:
+        matrix_of_codes: np.ndarray -- a 2D numpy array of the codes of the rolls of the range of rows, where the number of columns is the number of dice
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        ValueError, for the reasons that Die.roll_codes raises ValueError
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    matrix_of_codes = np.empty((list_of_chunks_of_rows[0][4], len(list_of_dice)), dtype = type_of_code)
+    for chunk in list_of_chunks_of_rows:
+        # Writes the chunk at the top of the temporary matrix of codes instead of at its rows in the game.
+        _roll_and_write_chunk(matrix_of_codes, list_of_dice[chunk[0]], chunk[:3] + (0,) + chunk[4:], dictionary_of_indices_and_arrays_of_codes_of_faces.get(chunk[0]))
+    return matrix_of_codes
+
+def _accumulate_chunks_of_rows(accumulator, list_of_dice, list_of_chunks_of_rows, dictionary_of_indices_and_arrays_of_codes_of_faces, type_of_code, face_counts_are_drawn, face_counts_are_kept):
+    '''
+    Rolls the chunks of all groups of dice that share one range of rows into a temporary matrix of codes and accumulates that matrix, or draws the face counts of those rows if all dice are identical
+
+    Keyword arguments:
+        accumulator: Accumulator -- the accumulator of the game
+        list_of_dice: list -- the list of dice of the game
+        list_of_chunks_of_rows: list -- a list of descriptions of chunks with the same rows, one per group of dice, as for _roll_and_write_chunk
+        dictionary_of_indices_and_arrays_of_codes_of_faces: dict -- a dictionary mapping the index of each die whose faces are not in the order of the array of faces of the game to the codes of its faces in that array
+        type_of_code: type -- the unsigned integer data type of the codes of the game
+        face_counts_are_drawn: bool -- an indicator of whether the one group of dice of the game is not rolled and the face counts of its rolls are drawn from a multinomial distribution instead
+        face_counts_are_kept: bool -- an indicator of whether the face counts of each roll are returned
+
+    Return values:
+        matrix_of_face_counts: np.ndarray -- a 2D numpy array of the number of dice with each face in each roll of the range of rows, or None if face counts are not kept
+
+    Side effects:
+        Accumulates the rolls of the range of rows into the accumulator
+
+    Exceptions raised:
+        ValueError, for the reasons that Die.roll_codes and Die.roll_face_counts raise ValueError
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    number_of_rolls_in_chunk = list_of_chunks_of_rows[0][4]
+    if face_counts_are_drawn:
+        index_of_die, seed_sequence, index_of_chunk = list_of_chunks_of_rows[0][:3]
+        matrix_of_face_counts = list_of_dice[index_of_die].roll_face_counts(number_of_rolls_in_chunk, len(list_of_dice), generate_generator_for_chunk(seed_sequence, index_of_chunk))
+        accumulator.add_face_counts(matrix_of_face_counts)
+        return matrix_of_face_counts if face_counts_are_kept else None
+    matrix_of_codes = _roll_chunks_of_rows(list_of_dice, list_of_chunks_of_rows, dictionary_of_indices_and_arrays_of_codes_of_faces, type_of_code)
+    accumulator.add(matrix_of_codes)
+    if not face_counts_are_kept:
+        return None
+    return count_codes_of_rows(matrix_of_codes, len(accumulator.get_array_of_totals_of_faces()))
+
+def _accumulate_chunks_of_rows_in_worker(list_of_chunks_of_rows, number_of_faces, type_of_code, face_counts_are_drawn, face_counts_are_kept):
+    '''
+    Accumulates the chunks of all groups of dice that share one range of rows in a worker process
+
+    Keyword arguments:
+        list_of_chunks_of_rows: list -- a list of descriptions of chunks with the same rows, as for _accumulate_chunks_of_rows
+        number_of_faces: int -- the number of faces of the game
+        type_of_code: type -- the unsigned integer data type of the codes of the game
+        face_counts_are_drawn: bool -- an indicator of whether face counts are drawn, as for _accumulate_chunks_of_rows
+        face_counts_are_kept: bool -- an indicator of whether face counts are returned, as for _accumulate_chunks_of_rows
+
+    Return values:
+        accumulator: Accumulator -- an accumulator of the rolls of the range of rows, which the game merges into its own
+        matrix_of_face_counts: np.ndarray -- the face counts of the rolls of the range of rows, or None if face counts are not kept
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        ValueError, for the reasons that Die.roll_codes and Die.roll_face_counts raise ValueError
+
+    Restrictions on when this function can be called:
+        May be called only in a worker process initialized by _initialize_worker
+    '''
+
+    accumulator = Accumulator(number_of_faces, len(_list_of_dice_of_worker), type_of_code)
+    matrix_of_face_counts = _accumulate_chunks_of_rows(accumulator, _list_of_dice_of_worker, list_of_chunks_of_rows, _dictionary_of_indices_and_arrays_of_codes_of_faces_of_worker, type_of_code, face_counts_are_drawn, face_counts_are_kept)
+    return accumulator, matrix_of_face_counts
+
+def _accumulate_and_pack_chunks_of_rows(accumulator, list_of_dice, list_of_chunks_of_rows, dictionary_of_indices_and_arrays_of_codes_of_faces):
+    '''
+    Rolls the chunks of all groups of dice with two faces that share one range of rows, packs their codes into bits, and accumulates their face counts, which are counts of bits
+
+    Keyword arguments:
+        accumulator: Accumulator -- the accumulator of the game
+        list_of_dice: list -- the list of dice of the game
+        list_of_chunks_of_rows: list -- a list of descriptions of chunks with the same rows, one per group of dice, as for _roll_and_write_chunk
+        dictionary_of_indices_and_arrays_of_codes_of_faces: dict -- a dictionary mapping the index of each die whose faces are not in the order of the array of faces of the game to the codes of its faces in that array
+
+    Return values:
+        matrix_of_packed_codes: np.ndarray -- a 2D numpy array with data type np.uint8 of the codes of the rolls of the range of rows packed eight to a byte by np.packbits
+
+    Side effects:
+        Accumulates the rolls of the range of rows into the accumulator
+
+    Exceptions raised:
+        ValueError, for the reasons that Die.roll_codes raises ValueError
+
+    Restrictions on when this function can be called:
+        May be called only for a game whose array of faces has two faces
+    '''
+
+    matrix_of_packed_codes = np.packbits(_roll_chunks_of_rows(list_of_dice, list_of_chunks_of_rows, dictionary_of_indices_and_arrays_of_codes_of_faces, np.uint8), axis = 1)
+    array_of_numbers_of_second_faces = count_bits_of_rows(matrix_of_packed_codes)
+    accumulator.add_face_counts(np.column_stack((len(list_of_dice) - array_of_numbers_of_second_faces, array_of_numbers_of_second_faces)))
+    return matrix_of_packed_codes
+
+def _accumulate_and_pack_chunks_of_rows_in_worker(list_of_chunks_of_rows):
+    '''
+    Rolls, packs, and accumulates the chunks of all groups of dice with two faces that share one range of rows in a worker process
+
+    Keyword arguments:
+        list_of_chunks_of_rows: list -- a list of descriptions of chunks with the same rows, as for _accumulate_and_pack_chunks_of_rows
+
+    Return values:
+        accumulator: Accumulator -- an accumulator of the rolls of the range of rows, which the game merges into its own
+        matrix_of_packed_codes: np.ndarray -- the packed codes of the rolls of the range of rows
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        ValueError, for the reasons that Die.roll_codes raises ValueError
+
+    Restrictions on when this function can be called:
+        May be called only in a worker process initialized by _initialize_worker
+    '''
+
+    accumulator = Accumulator(2, len(_list_of_dice_of_worker), np.uint8)
+    matrix_of_packed_codes = _accumulate_and_pack_chunks_of_rows(accumulator, _list_of_dice_of_worker, list_of_chunks_of_rows, _dictionary_of_indices_and_arrays_of_codes_of_faces_of_worker)
+    return accumulator, matrix_of_packed_codes
+
+def _generate_matrix_with_capacity(matrix_with_capacity, number_of_kept_rows, number_of_rows):
+    '''
+    Generates a matrix with room for a number of rows that begins with the kept rows of a matrix, doubling the capacity of the matrix when it has no room, so that rows appended one play at a time are copied a constant number of times on average
+
+    Keyword arguments:
+        matrix_with_capacity: np.ndarray -- a 2D numpy array whose first rows are kept
+        number_of_kept_rows: int -- the number of rows kept
+        number_of_rows: int -- the number of rows that the generated matrix has room for
+
+    Return values:
+        matrix_with_capacity: np.ndarray -- the provided matrix if it has room for the number of rows, or a new matrix with the same data type and order and at least twice as many rows whose first rows are the kept rows
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    if len(matrix_with_capacity) >= number_of_rows:
+        return matrix_with_capacity
+    order = 'F' if matrix_with_capacity.flags.f_contiguous and not matrix_with_capacity.flags.c_contiguous else 'C'
+    generated_matrix = np.empty((max(number_of_rows, 2 * len(matrix_with_capacity)),) + matrix_with_capacity.shape[1:], dtype = matrix_with_capacity.dtype, order = order)
+    generated_matrix[:number_of_kept_rows] = matrix_with_capacity[:number_of_kept_rows]
+    return generated_matrix
+
+def _generate_categorical_type_of_faces(array_of_faces):
+    '''
+    Generates the categorical data type of faces that are strings or other objects, whose categories are the vocabulary of faces that codes index
+
+    Keyword arguments:
+        array_of_faces: np.ndarray -- a 1D numpy array of the distinct faces of all dice
+
+    Return values:
+        categorical_type_of_faces: pd.CategoricalDtype -- a categorical data type whose categories are the faces in order, or None if the faces are numbers or booleans, which a numpy array already holds compactly
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    if array_of_faces.dtype.kind not in 'OSU':
+        return None
+    return pd.CategoricalDtype(array_of_faces)
+
+def _generate_data_frame_of_rolls_dice_and_faces(matrix_of_rolled_faces, index_of_first_roll, categorical_type_of_faces = None):
+    '''
+    Generates a data frame of rolls, dice, and faces in narrow form from a matrix of rolled faces, with one reshape instead of stacking a data frame of rolls and dice
+
+    Keyword arguments:
+        matrix_of_rolled_faces: np.ndarray -- a 2D numpy array of rolled faces, or of their codes if a categorical data type is provided, where the number of rows is the number of rolls and the number of columns is the number of dice
+        index_of_first_roll: int -- the roll index of the first row of the matrix
+        categorical_type_of_faces: pd.CategoricalDtype -- the categorical data type of the faces whose codes the matrix holds, as generated by _generate_categorical_type_of_faces. Defaults to None, for a matrix of faces.
+
+    Return values:
+        data_frame_of_rolls_dice_and_faces: pd.DataFrame -- a data frame with a face column, whose rows are indexed by roll index and die index in the order of the rows of the matrix and then the dice, as stack would index them
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    number_of_rolls, number_of_dice = matrix_of_rolled_faces.shape
+    # The levels are ranges, so the index is described by its codes without building tuples or checking the integrity of the codes.
+    multi_index_of_rolls_and_dice = pd.MultiIndex(
+        levels = [pd.RangeIndex(index_of_first_roll, index_of_first_roll + number_of_rolls), pd.RangeIndex(number_of_dice)],
+        codes = [np.repeat(np.arange(number_of_rolls), number_of_dice), np.tile(np.arange(number_of_dice), number_of_rolls)],
+        names = ['roll_index', 'die_index'],
+        verify_integrity = False
+    )
+    array_of_rolled_faces = matrix_of_rolled_faces.ravel(order = 'C')
+    if categorical_type_of_faces is not None:
+        array_of_rolled_faces = pd.Categorical.from_codes(array_of_rolled_faces, dtype = categorical_type_of_faces, validate = False)
+    return pd.DataFrame({'face': array_of_rolled_faces}, index = multi_index_of_rolls_and_dice, copy = False)
 
 class Game:
     '''
-    Encapsulates a list of one or more dice with the same set of faces, a method to play this game by rolling one or more times all dice in the list, and a method to show a data frame of rolls and dice or a data frame of rolls, dice, and faces
+    Encapsulates a list of one or more dice with the same set of faces, a method to play this game by rolling one or more times all dice in the list, and a method to show a data frame of rolls and dice or a data frame of rolls, dice, and faces.
+    Stores rolled faces as codes in one preallocated matrix, in memory or in a file, and builds data frames from that matrix only when they are shown.
 
     Instance variables:
-        _data_frame_of_rolls_and_dice: pd.DataFrame -- a data frame of rolls and dice, where the number of rows and observations is the number of rolls, the number of columns and features is the number of dice, and each cell value is a face rolled
+        _list_of_dice: list -- a list of one or more dice with the same set of faces
+        _this_game_has_been_played: bool -- an indicator of whether this Game object has been played
+        _array_of_faces: np.ndarray -- a 1D numpy array of the faces of all dice, which the codes of rolled faces index
+        _matrix_of_codes_of_rolled_faces: np.ndarray -- a 2D numpy array of unsigned integer codes of rolled faces, where the number of rows is the number of rolls and the number of columns is the number of dice, or None if this Game object stores only counts
+        _matrix_of_codes_with_capacity: np.ndarray -- a 2D numpy array whose first rows are viewed by the matrix of codes and whose other rows are room for appended rolls, or None if this Game object stores only counts
+        _accumulator: Accumulator -- an accumulator of the face totals, jackpot counts, and counts of face combinations of the rolls, or None if this Game object stores the matrix of codes
+        _matrix_of_face_counts: np.ndarray -- a 2D numpy array of unsigned integer counts, where the number of rows is the number of rolls, the number of columns is the number of faces, and each element is the number of dice with a face in a roll, or None if this Game object does not store face counts
+        _matrix_of_face_counts_with_capacity: np.ndarray -- a 2D numpy array whose first rows are viewed by the matrix of face counts and whose other rows are room for appended rolls, or None if this Game object does not store face counts
+        _matrix_of_packed_codes: np.ndarray -- a 2D numpy array with data type np.uint8, where the number of rows is the number of rolls and each row holds the codes of the dice of a roll of two faces packed eight to a byte, or None if this Game object does not store bits
+        _matrix_of_packed_codes_with_capacity: np.ndarray -- a 2D numpy array whose first rows are viewed by the matrix of packed codes and whose other rows are room for appended rolls, or None if this Game object does not store bits
+        _data_frame_of_rolls_and_dice: pd.DataFrame -- a data frame of rolls and dice, where the number of rows and observations is the number of rolls, the number of columns and features is the number of dice, and each cell value is a face rolled, or None if the data frame needs to be built
+        _data_frame_of_rolls_dice_and_faces: pd.DataFrame -- the data frame of rolls and dice in narrow form, with one row per roll and die and a face column, or None if the data frame needs to be built
+        _matrix_of_rolled_faces_with_capacity: np.ndarray -- a 2D numpy array whose first rows are the faces viewed by the data frame of rolls and dice and whose other rows are room for the faces of appended rolls, or None if no faces have been looked up
+        _number_of_rolls_with_faces: int -- the number of rolls whose faces have been looked up into the matrix of rolled faces
+        _block_of_shared_memory: shared_memory.SharedMemory -- the block of shared memory that holds the matrix of codes, or None if the matrix of codes is in private memory
+        _block_of_shared_memory_is_owned: bool -- an indicator of whether this Game object created the block of shared memory and unlinks it when released
+        _finalizer_of_block_of_shared_memory: weakref.finalize -- a finalizer that unlinks the block of shared memory when this Game object is garbage-collected without being released, or None if this Game object does not own a block of shared memory
+        _path_of_file: str -- the path to the memory-mapped file that holds the matrix of codes, or None if the matrix of codes is in memory
+        _dictionary_of_metadata: dict -- the fingerprints of the dice, the seed, and the chunk size of the last play that did not append, or None if they are unknown
+        _store: str -- the store of the last play, or None if this Game object has not been played
+        _dictionary_of_indices_and_seed_sequences: dict -- a dictionary mapping the index of the first die of each group of dice with equal fingerprints to the seed sequence of its stream of chunks, which appended plays continue
+        _index_of_next_chunk: int -- the index in each stream of the first chunk of the next appended play
+        _version: int -- a number that increases whenever the rolls of this Game object are replaced rather than appended to
 
     Public methods:
         __init__
+        attach
+        open
         play
+        release
+        get_array_of_faces
+        get_matrix_of_codes
+        get_accumulator
+        get_matrix_of_face_counts
+        get_matrix_of_packed_codes
+        get_number_of_rolls
+        get_number_of_dice
+        get_version
+        get_name_of_shared_memory
+        get_path_of_file
+        get_metadata
         show
+        iter_narrow
     '''
 
     def __init__(self, list_of_dice):
@@ -39,50 +423,622 @@ class Game:
 
         self._list_of_dice = list_of_dice
         self._this_game_has_been_played = False
+        self._matrix_of_codes_of_rolled_faces = None
+        self._matrix_of_codes_with_capacity = None
+        self._data_frame_of_rolls_and_dice = None
+        self._data_frame_of_rolls_dice_and_faces = None
+        self._matrix_of_rolled_faces_with_capacity = None
+        self._number_of_rolls_with_faces = 0
+        self._block_of_shared_memory = None
+        self._block_of_shared_memory_is_owned = False
+        self._finalizer_of_block_of_shared_memory = None
+        self._accumulator = None
+        self._matrix_of_face_counts = None
+        self._matrix_of_face_counts_with_capacity = None
+        self._matrix_of_packed_codes = None
+        self._matrix_of_packed_codes_with_capacity = None
+        self._path_of_file = None
+        self._dictionary_of_metadata = None
+        self._store = None
+        self._dictionary_of_indices_and_seed_sequences = {}
+        self._index_of_next_chunk = 0
+        self._version = 0
 
-    def play(self, number_of_rolls):
+    @classmethod
+    def attach(cls, name_of_shared_memory):
         '''
-        Plays by rolling one or more times all dice in this Game object's list of one or more dice with the same set of faces
+        Creates a Game object that views the matrix of codes of a game played in shared memory by another Game object, possibly in another process, without copying it
+
+        Keyword arguments:
+            name_of_shared_memory: str -- the name of the block of shared memory, as provided by get_name_of_shared_memory
+
+        Return values:
+            game: Game -- a Game object without dice that may be shown and analyzed but not played
+
+        Side effects:
+            Maps the block of shared memory into this process without letting this process unlink it, leaving the registration of the block with the resource tracker to the process that created it when this process shares that resource tracker
+
+        Exceptions raised:
+            FileNotFoundError, if no block of shared memory has the name
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = cls([])
+        game._block_of_shared_memory, game._array_of_faces, game._matrix_of_codes_of_rolled_faces = attach_shared_matrix_of_codes(name_of_shared_memory)
+        game._matrix_of_codes_with_capacity = game._matrix_of_codes_of_rolled_faces
+        game._store = 'codes'
+        game._this_game_has_been_played = True
+        return game
+
+    @classmethod
+    def open(cls, path_to_file):
+        '''
+        Creates a Game object that maps the matrix of codes of a game played into a file by another Game object, possibly in an earlier process, without reading it into memory
+
+        Keyword arguments:
+            path_to_file: str -- the path to the file, as provided by get_path_of_file
+
+        Return values:
+            game: Game -- a Game object without dice that may be shown and analyzed but not played
+
+        Side effects:
+            Maps the file into this process for reading only
+
+        Exceptions raised:
+            FileNotFoundError, if no file has the path
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = cls([])
+        game._array_of_faces, game._matrix_of_codes_of_rolled_faces, game._dictionary_of_metadata = open_memory_mapped_matrix_of_codes(path_to_file)
+        game._matrix_of_codes_with_capacity = game._matrix_of_codes_of_rolled_faces
+        game._path_of_file = path_to_file
+        game._store = 'codes'
+        game._this_game_has_been_played = True
+        return game
+
+    def play(self, number_of_rolls, seed = None, order = 'C', workers = 1, chunk_size = None, shared_memory = False, store = None, path_to_file = None, append = False):
+        '''
+        Plays by rolling one or more times all dice in this Game object's list of one or more dice with the same set of faces.
+        Dice with equal fingerprints share one sampler and are rolled together, filling their columns row by row.
+        The rolls are split into chunks of rows, and the chunk of each group of dice is rolled with its own random number generator derived from a seed sequence, so that chunks may be rolled in any order by any number of processes with bit-identical results.
+        Codes of rolled faces are either written into one preallocated matrix with the smallest unsigned integer data type that can index all faces, or accumulated into face totals, jackpot counts, and counts of face combinations chunk by chunk and discarded, or, for dice with two faces, packed one bit per die.
+        When only counts are stored and all dice are identical and many more than the faces, no die is rolled; the face counts of each roll are drawn from a multinomial distribution instead.
 
         Keyword arguments:
             number_of_rolls: int -- An integer
+            seed: None, int, np.random.SeedSequence, np.random.Generator -- a seed from which one statistically independent seed sequence per die is spawned, so that the play is reproducible. The dice with equal fingerprints are rolled with the seed sequence of the first of them. Defaults to None, for rolling the dice with equal fingerprints with a seed sequence spawned from the random number generator of the first of them.
+            order: str -- 'C' for a matrix of codes in which the codes of one roll are contiguous, or 'F' for a matrix of codes in which the codes of one die are contiguous. Defaults to 'C'.
+            workers: int -- the number of processes that roll chunks, where 1 rolls all chunks in this process. Does not change the rolled faces. Defaults to 1.
+            chunk_size: int -- the approximate number of codes in a chunk, which is rounded down to a whole number of rows. Changes the rolled faces. Defaults to None, for the chunk size of the last play when appending and 1048576 otherwise.
+            shared_memory: bool -- an indicator of whether the matrix of codes is placed in a block of shared memory, which other processes may attach to by name. The matrix of codes is always placed in shared memory when more than one worker plays, so that workers write their chunks into it directly. Defaults to False.
+            store: str -- 'codes' to store the matrix of codes of rolled faces, 'counts' to store only an accumulator of face totals, jackpot counts, and counts of face combinations, whose memory does not grow with the number of rolls, 'face_counts' to store that accumulator and a matrix of the number of dice with each face in each roll, or 'bits' to store that accumulator and the codes of a game of two faces packed eight to a byte, which takes one eighth of the memory of codes and whose face counts are counts of bits. The same seed rolls the same faces for all, unless face counts are drawn from a multinomial distribution, which has the same distribution but not the same faces. Defaults to None, for the store of the last play when appending and 'codes' otherwise.
+            path_to_file: str -- the path to a file into which the matrix of codes is written through a memory map, with a header holding the faces, the fingerprints of the dice, the seed, and the chunk size, so that a game larger than memory may be played and reopened with open. Workers write their chunks into the file directly. Defaults to None, for a matrix of codes in memory.
+            append: bool -- an indicator of whether the rolls are appended to the rolls of the last play instead of replacing them. Appended rolls continue the streams of random numbers of the last play with its store, chunk size, order, and file, so no seed, other store, or other chunk size may be provided, and the matrix of codes or face counts grows geometrically, so that earlier rolls are rolled once and copied a constant number of times on average, or not at all in a file. Appending to a game that has not been played plays it. Defaults to False.
 
         Return values:
             none
 
         Side effects:
-            Creates a data frame of rolls and dice, where the number of rows and observations is the number of rolls, the number of columns and features is the number of dice, and each cell value is a face rolled
+            Releases the matrix of codes of the last play of this Game object and increases its version, unless rolls are appended
+            Creates or grows a matrix of codes of rolled faces, where the number of rows is the number of rolls, the number of columns is the number of dice, and each element is the code of a face rolled, in private or shared memory or in a file, or an accumulator of the rolls and possibly a matrix of face counts or of packed codes
+            Indicates that the data frame of rolls and dice of this Game object needs to be built
+            Advances the spawn counter of the seed sequence of the random number generator of the first die of each group of dice if no seed is provided
         
         Exceptions raised:
-            none
+            ValueError, if the order is neither C nor F, if the number of workers or the chunk size is not positive, if the store is not codes, counts, face_counts, or bits, if bits are stored for faces other than two, if a path to a file is provided with shared memory or without storing codes, or if rolls are appended with a seed, with another store or chunk size, by other dice, to shared memory, to another file, or by more than one worker to a matrix of codes in private memory
+            OSError, if the file cannot be created
 
         Restrictions on when this method can be called:
             none
         '''
 
-        self._data_frame_of_rolls_and_dice = pd.DataFrame()
-        self._data_frame_of_rolls_and_dice.index.rename('roll_index', inplace = True)
+        if append and self._this_game_has_been_played:
+            chunk_size_of_last_play = None if self._dictionary_of_metadata is None else self._dictionary_of_metadata.get('chunk_size')
+            if store is None:
+                store = self._store
+            if chunk_size is None:
+                chunk_size = chunk_size_of_last_play
+        if store is None:
+            store = 'codes'
+        if chunk_size is None:
+            chunk_size = 1048576
+        if order not in ('C', 'F'):
+            raise ValueError('the order of the matrix of codes must be either C or F')
+        if workers <= 0:
+            raise ValueError('the number of workers must be positive')
+        if chunk_size <= 0:
+            raise ValueError('the chunk size must be positive')
+        if store not in ('codes', 'counts', 'face_counts', 'bits'):
+            raise ValueError('the store of a game must be codes, counts, face_counts, or bits')
+        if path_to_file is not None and (shared_memory or store != 'codes'):
+            raise ValueError('only a matrix of codes in private memory may be written into a file')
+        dictionary_of_faces_and_codes = {}
+        for die in self._list_of_dice:
+            for face in die.get_array_of_faces().tolist():
+                dictionary_of_faces_and_codes.setdefault(face, len(dictionary_of_faces_and_codes))
+        type_of_face = np.result_type(*[die.get_array_of_faces() for die in self._list_of_dice])
+        array_of_faces = np.array(list(dictionary_of_faces_and_codes), dtype = type_of_face)
+        type_of_code = get_smallest_unsigned_integer_type(len(array_of_faces))
+        if store == 'bits' and len(array_of_faces) != 2:
+            raise ValueError('only the codes of a game of two faces may be stored as bits')
+        dictionary_of_fingerprints_and_lists_of_indices_of_dice = {}
         for i in range(0, len(self._list_of_dice)):
-            die = self._list_of_dice[i]
-            self._data_frame_of_rolls_and_dice[i] = die.roll(number_of_rolls)
+            dictionary_of_fingerprints_and_lists_of_indices_of_dice.setdefault(self._list_of_dice[i].get_fingerprint(), []).append(i)
+        if append and self._this_game_has_been_played:
+            if seed is not None:
+                raise ValueError('a seed may not be provided when appending, since appended rolls continue the streams of the played rolls')
+            if store != self._store:
+                raise ValueError('rolls may be appended only to a game played with the same store')
+            if chunk_size_of_last_play is not None and chunk_size != chunk_size_of_last_play:
+                raise ValueError('rolls may be appended only with the chunk size of the game')
+            if self._dictionary_of_metadata is None or [die.get_fingerprint().hex() for die in self._list_of_dice] != self._dictionary_of_metadata['fingerprints']:
+                raise ValueError('rolls may be appended only by the dice that played the game')
+            if self._block_of_shared_memory is not None:
+                raise ValueError('rolls may not be appended to a matrix of codes in shared memory')
+            if path_to_file not in (None, self._path_of_file):
+                raise ValueError('rolls may be appended only to the file of the game')
+            if store == 'codes' and self._path_of_file is None and workers > 1:
+                raise ValueError('rolls may be appended by more than one worker only to a matrix of codes in a file')
+            number_of_kept_rolls = self.get_number_of_rolls()
+            number_of_rolls_after_play = number_of_kept_rolls + number_of_rolls
+            if store == 'codes' and self._path_of_file is not None:
+                number_of_rolls_of_capacity = max(number_of_rolls_after_play, 2 * len(self._matrix_of_codes_with_capacity)) if len(self._matrix_of_codes_with_capacity) < number_of_rolls_after_play else len(self._matrix_of_codes_with_capacity)
+                self._matrix_of_codes_with_capacity = extend_memory_mapped_matrix_of_codes(self._path_of_file, number_of_rolls_after_play, number_of_rolls_of_capacity)
+            elif store == 'codes':
+                self._matrix_of_codes_with_capacity = _generate_matrix_with_capacity(self._matrix_of_codes_with_capacity, number_of_kept_rolls, number_of_rolls_after_play)
+            elif store == 'face_counts':
+                self._matrix_of_face_counts_with_capacity = _generate_matrix_with_capacity(self._matrix_of_face_counts_with_capacity, number_of_kept_rolls, number_of_rolls_after_play)
+            elif store == 'bits':
+                self._matrix_of_packed_codes_with_capacity = _generate_matrix_with_capacity(self._matrix_of_packed_codes_with_capacity, number_of_kept_rolls, number_of_rolls_after_play)
+            path_to_file = self._path_of_file
+        else:
+            self.release()
+            self._version += 1
+            self._array_of_faces = array_of_faces
+            number_of_kept_rolls = 0
+            number_of_rolls_after_play = number_of_rolls
+            self._dictionary_of_metadata = {'fingerprints': [die.get_fingerprint().hex() for die in self._list_of_dice], 'seed': None, 'chunk_size': chunk_size}
+            if seed is not None:
+                seed_sequence_of_game = generate_seed_sequence(seed)
+                self._dictionary_of_metadata['seed'] = {'entropy': seed_sequence_of_game.entropy, 'spawn_key': list(seed_sequence_of_game.spawn_key), 'number_of_children_spawned': seed_sequence_of_game.n_children_spawned}
+                list_of_seed_sequences = seed_sequence_of_game.spawn(len(self._list_of_dice))
+            for list_of_indices_of_dice in dictionary_of_fingerprints_and_lists_of_indices_of_dice.values():
+                index_of_die = list_of_indices_of_dice[0]
+                self._dictionary_of_indices_and_seed_sequences[index_of_die] = generate_seed_sequence(self._list_of_dice[index_of_die].get_generator()) if seed is None else list_of_seed_sequences[index_of_die]
+            self._index_of_next_chunk = 0
+            self._store = store
+            if store != 'codes':
+                self._accumulator = Accumulator(len(self._array_of_faces), len(self._list_of_dice), type_of_code)
+                if store == 'face_counts':
+                    self._matrix_of_face_counts_with_capacity = np.empty((number_of_rolls, len(self._array_of_faces)), dtype = get_smallest_unsigned_integer_type(len(self._list_of_dice) + 1))
+                elif store == 'bits':
+                    self._matrix_of_packed_codes_with_capacity = np.empty((number_of_rolls, -(-len(self._list_of_dice) // 8)), dtype = np.uint8)
+            elif path_to_file is not None:
+                self._matrix_of_codes_with_capacity = create_memory_mapped_matrix_of_codes(path_to_file, self._array_of_faces, (number_of_rolls, len(self._list_of_dice)), type_of_code, order, self._dictionary_of_metadata)
+                self._path_of_file = path_to_file
+            elif shared_memory or workers > 1:
+                self._block_of_shared_memory, self._matrix_of_codes_with_capacity = create_shared_matrix_of_codes(self._array_of_faces, (number_of_rolls, len(self._list_of_dice)), type_of_code, order)
+                self._block_of_shared_memory_is_owned = True
+                self._finalizer_of_block_of_shared_memory = weakref.finalize(self, self._block_of_shared_memory.unlink)
+            else:
+                self._matrix_of_codes_with_capacity = np.empty((number_of_rolls, len(self._list_of_dice)), dtype = type_of_code, order = order)
+        if store == 'codes':
+            self._matrix_of_codes_of_rolled_faces = self._matrix_of_codes_with_capacity[:number_of_rolls_after_play]
+        elif store == 'face_counts':
+            self._matrix_of_face_counts = self._matrix_of_face_counts_with_capacity[:number_of_rolls_after_play]
+        elif store == 'bits':
+            self._matrix_of_packed_codes = self._matrix_of_packed_codes_with_capacity[:number_of_rolls_after_play]
+        # All groups of dice share the rows of each chunk, so that a chunk of rows of all dice may be accumulated at once.
+        number_of_rolls_per_chunk = max(1, chunk_size // len(self._list_of_dice))
+        # Each chunk is described by the index of the die that rolls it, its seed sequence, its index, its first row, its number of rows, and the columns it fills.
+        list_of_chunks = []
+        dictionary_of_indices_and_arrays_of_codes_of_faces = {}
+        for list_of_indices_of_dice in dictionary_of_fingerprints_and_lists_of_indices_of_dice.values():
+            index_of_die = list_of_indices_of_dice[0]
+            seed_sequence = self._dictionary_of_indices_and_seed_sequences[index_of_die]
+            list_of_faces_of_die = self._list_of_dice[index_of_die].get_array_of_faces().tolist()
+            if list_of_faces_of_die != self._array_of_faces.tolist():
+                dictionary_of_indices_and_arrays_of_codes_of_faces[index_of_die] = np.array([dictionary_of_faces_and_codes[face] for face in list_of_faces_of_die], dtype = type_of_code)
+            # Appended chunks continue the stream of each group of dice after the chunks already rolled, so that no random numbers are reused.
+            for index_of_chunk, index_of_first_roll in enumerate(range(number_of_kept_rolls, number_of_rolls_after_play, number_of_rolls_per_chunk), start = self._index_of_next_chunk):
+                number_of_rolls_in_chunk = min(number_of_rolls_per_chunk, number_of_rolls_after_play - index_of_first_roll)
+                list_of_chunks.append((index_of_die, seed_sequence, index_of_chunk, index_of_first_roll, number_of_rolls_in_chunk, list_of_indices_of_dice))
+        self._index_of_next_chunk += -(-number_of_rolls // number_of_rolls_per_chunk)
+        if store == 'bits':
+            dictionary_of_indices_and_lists_of_chunks = {}
+            for chunk in list_of_chunks:
+                dictionary_of_indices_and_lists_of_chunks.setdefault(chunk[2], []).append(chunk)
+            list_of_lists_of_chunks_of_rows = list(dictionary_of_indices_and_lists_of_chunks.values())
+            if workers == 1 or len(list_of_lists_of_chunks_of_rows) <= 1:
+                for list_of_chunks_of_rows in list_of_lists_of_chunks_of_rows:
+                    index_of_first_roll = list_of_chunks_of_rows[0][3]
+                    matrix_of_packed_codes = _accumulate_and_pack_chunks_of_rows(self._accumulator, self._list_of_dice, list_of_chunks_of_rows, dictionary_of_indices_and_arrays_of_codes_of_faces)
+                    self._matrix_of_packed_codes[index_of_first_roll:index_of_first_roll + len(matrix_of_packed_codes)] = matrix_of_packed_codes
+            else:
+                with ProcessPoolExecutor(max_workers = workers, initializer = _initialize_worker, initargs = (self._list_of_dice, None, None, dictionary_of_indices_and_arrays_of_codes_of_faces)) as executor:
+                    for list_of_chunks_of_rows, (accumulator, matrix_of_packed_codes) in zip(list_of_lists_of_chunks_of_rows, executor.map(_accumulate_and_pack_chunks_of_rows_in_worker, list_of_lists_of_chunks_of_rows)):
+                        self._accumulator.merge(accumulator)
+                        index_of_first_roll = list_of_chunks_of_rows[0][3]
+                        self._matrix_of_packed_codes[index_of_first_roll:index_of_first_roll + len(matrix_of_packed_codes)] = matrix_of_packed_codes
+        elif store != 'codes':
+            face_counts_are_drawn = len(dictionary_of_fingerprints_and_lists_of_indices_of_dice) == 1 and len(self._list_of_dice) >= minimum_number_of_dice_per_face_for_drawing_face_counts * len(self._array_of_faces)
+            face_counts_are_kept = store == 'face_counts'
+            dictionary_of_indices_and_lists_of_chunks = {}
+            for chunk in list_of_chunks:
+                dictionary_of_indices_and_lists_of_chunks.setdefault(chunk[2], []).append(chunk)
+            if workers == 1 or len(dictionary_of_indices_and_lists_of_chunks) <= 1:
+                for list_of_chunks_of_rows in dictionary_of_indices_and_lists_of_chunks.values():
+                    matrix_of_face_counts = _accumulate_chunks_of_rows(self._accumulator, self._list_of_dice, list_of_chunks_of_rows, dictionary_of_indices_and_arrays_of_codes_of_faces, type_of_code, face_counts_are_drawn, face_counts_are_kept)
+                    if face_counts_are_kept:
+                        index_of_first_roll = list_of_chunks_of_rows[0][3]
+                        self._matrix_of_face_counts[index_of_first_roll:index_of_first_roll + len(matrix_of_face_counts)] = matrix_of_face_counts
+            else:
+                with ProcessPoolExecutor(max_workers = workers, initializer = _initialize_worker, initargs = (self._list_of_dice, None, None, dictionary_of_indices_and_arrays_of_codes_of_faces)) as executor:
+                    list_of_lists_of_chunks_of_rows = list(dictionary_of_indices_and_lists_of_chunks.values())
+                    for list_of_chunks_of_rows, (accumulator, matrix_of_face_counts) in zip(list_of_lists_of_chunks_of_rows, executor.map(_accumulate_chunks_of_rows_in_worker, list_of_lists_of_chunks_of_rows, itertools.repeat(len(self._array_of_faces)), itertools.repeat(type_of_code), itertools.repeat(face_counts_are_drawn), itertools.repeat(face_counts_are_kept))):
+                        self._accumulator.merge(accumulator)
+                        if face_counts_are_kept:
+                            index_of_first_roll = list_of_chunks_of_rows[0][3]
+                            self._matrix_of_face_counts[index_of_first_roll:index_of_first_roll + len(matrix_of_face_counts)] = matrix_of_face_counts
+        elif workers == 1 or len(list_of_chunks) <= 1:
+            for chunk in list_of_chunks:
+                _roll_and_write_chunk(self._matrix_of_codes_of_rolled_faces, self._list_of_dice[chunk[0]], chunk, dictionary_of_indices_and_arrays_of_codes_of_faces.get(chunk[0]))
+        else:
+            # Workers write their chunks directly into the block of shared memory or the file, so that no rolled codes are pickled.
+            name_of_shared_memory = None if self._block_of_shared_memory is None else self._block_of_shared_memory.name
+            with ProcessPoolExecutor(max_workers = workers, initializer = _initialize_worker, initargs = (self._list_of_dice, name_of_shared_memory, path_to_file, dictionary_of_indices_and_arrays_of_codes_of_faces)) as executor:
+                for _ in executor.map(_roll_and_write_chunk_in_worker, list_of_chunks):
+                    pass
+        if isinstance(self._matrix_of_codes_of_rolled_faces, np.memmap):
+            self._matrix_of_codes_of_rolled_faces.flush()
+        self._data_frame_of_rolls_and_dice = None
+        self._data_frame_of_rolls_dice_and_faces = None
         self._this_game_has_been_played = True
 
+    def release(self):
+        '''
+        Releases the matrix of codes of this Game object, unlinking its block of shared memory if this Game object created it, or unmapping its file, which is kept
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Discards the matrix of codes or accumulator and matrix of face counts, their room for appended rolls, and the data frames of rolls and dice of this Game object and indicates that this Game object has not been played
+            Unlinks the block of shared memory of this Game object if this Game object created it, which is closed once no view of its matrix of codes, such as a data frame provided by show('codes'), is referenced
+            Flushes the matrix of codes of this Game object to its file, if any
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if isinstance(self._matrix_of_codes_of_rolled_faces, np.memmap) and self._matrix_of_codes_of_rolled_faces.flags.writeable:
+            self._matrix_of_codes_of_rolled_faces.flush()
+        self._matrix_of_codes_of_rolled_faces = None
+        self._matrix_of_codes_with_capacity = None
+        self._accumulator = None
+        self._matrix_of_face_counts = None
+        self._matrix_of_face_counts_with_capacity = None
+        self._matrix_of_packed_codes = None
+        self._matrix_of_packed_codes_with_capacity = None
+        self._data_frame_of_rolls_and_dice = None
+        self._data_frame_of_rolls_dice_and_faces = None
+        self._matrix_of_rolled_faces_with_capacity = None
+        self._number_of_rolls_with_faces = 0
+        self._this_game_has_been_played = False
+        self._path_of_file = None
+        self._store = None
+        self._dictionary_of_indices_and_seed_sequences = {}
+        if self._block_of_shared_memory is not None:
+            if self._block_of_shared_memory_is_owned:
+                self._finalizer_of_block_of_shared_memory.detach()
+                self._block_of_shared_memory.unlink()
+            self._block_of_shared_memory = None
+            self._block_of_shared_memory_is_owned = False
+            self._finalizer_of_block_of_shared_memory = None
+
+    def get_array_of_faces(self):
+        '''
+        Gets the faces of all dice of this Game object, which the codes of rolled faces index
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _array_of_faces: np.ndarray -- a 1D numpy array of the faces of the first die followed by any other faces of the other dice
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        return self._array_of_faces
+
+    def get_matrix_of_codes(self):
+        '''
+        Gets the codes of rolled faces of this Game object without copying them, or unpacks them if this game stores bits
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _matrix_of_codes_of_rolled_faces: np.ndarray -- a 2D numpy array of unsigned integer codes of rolled faces, where the number of rows is the number of rolls, the number of columns is the number of dice, and each code indexes the array of faces provided by get_array_of_faces. A game that stores bits provides a new matrix of codes unpacked from its bits.
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+            ValueError if this game stores only counts
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        if self._matrix_of_packed_codes is not None:
+            return np.unpackbits(self._matrix_of_packed_codes, axis = 1, count = len(self._list_of_dice))
+        if self._matrix_of_codes_of_rolled_faces is None:
+            raise ValueError('this game stores only counts of its rolls')
+        return self._matrix_of_codes_of_rolled_faces
+
+    def get_accumulator(self):
+        '''
+        Gets the accumulator of the face totals, jackpot counts, and counts of face combinations of the rolls of this Game object
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _accumulator: Accumulator -- the accumulator of this Game object, or None if this game stores the matrix of codes of its rolls
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        return self._accumulator
+
+    def get_matrix_of_face_counts(self):
+        '''
+        Gets the number of dice with each face in each roll of this Game object
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _matrix_of_face_counts: np.ndarray -- a 2D numpy array of unsigned integer counts, where the number of rows is the number of rolls, the number of columns is the number of faces, and the count at a column is that of the face at the same index of the array of faces provided by get_array_of_faces, or None if this game does not store face counts or bits
+
+        Side effects:
+            Counts the bits of each roll of a game that stores bits, which are the counts of its second face
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        if self._matrix_of_packed_codes is not None:
+            array_of_numbers_of_second_faces = count_bits_of_rows(self._matrix_of_packed_codes).astype(get_smallest_unsigned_integer_type(len(self._list_of_dice) + 1))
+            return np.column_stack((len(self._list_of_dice) - array_of_numbers_of_second_faces, array_of_numbers_of_second_faces))
+        return self._matrix_of_face_counts
+
+    def get_matrix_of_packed_codes(self):
+        '''
+        Gets the codes of rolled faces of this Game object packed into bits without copying them
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _matrix_of_packed_codes: np.ndarray -- a 2D numpy array with data type np.uint8, where the number of rows is the number of rolls and each row holds the codes of the dice of a roll packed eight to a byte by np.packbits, so that the code of the die at index i is bit 7 - i % 8 of byte i // 8 and the remaining bits of the last byte are zero, or None if this game does not store bits
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        return self._matrix_of_packed_codes
+
+    def get_number_of_rolls(self):
+        '''
+        Gets the number of rolls of this Game object, which is the high-water mark below which appended plays do not change rolls
+
+        Keyword arguments:
+            none
+
+        Return values:
+            number_of_rolls: int -- the number of rolls played and appended since the rolls were last replaced
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        if self._matrix_of_codes_of_rolled_faces is not None:
+            return len(self._matrix_of_codes_of_rolled_faces)
+        return self._accumulator.get_number_of_rolls()
+
+    def get_number_of_dice(self):
+        '''
+        Gets the number of dice of this Game object, which is the number of faces in each roll
+
+        Keyword arguments:
+            none
+
+        Return values:
+            number_of_dice: int -- the number of columns of the matrix of codes of this Game object if it has one, as for a game created by open or attach, which has no dice, or otherwise the number of dice in its list of dice
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if self._matrix_of_codes_of_rolled_faces is not None:
+            return self._matrix_of_codes_of_rolled_faces.shape[1]
+        return len(self._list_of_dice)
+
+    def get_version(self):
+        '''
+        Gets the version of the rolls of this Game object, so that a consumer that has processed the rolls below a number of rolls may process only the rolls appended after them while the version is unchanged
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _version: int -- a number that increases whenever the rolls of this Game object are replaced rather than appended to
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        return self._version
+
+    def get_name_of_shared_memory(self):
+        '''
+        Gets the name of the block of shared memory that holds the matrix of codes of this Game object, by which other processes may attach to it
+
+        Keyword arguments:
+            none
+
+        Return values:
+            name_of_shared_memory: str -- the name of the block of shared memory, or None if the matrix of codes is in private memory
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        if self._block_of_shared_memory is None:
+            return None
+        return self._block_of_shared_memory.name
+
+    def get_path_of_file(self):
+        '''
+        Gets the path to the file that holds the matrix of codes of this Game object, by which later processes may open it
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _path_of_file: str -- the path to the file, or None if the matrix of codes is in memory
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        return self._path_of_file
+
+    def get_metadata(self):
+        '''
+        Gets the description of the last play of this Game object
+
+        Keyword arguments:
+            none
+
+        Return values:
+            _dictionary_of_metadata: dict -- a dictionary whose key fingerprints maps to the hexadecimal fingerprints of the dice, whose key seed maps to the entropy, spawn key, and number of children spawned of the seed sequence of the play or to None if no seed was provided, and whose key chunk_size maps to the chunk size, or None if this game was attached to shared memory
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        return self._dictionary_of_metadata
+
     def show(self, form):
         '''
         Displays and provides the data frame of rolls and dice of this Game object
 
         Keyword arguments:
-            form: str -- narrow or wide
+            form: str -- narrow, wide, or codes
 
         Return values:
-            the data frame of rolls and dice of this Game object or a version of that data frame in narrow form
+            the data frame of rolls and dice of this Game object, a version of that data frame in narrow form, or a data frame of rolls and dice whose cell values are codes of faces rolled and which views the matrix of codes of this Game object without copying it, or views codes unpacked from the bits of this Game object
 
         Side effects:
+            Builds the data frame of rolls and dice of this Game object, with one vectorized lookup of the faces of all codes, or of the codes appended since it was last built, if it needs to be built, and caches it unless the matrix of codes is in a file. Faces that are strings or other objects are provided as categorical columns whose categories are the faces of the game and whose codes take one or two bytes per cell, instead of one Python object per cell.
+            Builds the data frame in narrow form by reshaping the faces under a multi-index of roll and die indices, if it is requested and needs to be built, and caches it until the next play unless the matrix of codes is in a file
             Displays the data frame of rolls and dice of this Game object or a version of that data frame in narrow form
 
         Exceptions raised:
             AssertionError if this game has not been played
-            ValueError if the provided form is neither narrow nor wide
+            ValueError if the provided form is not narrow, wide, or codes, or if this game stores only counts
 
         Restrictions on when this method can be called:
             none
@@ -90,13 +1046,118 @@ class Game:
 
         if not self._this_game_has_been_played:
             raise AssertionError('this game has not been played')
+        if self._matrix_of_codes_of_rolled_faces is None and self._matrix_of_packed_codes is None:
+            raise ValueError('this game stores only counts of its rolls')
+        if form not in ('narrow', 'wide', 'codes'):
+            raise ValueError('the form of the data frame of rolls and dice must be narrow, wide, or codes')
+        if form == 'narrow' and self._data_frame_of_rolls_dice_and_faces is not None:
+            return self._data_frame_of_rolls_dice_and_faces
+        if form == 'wide' and self._data_frame_of_rolls_and_dice is not None:
+            return self._data_frame_of_rolls_and_dice
+        # Bits are unpacked into codes only when a data frame needs to be built from them.
+        matrix_of_codes_of_rolled_faces = self.get_matrix_of_codes()
+        if form == 'codes':
+            return pd.DataFrame(matrix_of_codes_of_rolled_faces, index = pd.RangeIndex(len(matrix_of_codes_of_rolled_faces), name = 'roll_index'), copy = False)
+        categorical_type_of_faces = _generate_categorical_type_of_faces(self._array_of_faces)
+        data_frame_of_rolls_and_dice = self._data_frame_of_rolls_and_dice
+        if data_frame_of_rolls_and_dice is None and categorical_type_of_faces is not None:
+            # Each column converts the codes of its die to the narrowest signed codes of the categories, without looking up any face.
+            dictionary_of_indices_and_columns_of_faces = {
+                index_of_die: pd.Categorical.from_codes(matrix_of_codes_of_rolled_faces[:, index_of_die], dtype = categorical_type_of_faces, validate = False)
+                for index_of_die in range(matrix_of_codes_of_rolled_faces.shape[1])
+            }
+            data_frame_of_rolls_and_dice = pd.DataFrame(dictionary_of_indices_and_columns_of_faces, index = pd.RangeIndex(len(matrix_of_codes_of_rolled_faces), name = 'roll_index'))
+            if self._path_of_file is None:
+                self._data_frame_of_rolls_and_dice = data_frame_of_rolls_and_dice
+        elif data_frame_of_rolls_and_dice is None:
+            number_of_rolls = len(matrix_of_codes_of_rolled_faces)
+            if self._matrix_of_rolled_faces_with_capacity is None or self._path_of_file is not None:
+                # Keeps the order of the matrix of codes, so that the data frame views the matrix of faces without copying it.
+                order = 'F' if matrix_of_codes_of_rolled_faces.flags.f_contiguous and not matrix_of_codes_of_rolled_faces.flags.c_contiguous else 'C'
+                matrix_of_rolled_faces_with_capacity = np.empty(matrix_of_codes_of_rolled_faces.shape, dtype = self._array_of_faces.dtype, order = order)
+                number_of_rolls_with_faces = 0
+            else:
+                # Looks up only the faces of rolls appended since the faces were last looked up.
+                matrix_of_rolled_faces_with_capacity = _generate_matrix_with_capacity(self._matrix_of_rolled_faces_with_capacity, self._number_of_rolls_with_faces, number_of_rolls)
+                number_of_rolls_with_faces = self._number_of_rolls_with_faces
+            matrix_of_rolled_faces = matrix_of_rolled_faces_with_capacity[:number_of_rolls]
+            np.take(self._array_of_faces, matrix_of_codes_of_rolled_faces[number_of_rolls_with_faces:], out = matrix_of_rolled_faces[number_of_rolls_with_faces:])
+            data_frame_of_rolls_and_dice = pd.DataFrame(matrix_of_rolled_faces, index = pd.RangeIndex(number_of_rolls, name = 'roll_index'), copy = False)
+            # The faces of a game in a file may not fit in memory, so they are not kept after they are shown.
+            if self._path_of_file is None:
+                self._data_frame_of_rolls_and_dice = data_frame_of_rolls_and_dice
+                self._matrix_of_rolled_faces_with_capacity = matrix_of_rolled_faces_with_capacity
+                self._number_of_rolls_with_faces = number_of_rolls
         if form == 'narrow':
-            data_frame_of_rolls_dice_and_faces = self._data_frame_of_rolls_and_dice.stack().to_frame('face')
-            data_frame_of_rolls_dice_and_faces.index.rename(['roll_index', 'die_index'], inplace = True)
+            if categorical_type_of_faces is None:
+                data_frame_of_rolls_dice_and_faces = _generate_data_frame_of_rolls_dice_and_faces(data_frame_of_rolls_and_dice.to_numpy(), 0)
+            else:
+                data_frame_of_rolls_dice_and_faces = _generate_data_frame_of_rolls_dice_and_faces(matrix_of_codes_of_rolled_faces, 0, categorical_type_of_faces)
+            if self._path_of_file is None:
+                self._data_frame_of_rolls_dice_and_faces = data_frame_of_rolls_dice_and_faces
             #print(data_frame_of_rolls_dice_and_faces)
             return data_frame_of_rolls_dice_and_faces
-        elif form == 'wide':
-            #print(self._data_frame_of_rolls_and_dice)
-            return self._data_frame_of_rolls_and_dice
-        else:
-            raise ValueError('the form of the data frame of rolls and dice must be either narrow or wide')
\ No newline at end of file
+        #print(data_frame_of_rolls_and_dice)
+        return data_frame_of_rolls_and_dice
+
+    def iter_narrow(self, chunk_size = 1048576):
+        '''
+        Provides the data frame of rolls and dice of this Game object in narrow form in chunks of rolls, so that a long-format export of many rolls need not hold every row at once
+
+        Keyword arguments:
+            chunk_size: int -- the number of rolls in every chunk but the last. Defaults to 1048576.
+
+        Return values:
+            generator_of_data_frames_of_rolls_dice_and_faces: generator -- a generator yielding data frames like the one provided by show('narrow'), each with the rows of the rolls of one chunk, which together hold the rolls of this Game object when this method is called
+
+        Side effects:
+            Looks up the faces of the codes of each chunk when the chunk is yielded, without building or caching the data frame of rolls and dice of this Game object
+
+        Exceptions raised:
+            AssertionError if this game has not been played
+            ValueError if the chunk size is not positive, or if this game stores only counts
+
+        Restrictions on when this method can be called:
+            The generator may not be advanced after this Game object is played again or released
+        '''
+
+        if not self._this_game_has_been_played:
+            raise AssertionError('this game has not been played')
+        if self._matrix_of_codes_of_rolled_faces is None and self._matrix_of_packed_codes is None:
+            raise ValueError('this game stores only counts of its rolls')
+        if chunk_size <= 0:
+            raise ValueError('the chunk size must be positive')
+        if self._matrix_of_packed_codes is not None:
+            return self._generate_chunks_of_rolls_dice_and_faces(self._matrix_of_packed_codes, chunk_size)
+        return self._generate_chunks_of_rolls_dice_and_faces(self._matrix_of_codes_of_rolled_faces, chunk_size)
+
+    def _generate_chunks_of_rolls_dice_and_faces(self, matrix_of_codes_of_rolled_faces, chunk_size):
+        '''
+        Yields the chunks of the data frame of rolls and dice in narrow form described by iter_narrow
+
+        Keyword arguments:
+            matrix_of_codes_of_rolled_faces: np.ndarray -- the matrix of codes or of packed codes of this Game object when iter_narrow was called
+            chunk_size: int -- the number of rolls in every chunk but the last
+
+        Return values:
+            generator_of_data_frames_of_rolls_dice_and_faces: generator -- a generator yielding data frames of rolls, dice, and faces in narrow form
+
+        Side effects:
+            none
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            May be called only by iter_narrow
+        '''
+
+        categorical_type_of_faces = _generate_categorical_type_of_faces(self._array_of_faces)
+        for index_of_first_roll in range(0, len(matrix_of_codes_of_rolled_faces), chunk_size):
+            matrix_of_codes_of_chunk = matrix_of_codes_of_rolled_faces[index_of_first_roll:index_of_first_roll + chunk_size]
+            if matrix_of_codes_of_rolled_faces is self._matrix_of_packed_codes:
+                matrix_of_codes_of_chunk = np.unpackbits(matrix_of_codes_of_chunk, axis = 1, count = len(self._list_of_dice))
+            if categorical_type_of_faces is None:
+                yield _generate_data_frame_of_rolls_dice_and_faces(np.take(self._array_of_faces, matrix_of_codes_of_chunk), index_of_first_roll)
+            else:
+                yield _generate_data_frame_of_rolls_dice_and_faces(matrix_of_codes_of_chunk, index_of_first_roll, categorical_type_of_faces)
@@ -0,0 +1,198 @@
+'''
+Module for class Sampler, which samples indices of faces according to an array of weights, and for its subclasses UniformSampler and CumulativeDistributionSampler
+'''
+
+import numpy as np
+
+class Sampler:
+    '''
+    Samples indices of faces according to an array of weights.
+    Is the interface shared by the sampling backends of a Die object.
+    A subclass is built once from an array of weights and may be sampled any number of times.
+
+    Instance variables:
+        _number_of_faces: int -- the number of weights from which this Sampler object was built
+
+    Public methods:
+        __init__
+        sample
+    '''
+
+    def __init__(self, array_of_weights):
+        '''
+        Initializes a Sampler object after validating an array of weights
+
+        Keyword arguments:
+            array_of_weights: np.ndarray -- a 1D numpy array of nonnegative, finite weights with a positive sum
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this Sampler object's number of faces
+
+        Exceptions raised:
+            ValueError, if the array of weights is empty, contains a negative or non-finite weight, or sums to zero
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        array_of_weights = np.asarray(array_of_weights, dtype = np.float64)
+        if len(array_of_weights) == 0:
+            raise ValueError('a sampler requires at least one weight')
+        if not np.all(np.isfinite(array_of_weights)) or np.any(array_of_weights < 0):
+            raise ValueError('weights must be nonnegative and finite')
+        if array_of_weights.sum() <= 0:
+            raise ValueError('weights must have a positive sum')
+        self._number_of_faces = len(array_of_weights)
+
+    def sample(self, number_of_samples, generator):
+        '''
+        Samples indices of faces according to the weights with which this Sampler object was built
+
+        Keyword arguments:
+            number_of_samples: int -- An integer
+            generator: np.random.Generator -- A numpy random number generator
+
+        Return values:
+            array_of_indices: np.ndarray -- A 1D numpy array of sampled indices of faces
+
+        Side effects:
+            Advances the provided random number generator
+
+        Exceptions raised:
+            NotImplementedError, if a subclass does not override this method
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        raise NotImplementedError('a subclass of Sampler must implement sample')
+
+class UniformSampler(Sampler):
+    '''
+    Samples indices of faces with equal weights by generating integers in bulk
+
+    Instance variables:
+        _number_of_faces: int -- the number of weights from which this UniformSampler object was built
+
+    Public methods:
+        __init__
+        sample
+    '''
+
+    def __init__(self, array_of_weights):
+        '''
+        Initializes a UniformSampler object
+
+        Keyword arguments:
+            array_of_weights: np.ndarray -- a 1D numpy array of equal, positive, finite weights
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this UniformSampler object's number of faces
+
+        Exceptions raised:
+            ValueError, if the array of weights is empty, contains a negative or non-finite weight, sums to zero, or contains unequal weights
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        super().__init__(array_of_weights)
+        array_of_weights = np.asarray(array_of_weights, dtype = np.float64)
+        if np.any(array_of_weights != array_of_weights[0]):
+            raise ValueError('a uniform sampler requires equal weights')
+
+    def sample(self, number_of_samples, generator):
+        '''
+        Samples indices of faces uniformly
+
+        Keyword arguments:
+            number_of_samples: int -- An integer
+            generator: np.random.Generator -- A numpy random number generator
+
+        Return values:
+            array_of_indices: np.ndarray -- A 1D numpy array of sampled indices of faces
+
+        Side effects:
+            Advances the provided random number generator
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_indices = generator.integers(0, self._number_of_faces, size = number_of_samples)
+        return array_of_indices
+
+class CumulativeDistributionSampler(Sampler):
+    '''
+    Samples indices of faces by inverting the cumulative distribution of the weights with a binary search.
+    Is built in one vectorized pass and takes logarithmic time per sample, which suits dice with few faces and small numbers of rolls.
+
+    Instance variables:
+        _number_of_faces: int -- the number of weights from which this CumulativeDistributionSampler object was built
+        _array_of_cumulative_weights: np.ndarray -- a 1D numpy array of the cumulative sums of the weights
+        _index_of_last_positive_weight: int -- the largest index with a positive weight, to which a sample that rounds up to the total weight is clipped
+
+    Public methods:
+        __init__
+        sample
+    '''
+
+    def __init__(self, array_of_weights):
+        '''
+        Initializes a CumulativeDistributionSampler object
+
+        Keyword arguments:
+            array_of_weights: np.ndarray -- a 1D numpy array of nonnegative, finite weights with a positive sum
+
+        Return values:
+            none
+
+        Side effects:
+            Initializes this CumulativeDistributionSampler object's number of faces, array of cumulative weights, and index of last positive weight
+
+        Exceptions raised:
+            ValueError, if the array of weights is empty, contains a negative or non-finite weight, or sums to zero
+
+        Restrictions on when this method can be called:
+            May not be called directly
+        '''
+
+        super().__init__(array_of_weights)
+        array_of_weights = np.asarray(array_of_weights, dtype = np.float64)
+        self._array_of_cumulative_weights = np.cumsum(array_of_weights)
+        self._index_of_last_positive_weight = int(np.flatnonzero(array_of_weights)[-1])
+
+    def sample(self, number_of_samples, generator):
+        '''
+        Samples indices of faces by binary search over the cumulative weights
+
+        Keyword arguments:
+            number_of_samples: int -- An integer
+            generator: np.random.Generator -- A numpy random number generator
+
+        Return values:
+            array_of_indices: np.ndarray -- A 1D numpy array of sampled indices of faces
+
+        Side effects:
+            Advances the provided random number generator
+
+        Exceptions raised:
+            none
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_uniform_numbers = generator.random(number_of_samples) * self._array_of_cumulative_weights[-1]
+        array_of_indices = np.searchsorted(self._array_of_cumulative_weights, array_of_uniform_numbers, side = 'right')
+        np.minimum(array_of_indices, self._index_of_last_positive_weight, out = array_of_indices)
+        return array_of_indices
@@ -0,0 +1,105 @@
+'''
+Module for functions that derive statistically independent, reproducible streams of random numbers from a seed
+'''
+
+import numpy as np
+
+def generate_seed_sequence(seed = None):
+    '''
+    Generates a seed sequence from which independent child streams of random numbers may be spawned
+
+    Keyword arguments:
+        seed: None, int, list, np.random.SeedSequence, np.random.Generator -- None for fresh entropy from the operating system, an integer or list of integers, a seed sequence, which is used as is, or a random number generator, from whose seed sequence a child seed sequence is spawned. Defaults to None.
+
+    Return values:
+        seed_sequence: np.random.SeedSequence -- a seed sequence
+
+    Side effects:
+        Advances the spawn counter of the seed sequence of a provided random number generator
+
+    Exceptions raised:
+        TypeError, if the seed is of an unsupported type
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return seed.bit_generator.seed_seq.spawn(1)[0]
+    return np.random.SeedSequence(seed)
+
+def generate_generator(seed = None):
+    '''
+    Generates a random number generator
+
+    Keyword arguments:
+        seed: None, int, list, np.random.SeedSequence, np.random.Generator -- None for fresh entropy from the operating system, an integer or list of integers, a seed sequence, or a random number generator, which is used as is. Defaults to None.
+
+    Return values:
+        generator: np.random.Generator -- a random number generator
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        TypeError, if the seed is of an unsupported type
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(generate_seed_sequence(seed))
+
+def generate_list_of_generators(seed, number_of_generators):
+    '''
+    Generates random number generators with statistically independent streams spawned from one seed
+
+    Keyword arguments:
+        seed: None, int, list, np.random.SeedSequence, np.random.Generator -- a seed accepted by generate_seed_sequence
+        number_of_generators: int -- a nonnegative integer
+
+    Return values:
+        list_of_generators: list -- a list of random number generators, where the generator at an index always draws the same stream for the same seed
+
+    Side effects:
+        Advances the spawn counter of the seed sequence generated from the seed
+
+    Exceptions raised:
+        TypeError, if the seed is of an unsupported type
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    seed_sequence = generate_seed_sequence(seed)
+    list_of_generators = [np.random.default_rng(child_seed_sequence) for child_seed_sequence in seed_sequence.spawn(number_of_generators)]
+    return list_of_generators
+
+def generate_generator_for_chunk(seed_sequence, index_of_chunk):
+    '''
+    Generates the random number generator for one chunk of a stream of chunks, without generating the generators of earlier chunks
+
+    Keyword arguments:
+        seed_sequence: np.random.SeedSequence -- the seed sequence of the stream of chunks
+        index_of_chunk: int -- a nonnegative integer
+
+    Return values:
+        generator: np.random.Generator -- a random number generator that always draws the same stream for the same seed sequence and index of chunk, and whose stream is statistically independent of the streams of other chunks
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    # Derives the same child seed sequence that seed_sequence.spawn would derive for this index, but without advancing the spawn counter.
+    child_seed_sequence = np.random.SeedSequence(seed_sequence.entropy, spawn_key = seed_sequence.spawn_key + (index_of_chunk,), pool_size = seed_sequence.pool_size)
+    return np.random.default_rng(child_seed_sequence)
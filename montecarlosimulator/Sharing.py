@@ -0,0 +1,217 @@
+'''
+Module for functions that place a matrix of codes of rolled faces and the faces those codes index in a block of shared memory, so that processes may read and write the matrix without copying it
+'''
+
+from multiprocessing import parent_process
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+import json
+import numpy as np
+import os
+import sys
+import types
+
+# A block begins with the length of its header, then the header, then the matrix at the next multiple of this alignment.
+alignment_of_matrix_of_codes = 64
+
+def encode_header(array_of_faces, shape, type_of_code, order, dictionary_of_metadata = None):
+    '''
+    Encodes the description of a matrix of codes of rolled faces as bytes
+
+    Keyword arguments:
+        array_of_faces: np.ndarray -- a 1D numpy array of the faces that the codes index
+        shape: tuple -- the number of rolls and the number of dice
+        type_of_code: type -- the unsigned integer data type of the codes
+        order: str -- 'C' or 'F'
+        dictionary_of_metadata: dict -- a dictionary of other descriptions of the play that rolled the faces, which can be represented in JSON. Defaults to None.
+
+    Return values:
+        header: bytes -- a JSON document holding the faces, the data types of faces and codes, the shape, the order, and the metadata
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        TypeError, if a face cannot be represented in JSON
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    dictionary_of_header = {
+        'faces': array_of_faces.tolist(),
+        'type_of_faces': array_of_faces.dtype.str,
+        'type_of_codes': np.dtype(type_of_code).str,
+        'shape': list(shape),
+        'order': order,
+        'metadata': dictionary_of_metadata
+    }
+    return json.dumps(dictionary_of_header).encode()
+
+def decode_header(header):
+    '''
+    Decodes the description of a matrix of codes of rolled faces encoded by encode_header
+
+    Keyword arguments:
+        header: bytes -- a header encoded by encode_header
+
+    Return values:
+        array_of_faces: np.ndarray -- a 1D numpy array of the faces that the codes index
+        shape: tuple -- the number of rolls and the number of dice
+        type_of_code: np.dtype -- the unsigned integer data type of the codes
+        order: str -- 'C' or 'F'
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        ValueError, if the header is not a JSON document
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    dictionary_of_header = json.loads(bytes(header).decode())
+    array_of_faces = np.array(dictionary_of_header['faces'], dtype = np.dtype(dictionary_of_header['type_of_faces']))
+    return array_of_faces, tuple(dictionary_of_header['shape']), np.dtype(dictionary_of_header['type_of_codes']), dictionary_of_header['order']
+
+def decode_metadata(header):
+    '''
+    Decodes the metadata of a matrix of codes of rolled faces encoded by encode_header
+
+    Keyword arguments:
+        header: bytes -- a header encoded by encode_header
+
+    Return values:
+        dictionary_of_metadata: dict -- the dictionary of metadata, or None if the header has none
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        ValueError, if the header is not a JSON document
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    return json.loads(bytes(header).decode()).get('metadata')
+
+def get_offset_of_matrix_of_codes(length_of_header):
+    '''
+    Gets the offset of a matrix of codes after a header of a length, which is aligned for vectorized reads
+
+    Keyword arguments:
+        length_of_header: int -- the number of bytes in the header
+
+    Return values:
+        offset: int -- the number of bytes before the matrix of codes
+
+    Side effects:
+        none
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    return -(-(8 + length_of_header) // alignment_of_matrix_of_codes) * alignment_of_matrix_of_codes
+
+def _view_matrix_of_codes(block_of_shared_memory, shape, type_of_code, offset, order):
+    '''
+    Views the matrix of codes in a block of shared memory through an array whose base references the block, since numpy does not hold an export of the buffer of the block, so that the block is closed only once no array views it
+
+    Keyword arguments:
+        block_of_shared_memory: shared_memory.SharedMemory -- the block
+        shape: tuple -- the number of rolls and the number of dice
+        type_of_code: type -- the unsigned integer data type of the codes
+        offset: int -- the number of bytes before the matrix of codes
+        order: str -- 'C' or 'F'
+
+    Return values:
+        matrix_of_codes: np.ndarray -- a 2D numpy array that views the matrix of codes in the block
+
+    Side effects:
+        Keeps the block referenced while the array or any view of it is referenced
+
+    Exceptions raised:
+        none
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    matrix_of_codes = np.ndarray(shape, dtype = type_of_code, buffer = block_of_shared_memory.buf, offset = offset, order = order)
+    return np.asarray(types.SimpleNamespace(__array_interface__ = matrix_of_codes.__array_interface__, block_of_shared_memory = block_of_shared_memory))
+
+def create_shared_matrix_of_codes(array_of_faces, shape, type_of_code, order):
+    '''
+    Creates a block of shared memory holding a header and an uninitialized matrix of codes of rolled faces
+
+    Keyword arguments:
+        array_of_faces: np.ndarray -- a 1D numpy array of the faces that the codes index
+        shape: tuple -- the number of rolls and the number of dice
+        type_of_code: type -- the unsigned integer data type of the codes
+        order: str -- 'C' or 'F'
+
+    Return values:
+        block_of_shared_memory: shared_memory.SharedMemory -- the block, which the caller owns and must unlink, and which is closed once neither it nor an array viewing it is referenced
+        matrix_of_codes: np.ndarray -- a 2D numpy array that views the matrix of codes in the block
+
+    Side effects:
+        Creates a block of shared memory with a name generated by the operating system, whose header records the identifier of this process
+
+    Exceptions raised:
+        TypeError, if a face cannot be represented in JSON
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    header = encode_header(array_of_faces, shape, type_of_code, order, {'process_identifier_of_creator': os.getpid()})
+    offset = get_offset_of_matrix_of_codes(len(header))
+    number_of_bytes_of_matrix = int(np.prod(shape)) * np.dtype(type_of_code).itemsize
+    block_of_shared_memory = shared_memory.SharedMemory(create = True, size = max(1, offset + number_of_bytes_of_matrix))
+    block_of_shared_memory.buf[0:8] = len(header).to_bytes(8, 'little')
+    block_of_shared_memory.buf[8:8 + len(header)] = header
+    return block_of_shared_memory, _view_matrix_of_codes(block_of_shared_memory, shape, type_of_code, offset, order)
+
+def attach_shared_matrix_of_codes(name_of_shared_memory, track = None):
+    '''
+    Attaches to a block of shared memory created by create_shared_matrix_of_codes
+
+    Keyword arguments:
+        name_of_shared_memory: str -- the name of the block
+        track: bool -- an indicator of whether the resource tracker of this process may unlink the block when this process exits, which should be False for a process that does not share the resource tracker of the process that created the block. Defaults to None, for True in the process that created the block and in the processes it started with multiprocessing, which share its resource tracker, so that the registration of the block by its creator is kept, and False in other processes.
+
+    Return values:
+        block_of_shared_memory: shared_memory.SharedMemory -- the block, which the caller must not unlink, and which is closed once neither it nor an array viewing it is referenced
+        array_of_faces: np.ndarray -- a 1D numpy array of the faces that the codes index
+        matrix_of_codes: np.ndarray -- a 2D numpy array that views the matrix of codes in the block
+
+    Side effects:
+        Maps the block into this process
+
+    Exceptions raised:
+        FileNotFoundError, if no block has the name
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    block_of_shared_memory_is_registered = track is not False or sys.version_info < (3, 13)
+    if block_of_shared_memory_is_registered:
+        block_of_shared_memory = shared_memory.SharedMemory(name = name_of_shared_memory)
+    else:
+        block_of_shared_memory = shared_memory.SharedMemory(name = name_of_shared_memory, track = False)
+    length_of_header = int.from_bytes(block_of_shared_memory.buf[0:8], 'little')
+    header = bytes(block_of_shared_memory.buf[8:8 + length_of_header])
+    array_of_faces, shape, type_of_code, order = decode_header(header)
+    if track is None:
+        process_identifier_of_creator = (decode_metadata(header) or {}).get('process_identifier_of_creator')
+        track = process_identifier_of_creator == os.getpid() or (parent_process() is not None and process_identifier_of_creator == parent_process().pid)
+    if not track and block_of_shared_memory_is_registered:
+        resource_tracker.unregister(block_of_shared_memory._name, 'shared_memory')
+    return block_of_shared_memory, array_of_faces, _view_matrix_of_codes(block_of_shared_memory, shape, type_of_code, get_offset_of_matrix_of_codes(length_of_header), order)
@@ -0,0 +1,127 @@
+'''
+Module for functions that place a matrix of codes of rolled faces and the faces those codes index in a memory-mapped file, so that games larger than memory may be played, scanned, and reopened by later processes without playing them again
+'''
+
+from montecarlosimulator.Sharing import decode_header
+from montecarlosimulator.Sharing import decode_metadata
+from montecarlosimulator.Sharing import encode_header
+from montecarlosimulator.Sharing import get_offset_of_matrix_of_codes
+import numpy as np
+
+# The header of a file is padded with this many spaces, so that it may later record a larger number of rolls without moving the matrix of codes.
+length_of_padding_of_header = 64
+
+def create_memory_mapped_matrix_of_codes(path_to_file, array_of_faces, shape, type_of_code, order, dictionary_of_metadata = None):
+    '''
+    Creates a file holding a header and an uninitialized matrix of codes of rolled faces, laid out as a block of shared memory created by create_shared_matrix_of_codes
+
+    Keyword arguments:
+        path_to_file: str -- the path to the file, which is replaced if it exists
+        array_of_faces: np.ndarray -- a 1D numpy array of the faces that the codes index
+        shape: tuple -- the number of rolls and the number of dice
+        type_of_code: type -- the unsigned integer data type of the codes
+        order: str -- 'C' or 'F'
+        dictionary_of_metadata: dict -- a dictionary of other descriptions of the play, as for encode_header. Defaults to None.
+
+    Return values:
+        matrix_of_codes: np.memmap -- a 2D numpy array that maps the matrix of codes in the file for reading and writing, or an empty numpy array in memory if the matrix has no codes
+
+    Side effects:
+        Creates a sparse file whose pages are written only when codes are written into them
+
+    Exceptions raised:
+        TypeError, if a face or the metadata cannot be represented in JSON
+        OSError, if the file cannot be created
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    header = encode_header(array_of_faces, shape, type_of_code, order, dictionary_of_metadata)
+    header = header.ljust(len(header) + length_of_padding_of_header)
+    offset = get_offset_of_matrix_of_codes(len(header))
+    number_of_bytes_of_matrix = int(np.prod(shape)) * np.dtype(type_of_code).itemsize
+    with open(path_to_file, 'wb') as file:
+        file.write(len(header).to_bytes(8, 'little'))
+        file.write(header)
+        file.truncate(offset + number_of_bytes_of_matrix)
+    if number_of_bytes_of_matrix == 0:
+        return np.empty(shape, dtype = type_of_code, order = order)
+    return np.memmap(path_to_file, dtype = type_of_code, mode = 'r+', offset = offset, shape = shape, order = order)
+
+def open_memory_mapped_matrix_of_codes(path_to_file, mode = 'r'):
+    '''
+    Opens a file created by create_memory_mapped_matrix_of_codes
+
+    Keyword arguments:
+        path_to_file: str -- the path to the file
+        mode: str -- 'r' to map the matrix of codes for reading only, or 'r+' to map it for reading and writing. Defaults to 'r'.
+
+    Return values:
+        array_of_faces: np.ndarray -- a 1D numpy array of the faces that the codes index
+        matrix_of_codes: np.memmap -- a 2D numpy array that maps the matrix of codes in the file, or an empty numpy array in memory if the matrix has no codes
+        dictionary_of_metadata: dict -- the dictionary of metadata of the file, or None if it has none
+
+    Side effects:
+        Maps the file into this process
+
+    Exceptions raised:
+        FileNotFoundError, if no file has the path
+        ValueError, if the file does not begin with a header
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    with open(path_to_file, 'rb') as file:
+        length_of_header = int.from_bytes(file.read(8), 'little')
+        header = file.read(length_of_header)
+    array_of_faces, shape, type_of_code, order = decode_header(header)
+    if int(np.prod(shape)) == 0:
+        matrix_of_codes = np.empty(shape, dtype = type_of_code, order = order)
+    else:
+        matrix_of_codes = np.memmap(path_to_file, dtype = type_of_code, mode = mode, offset = get_offset_of_matrix_of_codes(length_of_header), shape = shape, order = order)
+    return array_of_faces, matrix_of_codes, decode_metadata(header)
+
+def extend_memory_mapped_matrix_of_codes(path_to_file, number_of_rolls, number_of_rolls_of_capacity):
+    '''
+    Records a larger number of rolls in the header of a file created by create_memory_mapped_matrix_of_codes and maps a matrix of codes with room for more rolls, without moving the codes in the file
+
+    Keyword arguments:
+        path_to_file: str -- the path to the file
+        number_of_rolls: int -- the number of rolls recorded in the header, which open_memory_mapped_matrix_of_codes maps
+        number_of_rolls_of_capacity: int -- the number of rolls that the file and the returned matrix have room for, which is at least the number of rolls
+
+    Return values:
+        matrix_of_codes: np.memmap -- a 2D numpy array that maps the matrix of codes in the file for reading and writing, with one row per roll of capacity, or an empty numpy array in memory if the matrix has no codes
+
+    Side effects:
+        Rewrites the header of the file
+        Grows the file sparsely if it has no room for the capacity
+
+    Exceptions raised:
+        FileNotFoundError, if no file has the path
+        ValueError, if the matrix of codes is not in C order, whose rows cannot be extended in place, or if the header has no room for the number of rolls
+
+    Restrictions on when this function can be called:
+        none
+    '''
+
+    with open(path_to_file, 'r+b') as file:
+        length_of_header = int.from_bytes(file.read(8), 'little')
+        header = file.read(length_of_header)
+        array_of_faces, shape, type_of_code, order = decode_header(header)
+        if order != 'C':
+            raise ValueError('only a matrix of codes in C order may be extended in a file')
+        extended_header = encode_header(array_of_faces, (number_of_rolls, shape[1]), type_of_code, order, decode_metadata(header))
+        if len(extended_header) > length_of_header:
+            raise ValueError('the header of the file has no room for the number of rolls')
+        file.seek(8)
+        file.write(extended_header.ljust(length_of_header))
+        offset = get_offset_of_matrix_of_codes(length_of_header)
+        number_of_bytes_of_matrix = number_of_rolls_of_capacity * shape[1] * type_of_code.itemsize
+        if file.seek(0, 2) < offset + number_of_bytes_of_matrix:
+            file.truncate(offset + number_of_bytes_of_matrix)
+    if number_of_bytes_of_matrix == 0:
+        return np.empty((number_of_rolls_of_capacity, shape[1]), dtype = type_of_code)
+    return np.memmap(path_to_file, dtype = type_of_code, mode = 'r+', offset = offset, shape = (number_of_rolls_of_capacity, shape[1]), order = order)
@@ -9,6 +9,42 @@ Exports:
     Die
     Game
     Analyzer
+    DynamicDie
+    Accumulator
+    CombinationIndex
+    Sampler
+    UniformSampler
+    CumulativeDistributionSampler
+    AliasTable
+    FenwickTree
+    dictionary_of_names_and_types_of_samplers
+    select_type_of_sampler
+    weak_dictionary_of_keys_and_shared_samplers
+    get_shared_sampler
+    get_smallest_unsigned_integer_type
+    count_codes_of_rows
+    count_bits_of_rows
+    array_of_numbers_of_bits_of_bytes
+    get_type_of_keys_of_rows
+    generate_keys_of_rows
+    decode_keys_of_rows
+    get_number_of_combinations
+    maximum_number_of_combinations_with_dense_counts
+    generate_seed_sequence
+    generate_generator
+    generate_list_of_generators
+    generate_generator_for_chunk
+    alignment_of_matrix_of_codes
+    encode_header
+    decode_header
+    decode_metadata
+    get_offset_of_matrix_of_codes
+    create_shared_matrix_of_codes
+    attach_shared_matrix_of_codes
+    create_memory_mapped_matrix_of_codes
+    open_memory_mapped_matrix_of_codes
+    extend_memory_mapped_matrix_of_codes
+    length_of_padding_of_header
     TestDie
     TestGame
     TestAnalyzer
@@ -18,6 +54,16 @@ __version__ = "0.1.0"
 __author__ = "Tom Lever"
 __credits__ = "Tom Lever"
 
+from montecarlosimulator.Sampler import *
+from montecarlosimulator.AliasTable import *
+from montecarlosimulator.FenwickTree import *
+from montecarlosimulator.Coding import *
+from montecarlosimulator.Seeding import *
+from montecarlosimulator.Sharing import *
+from montecarlosimulator.Storing import *
+from montecarlosimulator.Accumulator import *
+from montecarlosimulator.CombinationIndex import *
 from montecarlosimulator.Die import *
+from montecarlosimulator.DynamicDie import *
 from montecarlosimulator.Game import *
 from montecarlosimulator.Analyzer import *
\ No newline at end of file
@@ -0,0 +1,155 @@
+'''
+Module for class TestAccumulator, which tests the methods of an Accumulator object
+'''
+
+from montecarlosimulator import Accumulator
+import numpy as np
+import unittest
+
+class TestAccumulator(unittest.TestCase):
+    '''
+    Tests the methods of an Accumulator object
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_add
+        test_add_face_counts
+        test_merge
+        test_get_combinations_and_counts
+    '''
+
+    def test_add(self):
+        '''
+        Tests Accumulator.add
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures accumulating chunks of rolls counts the rolls, face totals, and jackpots of all chunks
+
+        Exceptions raised:
+            AssertionError if the number of rolls, face totals, or number of jackpots of an accumulator are not those of the accumulated chunks
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        matrix_of_codes = np.random.default_rng(0).integers(0, 3, size = (1000, 4)).astype(np.uint8)
+        accumulator = Accumulator(3, 4, np.uint8)
+        accumulator.add(matrix_of_codes[0:600])
+        accumulator.add(matrix_of_codes[600:])
+        self.assertEqual(accumulator.get_number_of_rolls(), 1000)
+        self.assertTrue(np.array_equal(accumulator.get_array_of_totals_of_faces(), np.bincount(matrix_of_codes.ravel(), minlength = 3)))
+        self.assertEqual(accumulator.get_number_of_jackpots(), int(np.sum(matrix_of_codes.min(axis = 1) == matrix_of_codes.max(axis = 1))))
+
+    def test_add_face_counts(self):
+        '''
+        Tests Accumulator.add_face_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures accumulating the face counts of rolls accumulates what accumulating the codes of those rolls does, for every form of keys
+
+        Exceptions raised:
+            AssertionError if an accumulator of face counts differs from an accumulator of codes
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        generator = np.random.default_rng(0)
+        for number_of_faces, number_of_dice in [(2, 64), (30, 20), (6, 40)]:
+            matrix_of_codes = generator.integers(0, number_of_faces, size = (2000, number_of_dice)).astype(np.uint8)
+            matrix_of_codes[0] = 1
+            accumulator_of_codes = Accumulator(number_of_faces, number_of_dice, np.uint8)
+            accumulator_of_codes.add(matrix_of_codes)
+            accumulator_of_face_counts = Accumulator(number_of_faces, number_of_dice, np.uint8)
+            matrix_of_face_counts = np.stack([np.bincount(array_of_codes, minlength = number_of_faces) for array_of_codes in matrix_of_codes])
+            accumulator_of_face_counts.add_face_counts(matrix_of_face_counts[0:1000])
+            accumulator_of_face_counts.add_face_counts(matrix_of_face_counts[1000:])
+            self.assertEqual(accumulator_of_face_counts.get_number_of_rolls(), 2000)
+            self.assertEqual(accumulator_of_face_counts.get_number_of_jackpots(), accumulator_of_codes.get_number_of_jackpots())
+            self.assertTrue(np.array_equal(accumulator_of_face_counts.get_array_of_totals_of_faces(), accumulator_of_codes.get_array_of_totals_of_faces()))
+            for array_of_values_of_face_counts, array_of_values_of_codes in zip(accumulator_of_face_counts.get_combinations_and_counts(), accumulator_of_codes.get_combinations_and_counts()):
+                self.assertTrue(np.array_equal(array_of_values_of_face_counts, array_of_values_of_codes))
+
+    def test_merge(self):
+        '''
+        Tests Accumulator.merge
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures merging accumulators of two halves of rolls yields the accumulator of all rolls
+
+        Exceptions raised:
+            AssertionError if a merged accumulator differs from the accumulator of all rolls
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        matrix_of_codes = np.random.default_rng(0).integers(0, 5, size = (1000, 3)).astype(np.uint8)
+        accumulator_of_all_rolls = Accumulator(5, 3, np.uint8)
+        accumulator_of_all_rolls.add(matrix_of_codes)
+        accumulator = Accumulator(5, 3, np.uint8)
+        accumulator.add(matrix_of_codes[0:500])
+        other_accumulator = Accumulator(5, 3, np.uint8)
+        other_accumulator.add(matrix_of_codes[500:])
+        accumulator.merge(other_accumulator)
+        self.assertEqual(accumulator.get_number_of_rolls(), 1000)
+        self.assertEqual(accumulator.get_number_of_jackpots(), accumulator_of_all_rolls.get_number_of_jackpots())
+        self.assertTrue(np.array_equal(accumulator.get_array_of_totals_of_faces(), accumulator_of_all_rolls.get_array_of_totals_of_faces()))
+        for array_of_merged_values, array_of_values in zip(accumulator.get_combinations_and_counts(), accumulator_of_all_rolls.get_combinations_and_counts()):
+            self.assertTrue(np.array_equal(array_of_merged_values, array_of_values))
+
+    def test_get_combinations_and_counts(self):
+        '''
+        Tests Accumulator.get_combinations_and_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the face combinations and counts of an accumulator are those of the sorted rows of the accumulated rolls, whether combinations are packed into keys or kept as sorted codes or face counts
+
+        Exceptions raised:
+            AssertionError if the face combinations or counts of an accumulator differ from those of the sorted rows of the accumulated rolls
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        generator = np.random.default_rng(0)
+        for number_of_faces, number_of_dice, form_of_keys in [(6, 3, 'packed'), (30, 20, 'codes'), (6, 40, 'face_counts')]:
+            matrix_of_codes = generator.integers(0, number_of_faces, size = (2000, number_of_dice)).astype(np.uint8)
+            accumulator = Accumulator(number_of_faces, number_of_dice, np.uint8)
+            self.assertEqual(accumulator._form_of_keys, form_of_keys)
+            accumulator.add(matrix_of_codes)
+            matrix_of_combinations, array_of_counts = accumulator.get_combinations_and_counts()
+            matrix_of_expected_combinations, array_of_expected_counts = np.unique(np.sort(matrix_of_codes, axis = 1), axis = 0, return_counts = True)
+            array_of_orders = np.lexsort(matrix_of_combinations.T[::-1])
+            self.assertTrue(np.array_equal(matrix_of_combinations[array_of_orders], matrix_of_expected_combinations))
+            self.assertTrue(np.array_equal(array_of_counts[array_of_orders], array_of_expected_counts))
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
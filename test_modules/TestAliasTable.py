@@ -0,0 +1,85 @@
+'''
+Module for class TestAliasTable, which tests the methods of an AliasTable object
+'''
+
+from montecarlosimulator import AliasTable
+import numpy as np
+import unittest
+
+class TestAliasTable(unittest.TestCase):
+    '''
+    Tests the methods of an AliasTable object
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_init
+        test_sample
+    '''
+
+    def test_init(self):
+        '''
+        Tests AliasTable.__init__
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the probabilities and aliases of an alias table reconstruct the normalized weights from which the alias table was built, and
+                    building an alias table from an empty array of weights, a negative weight, or weights that sum to zero raises a value error
+
+        Exceptions raised:
+            AssertionError if the probabilities and aliases of an alias table do not reconstruct the normalized weights, or
+                              building an alias table from invalid weights succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_weights = np.array([8.4966, 2.0720, 4.5388, 3.3844, 11.1607, 0.0])
+        alias_table = AliasTable(array_of_weights)
+        number_of_weights = len(array_of_weights)
+        array_of_reconstructed_probabilities = alias_table._array_of_probabilities.copy()
+        np.add.at(array_of_reconstructed_probabilities, alias_table._array_of_aliases, 1.0 - alias_table._array_of_probabilities)
+        array_of_reconstructed_probabilities /= number_of_weights
+        self.assertTrue(np.allclose(array_of_reconstructed_probabilities, array_of_weights / array_of_weights.sum()))
+
+        for array_of_invalid_weights in [np.array([]), np.array([1.0, -1.0]), np.array([0.0, 0.0]), np.array([1.0, np.inf])]:
+            with self.assertRaises(ValueError):
+                AliasTable(array_of_invalid_weights)
+
+    def test_sample(self):
+        '''
+        Tests AliasTable.sample
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the relative frequencies of sampled indices approximate the normalized weights and an index with weight zero is never sampled
+
+        Exceptions raised:
+            AssertionError if the relative frequencies of sampled indices do not approximate the normalized weights or an index with weight zero is sampled
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_weights = np.array([1.0, 5.0, 0.0, 2.0])
+        alias_table = AliasTable(array_of_weights)
+        generator = np.random.default_rng(0)
+        array_of_indices = alias_table.sample(100000, generator)
+        array_of_relative_frequencies = np.bincount(array_of_indices, minlength = len(array_of_weights)) / len(array_of_indices)
+        self.assertEqual(array_of_relative_frequencies[2], 0.0)
+        self.assertTrue(np.allclose(array_of_relative_frequencies, array_of_weights / array_of_weights.sum(), atol = 0.01))
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
@@ -6,7 +6,9 @@ from montecarlosimulator import Die
 from montecarlosimulator import Game
 from montecarlosimulator import Analyzer
 import numpy as np
+import os
 import pandas as pd
+import tempfile
 import unittest
 
 class TestAnalyzer(unittest.TestCase):
@@ -31,7 +33,7 @@ class TestAnalyzer(unittest.TestCase):
             none
 
         Side effects:
-            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
+            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face, built from the faces or from the face counts stored by a game
 
         Exceptions raised:
             AssertionError if a shown data frame of rolls and face counts does not equal an expected data frame of rolls and face counts
@@ -40,20 +42,22 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         data_frame_of_rolls_and_face_counts = analyzer.generate_data_frame_of_rolls_and_face_counts()
         data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).fillna(0).astype(dtype = np.int8)
+        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).reindex(columns = game.get_array_of_faces()).fillna(0).astype(dtype = np.uint8).rename_axis(columns = 'face')
         self.assertTrue(data_frame_of_rolls_and_face_counts.equals(expected_data_frame_of_rolls_and_face_counts))
-        Die._roll_is_being_tested = False
+
+        game.play(20, seed = 0, store = 'face_counts')
+        data_frame_of_rolls_and_stored_face_counts = Analyzer(game).generate_data_frame_of_rolls_and_face_counts()
+        self.assertTrue(data_frame_of_rolls_and_stored_face_counts.equals(expected_data_frame_of_rolls_and_face_counts))
 
     def test_generate_data_frame_of_rolls_and_face_counts(self):
         '''
@@ -66,7 +70,8 @@ class TestAnalyzer(unittest.TestCase):
             none
 
         Side effects:
-            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
+            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face, for coins that store codes and coins that store bits
+            Ensures a data frame of rolls and face counts has integer counts of every face, including a face never rolled, for string faces in memory and in a file
 
         Exceptions raised:
             AssertionError if a shown data frame of rolls and face counts does not equal an expected data frame of rolls and face counts
@@ -75,20 +80,43 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         data_frame_of_rolls_and_face_counts = analyzer.generate_data_frame_of_rolls_and_face_counts()
         data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).fillna(0).astype(dtype = np.int8)
+        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).reindex(columns = game.get_array_of_faces()).fillna(0).astype(dtype = np.uint8).rename_axis(columns = 'face')
         self.assertTrue(data_frame_of_rolls_and_face_counts.equals(expected_data_frame_of_rolls_and_face_counts))
-        Die._roll_is_being_tested = False
+
+        # The face counts of coins that store bits are counts of bits, which equal the face counts of coins that store codes.
+        game_with_twenty_coins = Game([Die(np.array([0, 1], dtype = np.int64)) for _ in range(20)])
+        game_with_twenty_coins.play(50, seed = 0)
+        data_frame_of_rolls_and_face_counts_of_codes = Analyzer(game_with_twenty_coins).generate_data_frame_of_rolls_and_face_counts()
+        game_with_twenty_coins.play(50, seed = 0, store = 'bits')
+        data_frame_of_rolls_and_face_counts_of_bits = Analyzer(game_with_twenty_coins).generate_data_frame_of_rolls_and_face_counts()
+        self.assertTrue(data_frame_of_rolls_and_face_counts_of_bits.equals(data_frame_of_rolls_and_face_counts_of_codes))
+
+        # Every face is a column of integer counts, including a face that is never rolled and faces that are strings, for codes in memory and in a file.
+        array_of_faces = np.array(['A', 'B', 'C', 'D'])
+        list_of_dice = [Die.from_weights(array_of_faces, np.array([1.0, 2.0, 3.0, 0.0])) for _ in range(5)]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0)
+        data_frame_of_rolls_and_face_counts = Analyzer(game).generate_data_frame_of_rolls_and_face_counts()
+        self.assertEqual(data_frame_of_rolls_and_face_counts.columns.tolist(), ['A', 'B', 'C', 'D'])
+        self.assertTrue((data_frame_of_rolls_and_face_counts.dtypes == np.uint8).all())
+        self.assertEqual(data_frame_of_rolls_and_face_counts['D'].sum(), 0)
+        self.assertTrue((data_frame_of_rolls_and_face_counts.sum(axis = 1) == 5).all())
+        for face in ['A', 'B', 'C']:
+            self.assertTrue(np.array_equal(data_frame_of_rolls_and_face_counts[face].to_numpy(), (game.show('wide') == face).sum(axis = 1).to_numpy()))
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(1000, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            self.assertTrue(Analyzer(game).generate_data_frame_of_rolls_and_face_counts().equals(data_frame_of_rolls_and_face_counts))
+            game.release()
 
     def test_get_number_of_rolls_where_all_dice_have_the_same_face(self):
         '''
@@ -103,6 +131,7 @@ class TestAnalyzer(unittest.TestCase):
         Side effects:
             Compares a number of rolls with a number of faces with counts greater than zero equal to one with an expected number of rolls with a number of faces with counts greater than zero equal to one
             Compares data frames of rolls and face counts where all dice for one roll have the same face
+            Compares the numbers of rolls where all coins have the same face and the face combinations of coins that store codes and coins that store bits
 
         Exceptions raised:
             AssertionError if a number of rolls with a number of faces with counts greater than zero equal to one is not equal to an expected number of rolls with a number of faces with counts greater than zero equal to one, or
@@ -112,19 +141,19 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one = analyzer.get_number_of_rolls_where_all_dice_have_the_same_face()
-        self.assertEqual(number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one, 20)
+        expected_number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one = (game.show('wide').nunique(axis = 1) == 1).sum()
+        self.assertEqual(number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one, expected_number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one)
         data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same = analyzer.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same
-        data_frame_of_face_combinations_and_counts = analyzer.data_frame_of_face_combinations_and_counts
+        data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
         first_face_combination = data_frame_of_face_combinations_and_counts.index[0]
         number_of_faces = len(first_face_combination)
         list_with_elements_face = ['face'] * number_of_faces
@@ -136,7 +165,8 @@ class TestAnalyzer(unittest.TestCase):
             if number_of_unique_faces == 1:
                 count = series_of_face_combination_and_count['count']
                 expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.loc[face_combination, :] = count
-        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same))
+        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index))
+        self.assertEqual(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist(), expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist())
 
         list_of_fair_coins = []
         for i in range(0, 3):
@@ -144,12 +174,14 @@ class TestAnalyzer(unittest.TestCase):
             fair_coin = Die(array_of_faces)
             list_of_fair_coins.append(fair_coin)
         game_with_three_fair_coins = Game(list_of_fair_coins)
-        game_with_three_fair_coins.play(1000)
+        game_with_three_fair_coins.play(1000, seed = 0)
         analyzer = Analyzer(game_with_three_fair_coins)
         number_of_jackpots = analyzer.get_number_of_rolls_where_all_dice_have_the_same_face()
-        self.assertEqual(number_of_jackpots, 1000)
+        expected_number_of_jackpots = (game_with_three_fair_coins.show('wide').nunique(axis = 1) == 1).sum()
+        self.assertGreater(expected_number_of_jackpots, 0)
+        self.assertEqual(number_of_jackpots, expected_number_of_jackpots)
         data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same = analyzer.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same
-        data_frame_of_face_combinations_and_counts = analyzer.data_frame_of_face_combinations_and_counts
+        data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
         first_face_combination = data_frame_of_face_combinations_and_counts.index[0]
         number_of_faces = len(first_face_combination)
         list_with_elements_face = ['face'] * number_of_faces
@@ -161,8 +193,145 @@ class TestAnalyzer(unittest.TestCase):
             if number_of_unique_faces == 1:
                 count = series_of_face_combination_and_count['count']
                 expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.loc[face_combination, :] = count
-        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same))
-        Die._roll_is_being_tested = False
+        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index))
+        self.assertEqual(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist(), expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist())
+
+        game_with_three_fair_coins.play(1000, seed = 0, store = 'bits')
+        analyzer = Analyzer(game_with_three_fair_coins)
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), expected_number_of_jackpots)
+        self.assertTrue(analyzer.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.equals(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same))
+        self.assertTrue(analyzer.generate_data_frame_of_face_combinations_and_counts().equals(data_frame_of_face_combinations_and_counts))
+        self.assertFalse(hasattr(Analyzer(game_with_three_fair_coins), 'data_frame_of_face_combinations_and_counts'))
+
+    def test_find_rolls_where_all_dice_have_the_same_face(self):
+        '''
+        Tests Analyzer.find_rolls_where_all_dice_have_the_same_face
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the rolls where all dice have the same face, and their faces, with those found in the data frame of rolls and dice, for games that store codes in memory or in a file, face counts, or bits, and after rolls are appended, including by an analyzer to a game that does not store codes
+
+        Exceptions raised:
+            AssertionError if the rolls where all dice have the same face or their faces are unexpected, or ValueError is not raised for a game that stores only counts
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'])
+        game = Game([Die(array_of_faces) for _ in range(4)])
+        game.play(1000, seed = 0)
+        data_frame_of_rolls_and_dice = game.show('wide')
+        array_of_rolls_are_jackpots = (data_frame_of_rolls_and_dice.nunique(axis = 1) == 1).to_numpy()
+        expected_array_of_indices_of_rolls = np.flatnonzero(array_of_rolls_are_jackpots)
+        expected_list_of_faces = data_frame_of_rolls_and_dice.iloc[expected_array_of_indices_of_rolls, 0].astype(str).tolist()
+        analyzer = Analyzer(game)
+        number_of_jackpots, data_frame_of_rolls_where_all_dice_have_the_same_face = analyzer.find_rolls_where_all_dice_have_the_same_face()
+        self.assertGreater(number_of_jackpots, 0)
+        self.assertEqual(number_of_jackpots, len(expected_array_of_indices_of_rolls))
+        self.assertEqual(data_frame_of_rolls_where_all_dice_have_the_same_face.index.name, 'roll_index')
+        self.assertTrue(np.array_equal(data_frame_of_rolls_where_all_dice_have_the_same_face.index, expected_array_of_indices_of_rolls))
+        self.assertEqual(data_frame_of_rolls_where_all_dice_have_the_same_face['face'].tolist(), expected_list_of_faces)
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots)
+
+        game_with_appended_rolls = Game([Die(array_of_faces) for _ in range(4)])
+        game_with_appended_rolls.play(1000, seed = 0)
+        game_with_appended_rolls.play(500, append = True)
+        number_of_jackpots_after_append, data_frame_of_rolls_where_all_dice_have_the_same_face_after_append = Analyzer(game_with_appended_rolls).find_rolls_where_all_dice_have_the_same_face()
+        for store in ['face_counts', 'bits']:
+            game.play(1000, seed = 0, store = store)
+            number_of_jackpots_of_store, data_frame_of_rolls_where_all_dice_have_the_same_face_of_store = Analyzer(game).find_rolls_where_all_dice_have_the_same_face()
+            self.assertEqual(number_of_jackpots_of_store, number_of_jackpots)
+            self.assertTrue(data_frame_of_rolls_where_all_dice_have_the_same_face_of_store.equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+            analyzer_of_store = Analyzer(game)
+            analyzer_of_store.play(500, append = True)
+            self.assertEqual(game.get_number_of_rolls(), 1500)
+            self.assertTrue(analyzer_of_store.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append))
+        game.play(1000, seed = 0, store = 'counts')
+        analyzer_of_counts = Analyzer(game)
+        analyzer_of_counts.play(500, append = True)
+        self.assertEqual(analyzer_of_counts.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots_after_append)
+
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(1000, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            analyzer = Analyzer(game)
+            self.assertTrue(analyzer.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+            analyzer.play(500, append = True)
+            matrix_of_codes = game.get_matrix_of_codes()
+            number_of_jackpots_after_append, data_frame_of_rolls_where_all_dice_have_the_same_face_after_append = analyzer.find_rolls_where_all_dice_have_the_same_face()
+            self.assertEqual(number_of_jackpots_after_append, int(np.sum(matrix_of_codes.min(axis = 1) == matrix_of_codes.max(axis = 1))))
+            self.assertTrue(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append.iloc[0:number_of_jackpots].equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+            self.assertTrue(np.array_equal(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append.index, np.flatnonzero(matrix_of_codes.min(axis = 1) == matrix_of_codes.max(axis = 1))))
+            opened_game = Game.open(game.get_path_of_file())
+            analyzer_of_opened_game = Analyzer(opened_game)
+            self.assertTrue(analyzer_of_opened_game.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append))
+            self.assertEqual(analyzer_of_opened_game.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots_after_append)
+            self.assertEqual(analyzer_of_opened_game.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index.nlevels, 4)
+            opened_game.release()
+            game.release()
+
+        game.play(1000, seed = 0, shared_memory = True)
+        attached_game = Game.attach(game.get_name_of_shared_memory())
+        analyzer_of_attached_game = Analyzer(attached_game)
+        self.assertTrue(analyzer_of_attached_game.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+        self.assertEqual(analyzer_of_attached_game.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots)
+        attached_game.release()
+        game.release()
+
+        game.play(1000, seed = 0, store = 'counts')
+        analyzer = Analyzer(game)
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots)
+        with self.assertRaises(ValueError):
+            analyzer.find_rolls_where_all_dice_have_the_same_face()
+
+    def test_generate_combination_index(self):
+        '''
+        Tests Analyzer.generate_combination_index
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the combination index of a game counts each face combination as many times as it was rolled, is kept until rolls are appended, agrees between games that store codes and games that store only counts, and merges across games
+
+        Exceptions raised:
+            AssertionError if a count of a face combination is wrong or a combination index is not kept or regenerated
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C'])
+        game = Game([Die(array_of_faces) for _ in range(4)])
+        game.play(10000, seed = 0)
+        analyzer = Analyzer(game)
+        combination_index = analyzer.generate_combination_index()
+        self.assertIs(analyzer.generate_combination_index(), combination_index)
+        self.assertEqual(combination_index.get_number_of_combinations(), 15)
+        matrix_of_sorted_codes = np.sort(game.get_matrix_of_codes(), axis = 1)
+        self.assertEqual(combination_index.get_count([2, 1, 0, 1]), np.count_nonzero(np.all(matrix_of_sorted_codes == [0, 1, 1, 2], axis = 1)))
+        self.assertTrue(np.array_equal(combination_index.get_counts(game.get_matrix_of_codes()), [np.count_nonzero(np.all(matrix_of_sorted_codes == array_of_codes, axis = 1)) for array_of_codes in matrix_of_sorted_codes]))
+
+        analyzer.play(500, append = True)
+        combination_index_after_append = analyzer.generate_combination_index()
+        self.assertIsNot(combination_index_after_append, combination_index)
+        self.assertEqual(int(combination_index_after_append.get_ranks_and_counts()[1].sum()), 10500)
+
+        game_of_counts = Game([Die(array_of_faces) for _ in range(4)])
+        game_of_counts.play(10000, seed = 0, store = 'counts')
+        combination_index_of_counts = Analyzer(game_of_counts).generate_combination_index()
+        for array_of_counts, array_of_counts_of_codes in zip(combination_index_of_counts.get_ranks_and_counts(), combination_index.get_ranks_and_counts()):
+            self.assertTrue(np.array_equal(array_of_counts, array_of_counts_of_codes))
+        combination_index_of_counts.merge(combination_index_after_append)
+        self.assertEqual(combination_index_of_counts.get_count([0, 1, 1, 2]), combination_index.get_count([0, 1, 1, 2]) + combination_index_after_append.get_count([0, 1, 1, 2]))
 
     def test_generate_data_frame_of_face_combinations_and_counts(self):
         '''
@@ -175,7 +344,8 @@ class TestAnalyzer(unittest.TestCase):
             none
 
         Side effects:
-            Compares data frames of face combinations and counts of how many times each face combination was rolled
+            Compares data frames of face combinations and counts of how many times each face combination was rolled, in order of face combination, for games that store codes in memory, games that store codes in a file, and games that store only counts, with a data frame counted roll by roll
+            Ensures face combinations of string faces and of many rolls are counted, and of many coins that store codes or bits
 
         Exceptions raised:
             AssertionError if two data frames of face combinations and counts of how many times each face combination was rolled are not equal
@@ -184,14 +354,13 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
         data_frame_of_rolls_and_dice = game.show('wide')
@@ -207,8 +376,104 @@ class TestAnalyzer(unittest.TestCase):
                 expected_data_frame_of_face_combinations_and_counts.at[face_combination, 'count'] += 1
             else:
                 expected_data_frame_of_face_combinations_and_counts.at[face_combination, 'count'] = 1
-        self.assertTrue(data_frame_of_face_combinations_and_counts.equals(expected_data_frame_of_face_combinations_and_counts))
-        Die._roll_is_being_tested = False
+        self.assertTrue(data_frame_of_face_combinations_and_counts.index.equals(expected_data_frame_of_face_combinations_and_counts.sort_index().index))
+        self.assertEqual(data_frame_of_face_combinations_and_counts['count'].tolist(), expected_data_frame_of_face_combinations_and_counts.sort_index()['count'].tolist())
+
+        data_frame_of_face_combinations_and_counts_of_codes = data_frame_of_face_combinations_and_counts
+        game.play(20, seed = 0, store = 'counts')
+        analyzer = Analyzer(game)
+        data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
+        self.assertTrue(data_frame_of_face_combinations_and_counts.equals(data_frame_of_face_combinations_and_counts_of_codes))
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), game.get_accumulator().get_number_of_jackpots())
+        with self.assertRaises(ValueError):
+            analyzer.generate_data_frame_of_rolls_and_face_counts()
+
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(20, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            data_frame_of_face_combinations_and_counts_of_file = Analyzer(game).generate_data_frame_of_face_combinations_and_counts()
+            self.assertTrue(data_frame_of_face_combinations_and_counts_of_file.equals(data_frame_of_face_combinations_and_counts))
+            game.release()
+
+        array_of_faces = np.array(['A', 'B', 'C'])
+        game = Game([Die(array_of_faces) for _ in range(4)])
+        game.play(200000, seed = 0)
+        data_frame_of_face_combinations_and_counts = Analyzer(game).generate_data_frame_of_face_combinations_and_counts()
+        self.assertEqual(len(data_frame_of_face_combinations_and_counts), 15)
+        self.assertEqual(data_frame_of_face_combinations_and_counts['count'].sum(), 200000)
+        self.assertTrue(data_frame_of_face_combinations_and_counts.index.is_monotonic_increasing)
+        matrix_of_sorted_codes = np.sort(game.get_matrix_of_codes(), axis = 1)
+        self.assertEqual(data_frame_of_face_combinations_and_counts.loc[('A', 'B', 'B', 'C'), 'count'], np.count_nonzero(np.all(matrix_of_sorted_codes == [0, 1, 1, 2], axis = 1)))
+
+        game_of_coins = Game([Die(np.array(['H', 'T'])) for _ in range(100)])
+        game_of_coins.play(1000, seed = 0)
+        data_frame_of_face_combinations_and_counts = Analyzer(game_of_coins).generate_data_frame_of_face_combinations_and_counts()
+        array_of_numbers_of_tails, array_of_counts = np.unique(game_of_coins.get_matrix_of_codes().sum(axis = 1), return_counts = True)
+        self.assertEqual(data_frame_of_face_combinations_and_counts.index.nlevels, 100)
+        self.assertEqual(data_frame_of_face_combinations_and_counts['count'].tolist(), array_of_counts.tolist())
+        self.assertEqual([face_combination.count('T') for face_combination in data_frame_of_face_combinations_and_counts.index], array_of_numbers_of_tails.tolist())
+        game_of_coins.play(1000, seed = 0, store = 'bits')
+        self.assertTrue(Analyzer(game_of_coins).generate_data_frame_of_face_combinations_and_counts().equals(data_frame_of_face_combinations_and_counts))
+
+    def test_generate_data_frame_of_face_permutations_and_counts(self):
+        '''
+        Tests Analyzer.generate_data_frame_of_face_permutations_and_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares data frames of face permutations and counts, in order of face permutation, with the counts of the rows of the data frame of rolls and dice, for faces that are not sorted, games that store codes in memory or in a file or bits, and permutations that do not fit in 64 bits
+            Ensures ValueError is raised for a game that stores only counts
+
+        Exceptions raised:
+            AssertionError if a data frame of face permutations and counts is not equal to the counts of rows, or ValueError is not raised
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['Z', 'Y', 'X', 'W'])
+        game = Game([Die(array_of_faces) for _ in range(3)])
+        game.play(5000, seed = 0)
+        analyzer = Analyzer(game)
+        data_frame_of_face_permutations_and_counts = analyzer.generate_data_frame_of_face_permutations_and_counts()
+        series_of_counts_of_rows = game.show('wide').astype(str).value_counts().sort_index()
+        self.assertEqual(data_frame_of_face_permutations_and_counts.index.names, ['face'] * 3)
+        self.assertTrue(data_frame_of_face_permutations_and_counts.index.is_monotonic_increasing)
+        self.assertEqual(data_frame_of_face_permutations_and_counts.index.tolist(), series_of_counts_of_rows.index.tolist())
+        self.assertEqual(data_frame_of_face_permutations_and_counts['count'].tolist(), series_of_counts_of_rows.tolist())
+        self.assertEqual(len(data_frame_of_face_permutations_and_counts), 64)
+        self.assertEqual(data_frame_of_face_permutations_and_counts.loc[('X', 'W', 'Z'), 'count'], np.count_nonzero(np.all(game.get_matrix_of_codes() == [2, 3, 0], axis = 1)))
+        self.assertTrue(analyzer.data_frame_of_face_permutations_and_counts.equals(data_frame_of_face_permutations_and_counts))
+        self.assertEqual(analyzer.generate_data_frame_of_face_combinations_and_counts()['count'].sum(), data_frame_of_face_permutations_and_counts['count'].sum())
+
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(5000, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            self.assertTrue(Analyzer(game).generate_data_frame_of_face_permutations_and_counts().equals(data_frame_of_face_permutations_and_counts))
+            opened_game = Game.open(game.get_path_of_file())
+            self.assertTrue(Analyzer(opened_game).generate_data_frame_of_face_permutations_and_counts().equals(data_frame_of_face_permutations_and_counts))
+            opened_game.release()
+            game.release()
+        game.play(5000, seed = 0, store = 'counts')
+        with self.assertRaises(ValueError):
+            Analyzer(game).generate_data_frame_of_face_permutations_and_counts()
+
+        game_of_coins = Game([Die(np.array(['T', 'H'])) for _ in range(10)])
+        game_of_coins.play(5000, seed = 0)
+        data_frame_of_face_permutations_and_counts_of_codes = Analyzer(game_of_coins).generate_data_frame_of_face_permutations_and_counts()
+        game_of_coins.play(5000, seed = 0, store = 'bits')
+        self.assertTrue(Analyzer(game_of_coins).generate_data_frame_of_face_permutations_and_counts().equals(data_frame_of_face_permutations_and_counts_of_codes))
+
+        game_of_many_faces = Game([Die(np.arange(300, 0, -1, dtype = np.int16)) for _ in range(8)])
+        game_of_many_faces.play(1000, seed = 0)
+        data_frame_of_face_permutations_and_counts = Analyzer(game_of_many_faces).generate_data_frame_of_face_permutations_and_counts()
+        matrix_of_distinct_rolls, array_of_counts = np.unique(game_of_many_faces.get_array_of_faces()[game_of_many_faces.get_matrix_of_codes()], axis = 0, return_counts = True)
+        self.assertTrue(data_frame_of_face_permutations_and_counts.index.is_monotonic_increasing)
+        self.assertEqual(data_frame_of_face_permutations_and_counts.index.tolist(), [tuple(array_of_faces_of_roll) for array_of_faces_of_roll in matrix_of_distinct_rolls.tolist()])
+        self.assertEqual(data_frame_of_face_permutations_and_counts['count'].tolist(), array_of_counts.tolist())
 
     def test_play(self):
         '''
@@ -222,6 +487,7 @@ class TestAnalyzer(unittest.TestCase):
 
         Side effects:
             Compares an indicator of whether a data frame of face combinations and counts needs to be generated when an analyzer is initialized, after the data frame is generated, and when the analyzer plays with an expected indicator
+            Ensures an analyzer that appends rolls to a game in a file scans only the appended rolls
 
         Exceptions raised:
             AssertionError if an indicator of whether a data frame of face combinations and counts needs to be generated is not equal to an expected indicator
@@ -230,21 +496,36 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
         analyzer.get_number_of_rolls_where_all_dice_have_the_same_face()
+        self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
+        analyzer.generate_data_frame_of_face_combinations_and_counts()
         self.assertFalse(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
-        analyzer.play(1000)
+        analyzer.play(1000, seed = 1)
         self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
 
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(100, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            analyzer = Analyzer(game)
+            analyzer.generate_data_frame_of_face_combinations_and_counts()
+            accumulator_of_scanned_rolls = analyzer._accumulator_of_scanned_rolls
+            analyzer.play(50, append = True)
+            self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
+            data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
+            self.assertIs(analyzer._accumulator_of_scanned_rolls, accumulator_of_scanned_rolls)
+            self.assertEqual(data_frame_of_face_combinations_and_counts['count'].sum(), 150)
+            analyzer.play(20, seed = 0)
+            self.assertEqual(analyzer.generate_data_frame_of_face_combinations_and_counts()['count'].sum(), 20)
+            game.release()
+
 if __name__ == "__main__":
     verbose = 2
     unittest.main(verbosity = verbose)
\ No newline at end of file
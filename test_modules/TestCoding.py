@@ -0,0 +1,201 @@
+'''
+Module for class TestCoding, which tests the functions of module Coding
+'''
+
+from montecarlosimulator import array_of_numbers_of_bits_of_bytes
+from montecarlosimulator import count_bits_of_rows
+from montecarlosimulator import count_codes_of_rows
+from montecarlosimulator import decode_keys_of_rows
+from montecarlosimulator import generate_keys_of_rows
+from montecarlosimulator import get_smallest_unsigned_integer_type
+from montecarlosimulator import get_type_of_keys_of_rows
+import numpy as np
+import unittest
+
+class TestCoding(unittest.TestCase):
+    '''
+    Tests the functions of module Coding
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_get_smallest_unsigned_integer_type
+        test_count_codes_of_rows
+        test_count_bits_of_rows
+        test_get_type_of_keys_of_rows
+        test_generate_keys_of_rows
+        test_decode_keys_of_rows
+    '''
+
+    def test_get_smallest_unsigned_integer_type(self):
+        '''
+        Tests get_smallest_unsigned_integer_type
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares smallest unsigned integer types for numbers of codes at the boundaries of each type with expected types
+
+        Exceptions raised:
+            AssertionError if a smallest unsigned integer type is not equal to an expected type
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        self.assertEqual(get_smallest_unsigned_integer_type(2), np.uint8)
+        self.assertEqual(get_smallest_unsigned_integer_type(256), np.uint8)
+        self.assertEqual(get_smallest_unsigned_integer_type(257), np.uint16)
+        self.assertEqual(get_smallest_unsigned_integer_type(65537), np.uint32)
+        self.assertEqual(get_smallest_unsigned_integer_type(2**32 + 1), np.uint64)
+
+    def test_count_codes_of_rows(self):
+        '''
+        Tests count_codes_of_rows
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the counts of codes of each row of a matrix of codes with the counts of each row counted separately
+
+        Exceptions raised:
+            AssertionError if the counts of a row are not equal to the counts of that row counted separately
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        matrix_of_codes = np.random.default_rng(0).integers(0, 5, size = (100, 7)).astype(np.uint8)
+        matrix_of_counts = count_codes_of_rows(matrix_of_codes, 6)
+        self.assertEqual(matrix_of_counts.shape, (100, 6))
+        for array_of_codes, array_of_counts in zip(matrix_of_codes, matrix_of_counts):
+            self.assertTrue(np.array_equal(array_of_counts, np.bincount(array_of_codes, minlength = 6)))
+        self.assertEqual(count_codes_of_rows(matrix_of_codes[0:0], 6).shape, (0, 6))
+
+    def test_count_bits_of_rows(self):
+        '''
+        Tests count_bits_of_rows
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the numbers of bits of the rows of a matrix of packed codes with the numbers of codes 1 in the rows of the codes before they were packed, and with the numbers of bits of bytes looked up in a table
+
+        Exceptions raised:
+            AssertionError if the number of bits of a row is not equal to the number of codes 1 in that row
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        matrix_of_codes = np.random.default_rng(0).integers(0, 2, size = (100, 21)).astype(np.uint8)
+        matrix_of_packed_codes = np.packbits(matrix_of_codes, axis = 1)
+        array_of_numbers_of_bits = count_bits_of_rows(matrix_of_packed_codes)
+        self.assertEqual(array_of_numbers_of_bits.dtype, np.int64)
+        self.assertTrue(np.array_equal(array_of_numbers_of_bits, matrix_of_codes.sum(axis = 1)))
+        self.assertTrue(np.array_equal(array_of_numbers_of_bits_of_bytes[matrix_of_packed_codes].sum(axis = 1), matrix_of_codes.sum(axis = 1)))
+        self.assertEqual(array_of_numbers_of_bits_of_bytes[255], 8)
+        self.assertEqual(count_bits_of_rows(matrix_of_packed_codes[0:0]).shape, (0,))
+
+    def test_get_type_of_keys_of_rows(self):
+        '''
+        Tests get_type_of_keys_of_rows
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares types of keys for numbers of codes and columns whose rows fit in each unsigned integer type, or do not fit in 64 bits, with expected types
+
+        Exceptions raised:
+            AssertionError if a type of keys is not equal to an expected type
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        self.assertEqual(get_type_of_keys_of_rows(2, 8, np.uint8), np.uint8)
+        self.assertEqual(get_type_of_keys_of_rows(256, 1, np.uint8), np.uint16)
+        self.assertEqual(get_type_of_keys_of_rows(26, 5, np.uint8), np.uint32)
+        self.assertEqual(get_type_of_keys_of_rows(2, 64, np.uint8), np.uint64)
+        self.assertEqual(get_type_of_keys_of_rows(300, 8, np.uint16), np.dtype((np.void, 16)))
+
+    def test_generate_keys_of_rows(self):
+        '''
+        Tests generate_keys_of_rows
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures rows have equal keys exactly when they are equal, and sorted keys are in lexicographic order of rows, for integer and void keys
+
+        Exceptions raised:
+            AssertionError if distinct rows have equal keys, equal rows have distinct keys, or sorted keys are not in order of rows
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        generator = np.random.default_rng(0)
+        for number_of_codes, number_of_columns, type_of_code in [(26, 5, np.uint8), (3, 4, np.uint8), (300, 8, np.uint16)]:
+            matrix_of_codes = generator.integers(0, number_of_codes, size = (3000, number_of_columns)).astype(type_of_code)
+            matrix_of_codes[1000:1500] = matrix_of_codes[0:500]
+            array_of_keys = generate_keys_of_rows(matrix_of_codes, number_of_codes, get_type_of_keys_of_rows(number_of_codes, number_of_columns, type_of_code))
+            self.assertEqual(array_of_keys.shape, (3000,))
+            array_of_distinct_keys, array_of_indices_of_first_rows = np.unique(array_of_keys, return_index = True)
+            matrix_of_distinct_rows = np.unique(matrix_of_codes, axis = 0)
+            self.assertEqual(len(array_of_distinct_keys), len(matrix_of_distinct_rows))
+            self.assertTrue(np.array_equal(matrix_of_codes[array_of_indices_of_first_rows], matrix_of_distinct_rows))
+
+    def test_decode_keys_of_rows(self):
+        '''
+        Tests decode_keys_of_rows
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures decoding the keys of rows gives back the rows, for integer and void keys
+
+        Exceptions raised:
+            AssertionError if a decoded row is not equal to the row of its key
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        generator = np.random.default_rng(0)
+        for number_of_codes, number_of_columns, type_of_code in [(26, 5, np.uint8), (256, 1, np.uint8), (2, 64, np.uint8), (300, 8, np.uint16)]:
+            matrix_of_codes = generator.integers(0, number_of_codes, size = (1000, number_of_columns)).astype(type_of_code)
+            matrix_of_codes[0] = number_of_codes - 1
+            array_of_keys = generate_keys_of_rows(matrix_of_codes, number_of_codes, get_type_of_keys_of_rows(number_of_codes, number_of_columns, type_of_code))
+            matrix_of_decoded_codes = decode_keys_of_rows(array_of_keys, number_of_codes, number_of_columns, type_of_code)
+            self.assertEqual(matrix_of_decoded_codes.dtype, type_of_code)
+            self.assertTrue(np.array_equal(matrix_of_decoded_codes, matrix_of_codes))
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
@@ -0,0 +1,239 @@
+'''
+Module for class TestCombinationIndex, which tests the methods of a CombinationIndex object
+'''
+
+from montecarlosimulator import CombinationIndex
+import itertools
+import math
+import numpy as np
+import unittest
+
+class TestCombinationIndex(unittest.TestCase):
+    '''
+    Tests the methods of a CombinationIndex object
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_init
+        test_rank
+        test_rank_face_counts
+        test_unrank
+        test_get_count
+        test_merge
+        test_get_combinations_and_counts
+    '''
+
+    def test_init(self):
+        '''
+        Tests CombinationIndex.__init__
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a combination index has as many ranks as face combinations, including for many dice of two faces whose larger binomial coefficients do not fit in unsigned 64-bit integers, and refuses face combinations whose ranks do not fit in unsigned 64-bit integers
+
+        Exceptions raised:
+            AssertionError if the number of combinations is wrong or ValueError is not raised
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        self.assertEqual(CombinationIndex(6, 4).get_number_of_combinations(), math.comb(9, 4))
+        self.assertEqual(CombinationIndex(1, 5).get_number_of_combinations(), 1)
+        self.assertEqual(CombinationIndex(2, 100).get_number_of_combinations(), 101)
+        with self.assertRaises(ValueError):
+            CombinationIndex(1000, 100)
+        with self.assertRaises(ValueError):
+            CombinationIndex(0, 3)
+
+    def test_rank(self):
+        '''
+        Tests CombinationIndex.rank
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures ranking maps the face combinations onto consecutive integers and does not depend on the order of codes within a roll
+
+        Exceptions raised:
+            AssertionError if the ranks of all face combinations are not a permutation of the consecutive integers or if a shuffled roll has another rank
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        for number_of_faces, number_of_dice in [(2, 1), (3, 4), (6, 5), (1, 3)]:
+            combination_index = CombinationIndex(number_of_faces, number_of_dice)
+            matrix_of_combinations = np.array(list(itertools.combinations_with_replacement(range(number_of_faces), number_of_dice)), dtype = np.uint8)
+            array_of_ranks = combination_index.rank(matrix_of_combinations)
+            self.assertEqual(array_of_ranks.dtype, np.uint64)
+            self.assertTrue(np.array_equal(np.sort(array_of_ranks), np.arange(combination_index.get_number_of_combinations())))
+            self.assertTrue(np.array_equal(combination_index.rank(matrix_of_combinations[:, ::-1]), array_of_ranks))
+
+    def test_rank_face_counts(self):
+        '''
+        Tests CombinationIndex.rank_face_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures ranking the face counts of rolls ranks what ranking the codes of those rolls does
+
+        Exceptions raised:
+            AssertionError if the ranks of face counts differ from the ranks of codes
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        matrix_of_codes = np.random.default_rng(0).integers(0, 7, size = (1000, 9)).astype(np.uint8)
+        matrix_of_face_counts = np.stack([np.bincount(array_of_codes, minlength = 7) for array_of_codes in matrix_of_codes])
+        combination_index = CombinationIndex(7, 9)
+        self.assertTrue(np.array_equal(combination_index.rank_face_counts(matrix_of_face_counts), combination_index.rank(matrix_of_codes)))
+
+    def test_unrank(self):
+        '''
+        Tests CombinationIndex.unrank
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures unranking the ranks of rolls gives back their sorted codes, including for the largest ranks that fit in unsigned 64-bit integers and for many dice of two faces
+
+        Exceptions raised:
+            AssertionError if unranked codes are not the sorted codes of the ranked rolls
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        for number_of_faces, number_of_dice in [(3, 4), (30, 20), (200, 12), (2, 100)]:
+            matrix_of_codes = np.random.default_rng(0).integers(0, number_of_faces, size = (500, number_of_dice)).astype(np.uint8)
+            matrix_of_codes[0] = number_of_faces - 1
+            matrix_of_codes[1] = 0
+            combination_index = CombinationIndex(number_of_faces, number_of_dice)
+            matrix_of_sorted_codes = combination_index.unrank(combination_index.rank(matrix_of_codes))
+            self.assertEqual(matrix_of_sorted_codes.dtype, np.uint8)
+            self.assertTrue(np.array_equal(matrix_of_sorted_codes, np.sort(matrix_of_codes, axis = 1)))
+            self.assertEqual(int(combination_index.rank(matrix_of_codes[0:1])[0]), combination_index.get_number_of_combinations() - 1)
+
+    def test_get_count(self):
+        '''
+        Tests CombinationIndex.get_count and CombinationIndex.get_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a combination index with dense counts and one with sparse counts count each face combination as many times as it was rolled, in any order of codes, with or without counts of rows
+
+        Exceptions raised:
+            AssertionError if a count is wrong
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        for number_of_faces, number_of_dice in [(3, 4), (30, 10)]:
+            matrix_of_codes = np.random.default_rng(0).integers(0, number_of_faces, size = (2000, number_of_dice)).astype(np.uint8)
+            matrix_of_codes[0:5] = matrix_of_codes[5]
+            combination_index = CombinationIndex(number_of_faces, number_of_dice)
+            combination_index.add(matrix_of_codes[0:1000])
+            combination_index.add(matrix_of_codes[1000:], np.full(1000, 2))
+            matrix_of_sorted_codes = np.sort(matrix_of_codes, axis = 1)
+            array_of_expected_counts = np.array([np.sum(np.all(matrix_of_sorted_codes[0:1000] == array_of_codes, axis = 1)) + 2 * np.sum(np.all(matrix_of_sorted_codes[1000:] == array_of_codes, axis = 1)) for array_of_codes in matrix_of_sorted_codes])
+            self.assertTrue(np.array_equal(combination_index.get_counts(matrix_of_codes), array_of_expected_counts))
+            self.assertEqual(combination_index.get_count(list(matrix_of_codes[5][::-1])), array_of_expected_counts[5])
+            self.assertGreaterEqual(array_of_expected_counts[5], 6)
+            self.assertEqual(combination_index.get_count([number_of_faces - 1] * number_of_dice), int(np.sum(np.all(matrix_of_codes[0:1000] == number_of_faces - 1, axis = 1)) + 2 * np.sum(np.all(matrix_of_codes[1000:] == number_of_faces - 1, axis = 1))))
+
+    def test_merge(self):
+        '''
+        Tests CombinationIndex.merge
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures merging the combination indices of two parts of rolls counts what adding all rolls to one combination index does, for dense and sparse counts
+
+        Exceptions raised:
+            AssertionError if a merged combination index differs from a combination index of all rolls or ValueError is not raised
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        for number_of_faces, number_of_dice in [(3, 4), (30, 10)]:
+            matrix_of_codes = np.random.default_rng(0).integers(0, number_of_faces, size = (2000, number_of_dice)).astype(np.uint8)
+            combination_index_of_all_rolls = CombinationIndex(number_of_faces, number_of_dice)
+            combination_index_of_all_rolls.add(matrix_of_codes)
+            combination_index = CombinationIndex(number_of_faces, number_of_dice)
+            combination_index.add(matrix_of_codes[0:700])
+            combination_index_of_other_rolls = CombinationIndex(number_of_faces, number_of_dice)
+            combination_index_of_other_rolls.add(matrix_of_codes[700:])
+            combination_index.merge(combination_index_of_other_rolls)
+            for array_of_ranks, array_of_ranks_of_all_rolls in zip(combination_index.get_ranks_and_counts(), combination_index_of_all_rolls.get_ranks_and_counts()):
+                self.assertTrue(np.array_equal(array_of_ranks, array_of_ranks_of_all_rolls))
+        with self.assertRaises(ValueError):
+            combination_index.merge(CombinationIndex(3, 4))
+
+    def test_get_combinations_and_counts(self):
+        '''
+        Tests CombinationIndex.get_combinations_and_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the face combinations of a combination index are the distinct sorted rolls, each with the number of times it was rolled
+
+        Exceptions raised:
+            AssertionError if the face combinations or counts differ from those found with np.unique
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        for number_of_faces, number_of_dice in [(3, 4), (30, 10)]:
+            matrix_of_codes = np.random.default_rng(0).integers(0, number_of_faces, size = (2000, number_of_dice)).astype(np.uint8)
+            combination_index = CombinationIndex(number_of_faces, number_of_dice)
+            combination_index.add(matrix_of_codes)
+            matrix_of_combinations, array_of_counts = combination_index.get_combinations_and_counts()
+            matrix_of_expected_combinations, array_of_expected_counts = np.unique(np.sort(matrix_of_codes, axis = 1), axis = 0, return_counts = True)
+            array_of_indices = np.lexsort(matrix_of_combinations.T[::-1])
+            self.assertTrue(np.array_equal(matrix_of_combinations[array_of_indices], matrix_of_expected_combinations))
+            self.assertTrue(np.array_equal(array_of_counts[array_of_indices], array_of_expected_counts))
+            self.assertEqual(int(array_of_counts.sum()), 2000)
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
@@ -3,6 +3,11 @@ Module for class TestDie, which tests the methods of a Die object
 '''
 
 from montecarlosimulator.Die import *
+from montecarlosimulator import AliasTable
+from montecarlosimulator import CumulativeDistributionSampler
+from montecarlosimulator import UniformSampler
+import os
+import tempfile
 import unittest
 
 class TestDie(unittest.TestCase):
@@ -14,8 +19,18 @@ class TestDie(unittest.TestCase):
 
     Public methods:
         test_init
+        test_from_weights
+        test_from_data_frame
+        test_from_file
         test_change_weight
+        test_change_weights
+        test_set_sampler
         test_roll
+        test_roll_codes
+        test_roll_face_counts
+        test_iter_rolls
+        test_get_array_of_faces
+        test_get_fingerprint
         test_show
     '''
 
@@ -53,6 +68,103 @@ class TestDie(unittest.TestCase):
         shown_data_frame_of_faces_and_weights = die.show()
         self.assertTrue(shown_data_frame_of_faces_and_weights.equals(expected_data_frame_of_faces_and_weights))
 
+    def test_from_weights(self):
+        '''
+        Tests Die.from_weights
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the data frame of faces and weights of a die created from faces and weights with an expected data frame of faces and weights, and
+                    ensures creating a die from duplicate faces, mismatched numbers of faces and weights, negative weights, or weights that sum to zero raises a value error
+
+        Exceptions raised:
+            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights, or
+                              creating a die from invalid faces or weights succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'], dtype = str)
+        array_of_weights = np.array([5.0, 1.0])
+        expected_data_frame_of_faces_and_weights = pd.DataFrame({'face': array_of_faces, 'weight': array_of_weights})
+        die = Die.from_weights(array_of_faces, array_of_weights)
+        self.assertTrue(die.show().equals(expected_data_frame_of_faces_and_weights))
+        self.assertEqual(len(die._dictionary_of_types_and_samplers), 1)
+
+        for array_of_invalid_faces, array_of_invalid_weights in [(np.array(['H', 'H']), np.array([1.0, 1.0])), (array_of_faces, np.array([1.0])), (array_of_faces, np.array([1.0, -1.0])), (array_of_faces, np.array([0.0, 0.0]))]:
+            with self.assertRaises(ValueError):
+                Die.from_weights(array_of_invalid_faces, array_of_invalid_weights)
+
+    def test_from_data_frame(self):
+        '''
+        Tests Die.from_data_frame
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a die created from the shown data frame of faces and weights of another die has the same data frame of faces and weights
+            Ensures a die created from a column of objects that are integers keeps integer faces whose weights can be changed
+
+        Exceptions raised:
+            AssertionError if the shown data frames of faces and weights of the two dice are not equal
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C'], dtype = str)
+        die = Die(array_of_faces)
+        die.change_weights({'A': 3.0, 'B': 2.0})
+        copy_of_die = Die.from_data_frame(die.show())
+        self.assertTrue(copy_of_die.show().equals(die.show()))
+
+        data_frame_of_faces_and_weights = pd.DataFrame({'face': pd.Series([1, 2, 3], dtype = object), 'weight': [1.0, 2.0, 3.0]})
+        die_with_object_faces = Die.from_data_frame(data_frame_of_faces_and_weights)
+        self.assertEqual(die_with_object_faces.get_array_of_faces().tolist(), [1, 2, 3])
+        die_with_object_faces.change_weight(1, 5.0)
+        self.assertEqual(die_with_object_faces.show().loc[0, 'weight'], 5.0)
+
+    def test_from_file(self):
+        '''
+        Tests Die.from_file
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Writes a temporary tab-delimited file of letters and weights and compares the data frames of faces and weights of dice read from the file with and without memory mapping with an expected data frame of faces and weights
+
+        Exceptions raised:
+            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C'], dtype = str)
+        array_of_weights = np.array([8.4966, 2.0720, 4.5388])
+        expected_data_frame_of_faces_and_weights = pd.DataFrame({'face': array_of_faces, 'weight': array_of_weights})
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'Letter_Weights.txt')
+            with open(path_to_file, 'w') as file:
+                file.write('A\t8.4966\nB\t2.0720\nC\t4.5388\n')
+            for memory_map in [False, True]:
+                die = Die.from_file(path_to_file, memory_map = memory_map)
+                self.assertTrue(die.show().equals(expected_data_frame_of_faces_and_weights))
+
     def test_change_weight(self):
         '''
         Tests Die.change_weight
@@ -98,6 +210,103 @@ class TestDie(unittest.TestCase):
         except ValueError as e:
             pass
 
+    def test_change_weights(self):
+        '''
+        Tests Die.change_weights
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures weights in the data frame of faces and weights of a die are changed from a dictionary, a series, and an aligned array of weights, and
+                    attempting to change weights with a face that does not exist, an aligned array with the wrong length, or a weight that cannot be converted to np.float64 raises a value error and changes no weight
+
+        Exceptions raised:
+            AssertionError if weights in the data frame of faces and weights of a die are not changed, or
+                              attempting to change weights with invalid faces or weights succeeds or changes a weight
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C', 'D'], dtype = str)
+        die = Die(array_of_faces)
+        die.change_weights({'A': 2.0, 'C': 3.0})
+        self.assertEqual(die.show()['weight'].to_list(), [2.0, 1.0, 3.0, 1.0])
+        die.change_weights(pd.Series([5.0, 6.0], index = ['D', 'B']))
+        self.assertEqual(die.show()['weight'].to_list(), [2.0, 6.0, 3.0, 5.0])
+        die.change_weights(np.array([4.0, 3.0, 2.0, 1.0]))
+        self.assertEqual(die.show()['weight'].to_list(), [4.0, 3.0, 2.0, 1.0])
+
+        for invalid_weights in [{'A': 7.0, 'face_that_does_not_exist_in_data_frame_of_faces_and_weights_of_die': 7.0}, np.array([7.0, 7.0]), {'A': 'weight_that_cannot_be_converted_to_np.float64'}]:
+            with self.assertRaises(ValueError):
+                die.change_weights(invalid_weights)
+            self.assertEqual(die.show()['weight'].to_list(), [4.0, 3.0, 2.0, 1.0])
+
+    def test_set_sampler(self):
+        '''
+        Tests Die.set_sampler
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a die with equal weights, few faces, and many faces is rolled with the expected automatically selected type of sampler,
+                    a die whose alias table has been built, such as a die created by from_weights, reuses it for few rolls,
+                    a forced type of sampler is used and builds a sampler only once until a weight changes,
+                    forcing a uniform sampler on a die with unequal weights raises a value error when the die is rolled, and
+                    forcing an unknown type of sampler raises a value error
+
+        Exceptions raised:
+            AssertionError if a die is rolled with an unexpected type of sampler, or
+                              rolling with a forced uniform sampler and unequal weights or forcing an unknown type of sampler succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        die = Die(np.array(['H', 'T'], dtype = str), seed = 0)
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [UniformSampler])
+        die.change_weight('H', 5.0)
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [CumulativeDistributionSampler])
+
+        die = Die(np.arange(100), seed = 0)
+        die.change_weights(np.arange(2.0, 102.0))
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [CumulativeDistributionSampler])
+        die.roll(200)
+        self.assertIn(AliasTable, die._dictionary_of_types_and_samplers)
+
+        die = Die.from_weights(np.arange(100), np.arange(1.0, 101.0), seed = 0)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [AliasTable])
+        alias_table = die._dictionary_of_types_and_samplers[AliasTable]
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [AliasTable])
+        self.assertIs(Die.from_weights(np.arange(100), np.arange(1.0, 101.0))._get_sampler(10), alias_table)
+        die.set_sampler('alias_table')
+        die.roll(10)
+        self.assertIs(die._dictionary_of_types_and_samplers[AliasTable], alias_table)
+        die.change_weight(0, 2.0)
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [AliasTable])
+        self.assertIsNot(die._dictionary_of_types_and_samplers[AliasTable], alias_table)
+
+        die.set_sampler('uniform')
+        with self.assertRaises(ValueError):
+            die.roll(10)
+        die.set_sampler(None)
+        die.roll(10)
+        with self.assertRaises(ValueError):
+            die.set_sampler('name_of_sampler_that_does_not_exist')
+
     def test_roll(self):
         '''
         Tests Die.roll
@@ -109,33 +318,200 @@ class TestDie(unittest.TestCase):
             none
 
         Side effects:
-            Ensures a list of rolled faces for a die is equal to an expected list of rolled faces when roll is being tested
+            Ensures a list of rolled faces for a die with a seed is equal to an expected list of rolled faces, and
+                    two dice with the same seed roll the same faces
 
         Exceptions raised:
-            AssertionError if a list of rolled faces for a die is not equal to an expected list of rolled faces when roll is being tested
+            AssertionError if a list of rolled faces for a die with a seed is not equal to an expected list of rolled faces, or
+                              two dice with the same seed roll different faces
 
         Restrictions on when this method can be called:
             none
         '''
         
-        Die._roll_is_being_tested = True
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
-        die = Die(array_of_faces)
+        die = Die(array_of_faces, seed = 0)
         list_of_rolled_faces = die.roll(20)
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
+        expected_list_of_rolled_faces = [4, 3, 3, 2, 2, 1, 1, 1, 1, 4, 3, 4, 3, 3, 4, 3, 3, 3, 3, 4]
         self.assertEqual(list_of_rolled_faces, expected_list_of_rolled_faces)
+        self.assertEqual(Die(array_of_faces, seed = 0).roll(20), expected_list_of_rolled_faces)
+        self.assertEqual(die.roll(20, np.random.default_rng(0)), expected_list_of_rolled_faces)
 
         array_of_faces = np.array(['H', 'T'], dtype = str)
-        die = Die(array_of_faces)
+        die = Die(array_of_faces, seed = 0)
         list_of_rolled_faces = die.roll(10000)
         number_of_heads = list_of_rolled_faces.count('H')
-        self.assertEqual(5064, number_of_heads)
+        self.assertEqual(4970, number_of_heads)
 
         die.change_weight('H', 5.0)
         list_of_rolled_faces = die.roll(10000)
         number_of_heads = list_of_rolled_faces.count('H')
-        self.assertEqual(8345, number_of_heads)
-        Die._roll_is_being_tested = False
+        self.assertEqual(8333, number_of_heads)
+
+    def test_roll_codes(self):
+        '''
+        Tests Die.roll_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures an array of codes of rolled faces for a die has the smallest unsigned integer data type that fits the number of faces and decodes to the list of rolled faces provided by roll
+
+        Exceptions raised:
+            AssertionError if an array of codes of rolled faces has an unexpected data type or does not decode to the list of rolled faces provided by roll
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'], dtype = str)
+        die = Die(array_of_faces)
+        array_of_codes_of_rolled_faces = die.roll_codes(20, np.random.default_rng(0))
+        self.assertEqual(array_of_codes_of_rolled_faces.dtype, np.uint8)
+        list_of_rolled_faces = die.roll(20, np.random.default_rng(0))
+        self.assertEqual(die.get_array_of_faces()[array_of_codes_of_rolled_faces].tolist(), list_of_rolled_faces)
+
+        array_of_faces = np.arange(300)
+        die = Die(array_of_faces)
+        array_of_codes_of_rolled_faces = die.roll_codes(20)
+        self.assertEqual(array_of_codes_of_rolled_faces.dtype, np.uint16)
+        self.assertTrue(np.all(array_of_codes_of_rolled_faces < 300))
+
+    def test_roll_face_counts(self):
+        '''
+        Tests Die.roll_face_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the face counts of rolls of copies of a weighted die sum to the number of copies in each roll, never count a face with weight zero, and have means near the expected means
+            Ensures face counts cannot be drawn for a die whose weights sum to zero
+
+        Exceptions raised:
+            AssertionError if face counts have an unexpected shape, sum, or mean, or
+                              face counts are drawn for a die whose weights sum to zero
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        die = Die.from_weights(array_of_faces, np.array([1.0, 2.0, 0.0, 5.0]), seed = 0)
+        matrix_of_face_counts = die.roll_face_counts(10000, 40)
+        self.assertEqual(matrix_of_face_counts.shape, (10000, 4))
+        self.assertTrue(np.all(matrix_of_face_counts.sum(axis = 1) == 40))
+        self.assertTrue(np.all(matrix_of_face_counts[:, 2] == 0))
+        self.assertTrue(np.allclose(matrix_of_face_counts.mean(axis = 0), [5.0, 10.0, 0.0, 25.0], atol = 0.1))
+        die.change_weights(np.zeros(4))
+        with self.assertRaises(ValueError):
+            die.roll_face_counts(10, 40)
+
+    def test_iter_rolls(self):
+        '''
+        Tests Die.iter_rolls
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures chunks of codes of rolled faces have the expected sizes, are the same for the same seed and chunk size, and do not depend on how many chunks are consumed,
+                    an unbounded stream of chunks keeps yielding chunks, and
+                    a chunk size that is not positive raises a value error
+
+        Exceptions raised:
+            AssertionError if chunks of codes of rolled faces have unexpected sizes or differ for the same seed and chunk size, an unbounded stream stops, or a chunk size that is not positive is accepted
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        die = Die(np.array(['A', 'B', 'C'], dtype = str))
+        list_of_chunks = list(die.iter_rolls(10, chunk_size = 4, seed = 0))
+        self.assertEqual([len(chunk) for chunk in list_of_chunks], [4, 4, 2])
+        self.assertEqual(list_of_chunks[0].dtype, np.uint8)
+        list_of_chunks_for_same_seed = list(die.iter_rolls(10, chunk_size = 4, seed = 0))
+        for chunk, chunk_for_same_seed in zip(list_of_chunks, list_of_chunks_for_same_seed):
+            self.assertTrue(np.array_equal(chunk, chunk_for_same_seed))
+        unbounded_stream_of_chunks = die.iter_rolls(chunk_size = 4, seed = 0)
+        for chunk in list_of_chunks[:2]:
+            self.assertTrue(np.array_equal(next(unbounded_stream_of_chunks), chunk))
+        self.assertEqual(len(next(unbounded_stream_of_chunks)), 4)
+        with self.assertRaises(ValueError):
+            die.iter_rolls(10, chunk_size = 0)
+
+    def test_get_array_of_faces(self):
+        '''
+        Tests Die.get_array_of_faces
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the array of faces of a die with the array of faces with which the die was initialized
+
+        Exceptions raised:
+            AssertionError if the array of faces of a die is not equal to the array of faces with which the die was initialized
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        die = Die(array_of_faces)
+        self.assertTrue(np.array_equal(die.get_array_of_faces(), array_of_faces))
+
+    def test_get_fingerprint(self):
+        '''
+        Tests Die.get_fingerprint
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures dice with equal faces and weights have equal fingerprints and share one read-only sampler, and
+                    changing a weight changes the fingerprint of a die
+
+        Exceptions raised:
+            AssertionError if dice with equal faces and weights have different fingerprints or do not share a read-only sampler, or
+                              changing a weight does not change the fingerprint of a die
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.arange(20)
+        array_of_weights = np.arange(1.0, 21.0)
+        die_1 = Die.from_weights(array_of_faces, array_of_weights)
+        die_2 = Die.from_weights(array_of_faces.copy(), array_of_weights.copy())
+        self.assertEqual(die_1.get_fingerprint(), die_2.get_fingerprint())
+        self.assertNotEqual(die_1.get_fingerprint(), Die(array_of_faces).get_fingerprint())
+        self.assertNotEqual(die_1.get_fingerprint(), Die.from_weights(array_of_faces.astype(np.float64), array_of_weights).get_fingerprint())
+        sampler = die_1._get_sampler()
+        self.assertIsInstance(sampler, AliasTable)
+        self.assertIs(die_2._get_sampler(), sampler)
+        self.assertFalse(sampler._array_of_probabilities.flags.writeable)
+
+        die_2.change_weight(0, 2.0)
+        self.assertNotEqual(die_1.get_fingerprint(), die_2.get_fingerprint())
+        self.assertIsNot(die_2._get_sampler(), sampler)
+        self.assertIs(die_1._get_sampler(), sampler)
 
     def test_show(self):
         '''
@@ -149,9 +525,11 @@ class TestDie(unittest.TestCase):
 
         Side effects:
             Compares data frames of faces and weights for numpy arrays of integer and string faces
+            Ensures a shown data frame of faces and weights is cached until a weight is changed
 
         Exceptions raised:
-            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights
+            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights, or
+                              a shown data frame of faces and weights is not cached until a weight is changed
 
         Restrictions on when this method can be called:
             none
@@ -171,6 +549,12 @@ class TestDie(unittest.TestCase):
         expected_data_frame_of_faces_and_weights = pd.DataFrame({'face': array_of_faces, 'weight': array_of_weights})
         self.assertTrue(shown_data_frame_of_faces_and_weights.equals(expected_data_frame_of_faces_and_weights))
 
+        self.assertIs(fair_coin.show(), shown_data_frame_of_faces_and_weights)
+        fair_coin.change_weight('H', 3.0)
+        self.assertIsNot(fair_coin.show(), shown_data_frame_of_faces_and_weights)
+        self.assertEqual(fair_coin.show().at[0, 'weight'], 3.0)
+        self.assertFalse(hasattr(fair_coin, '__dict__'))
+
 if __name__ == "__main__":
     verbose = 2
     unittest.main(verbosity = verbose)
\ No newline at end of file
@@ -0,0 +1,157 @@
+'''
+Module for class TestDynamicDie, which tests the methods of a DynamicDie object
+'''
+
+from montecarlosimulator import DynamicDie
+from montecarlosimulator import FenwickTree
+from montecarlosimulator import AliasTable
+import numpy as np
+import unittest
+
+class TestDynamicDie(unittest.TestCase):
+    '''
+    Tests the methods of a DynamicDie object
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_init
+        test_change_weight
+        test_roll
+        test_roll_and_reinforce
+    '''
+
+    def test_init(self):
+        '''
+        Tests DynamicDie.__init__ and DynamicDie.from_weights
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a dynamic die shares its array of weights with its Fenwick tree and is rolled with its Fenwick tree
+
+        Exceptions raised:
+            AssertionError if a dynamic die does not share its array of weights with its Fenwick tree or is not rolled with its Fenwick tree
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        dynamic_die = DynamicDie.from_weights(np.array(['a', 'b', 'c']), np.array([1.0, 2.0, 3.0]), seed = 0)
+        self.assertIsInstance(dynamic_die, DynamicDie)
+        self.assertIs(dynamic_die._array_of_weights, dynamic_die._fenwick_tree.get_array_of_values())
+        self.assertIsInstance(dynamic_die._get_sampler(), FenwickTree)
+        self.assertEqual(dynamic_die._fenwick_tree.get_total(), 6.0)
+
+    def test_change_weight(self):
+        '''
+        Tests DynamicDie.change_weight and DynamicDie.change_weights
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures changing weights of a dynamic die updates its Fenwick tree and shown data frame, and
+                    changing a weight to a negative weight raises a value error
+
+        Exceptions raised:
+            AssertionError if changing weights of a dynamic die does not update its Fenwick tree or data frame, or
+                              changing a weight to a negative weight succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        dynamic_die = DynamicDie(np.array(['a', 'b', 'c', 'd']), seed = 0)
+        dynamic_die.show()
+        dynamic_die.change_weight('b', 5.0)
+        dynamic_die.change_weights({'c': 0.0, 'd': 2.0})
+        self.assertEqual(dynamic_die._fenwick_tree.get_total(), 8.0)
+        self.assertEqual(dynamic_die.show()['weight'].tolist(), [1.0, 5.0, 0.0, 2.0])
+        dynamic_die.change_weights(np.array([1.0, 1.0, 1.0, 1.0]))
+        self.assertEqual(dynamic_die._fenwick_tree.get_total(), 4.0)
+
+        with self.assertRaises(ValueError):
+            dynamic_die.change_weight('a', -1.0)
+
+    def test_roll(self):
+        '''
+        Tests DynamicDie.roll
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the relative frequencies of rolled faces of a dynamic die approximate its normalized weights, a face with weight zero is never rolled, and
+                    a forced sampler is used instead of the Fenwick tree
+
+        Exceptions raised:
+            AssertionError if the relative frequencies of rolled faces do not approximate the normalized weights, a face with weight zero is rolled, or
+                              a forced sampler is not used
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_weights = np.array([1.0, 5.0, 0.0, 2.0])
+        dynamic_die = DynamicDie.from_weights(np.arange(4), array_of_weights, seed = 0)
+        array_of_codes_of_rolled_faces = dynamic_die.roll_codes(100000)
+        array_of_relative_frequencies = np.bincount(array_of_codes_of_rolled_faces, minlength = 4) / 100000
+        self.assertEqual(array_of_relative_frequencies[2], 0.0)
+        self.assertTrue(np.allclose(array_of_relative_frequencies, array_of_weights / array_of_weights.sum(), atol = 0.01))
+
+        dynamic_die.set_sampler('alias_table')
+        self.assertIsInstance(dynamic_die._get_sampler(), AliasTable)
+
+    def test_roll_and_reinforce(self):
+        '''
+        Tests DynamicDie.roll_and_reinforce
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures each rolled face of a dynamic die is reinforced once per roll, in batches of one roll and of many rolls, and
+                    a reinforcement that would make a weight negative or a batch size that is not positive raises a value error
+
+        Exceptions raised:
+            AssertionError if rolled faces are not reinforced once per roll, or
+                              an invalid reinforcement or batch size succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        for batch_size in [1, 64]:
+            dynamic_die = DynamicDie(np.arange(10), seed = 0)
+            array_of_codes_of_rolled_faces = dynamic_die.roll_and_reinforce(1000, reinforcement = 0.5, batch_size = batch_size)
+            self.assertEqual(len(array_of_codes_of_rolled_faces), 1000)
+            array_of_expected_weights = 1.0 + 0.5 * np.bincount(array_of_codes_of_rolled_faces, minlength = 10)
+            self.assertTrue(np.allclose(dynamic_die._array_of_weights, array_of_expected_weights))
+            self.assertTrue(np.isclose(dynamic_die._fenwick_tree.get_total(), array_of_expected_weights.sum()))
+
+        self.assertEqual(len(DynamicDie(np.arange(3), seed = 0).roll_and_reinforce(0)), 0)
+
+        dynamic_die = DynamicDie(np.arange(3), seed = 0)
+        with self.assertRaises(ValueError):
+            dynamic_die.roll_and_reinforce(10, reinforcement = -2.0)
+        with self.assertRaises(ValueError):
+            dynamic_die.roll_and_reinforce(10, batch_size = 0)
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
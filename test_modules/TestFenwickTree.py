@@ -0,0 +1,196 @@
+'''
+Module for class TestFenwickTree, which tests the methods of a FenwickTree object
+'''
+
+from montecarlosimulator import FenwickTree
+import numpy as np
+import unittest
+
+class TestFenwickTree(unittest.TestCase):
+    '''
+    Tests the methods of a FenwickTree object
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_init
+        test_add
+        test_set
+        test_find
+        test_sample
+    '''
+
+    def test_init(self):
+        '''
+        Tests FenwickTree.__init__
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the total of a Fenwick tree is the sum of the weights from which it was built, and
+                    building a Fenwick tree from a negative or non-finite weight raises a value error
+
+        Exceptions raised:
+            AssertionError if the total of a Fenwick tree is not the sum of its weights, or
+                              building a Fenwick tree from invalid weights succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_weights = np.array([8.4966, 2.0720, 4.5388, 3.3844, 11.1607, 0.0, 1.5])
+        fenwick_tree = FenwickTree(array_of_weights)
+        self.assertTrue(np.isclose(fenwick_tree.get_total(), array_of_weights.sum()))
+        self.assertIs(fenwick_tree.get_array_of_values(), array_of_weights)
+
+        for array_of_invalid_weights in [np.array([1.0, -1.0]), np.array([1.0, np.inf])]:
+            with self.assertRaises(ValueError):
+                FenwickTree(array_of_invalid_weights)
+
+    def test_add(self):
+        '''
+        Tests FenwickTree.add
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures adding deltas at indices, including a repeated index, updates the weights and total of a Fenwick tree
+
+        Exceptions raised:
+            AssertionError if the weights or total of a Fenwick tree are not updated
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        fenwick_tree = FenwickTree(np.ones(10))
+        fenwick_tree.add(np.array([0, 9, 9, 4]), np.array([1.0, 2.0, 3.0, 0.5]))
+        array_of_expected_weights = np.array([2.0, 1.0, 1.0, 1.0, 1.5, 1.0, 1.0, 1.0, 1.0, 6.0])
+        self.assertTrue(np.array_equal(fenwick_tree.get_array_of_values(), array_of_expected_weights))
+        self.assertTrue(np.isclose(fenwick_tree.get_total(), array_of_expected_weights.sum()))
+        self.assertTrue(np.array_equal(fenwick_tree.find(np.cumsum(array_of_expected_weights) - 0.25), np.arange(10)))
+
+    def test_set(self):
+        '''
+        Tests FenwickTree.set
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures setting weights, by a few updates or by a rebuild, leaves the same partial sums as building a new Fenwick tree,
+                    setting a negative weight raises a value error without changing a weight, and
+                    many updates followed by setting weights to zero leave no negative partial sums and no mass on the weights of zero
+
+        Exceptions raised:
+            AssertionError if the partial sums differ from those of a new Fenwick tree,
+                              setting a negative weight succeeds or changes a weight, or
+                              a partial sum is negative or an index with weight zero is sampled
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        fenwick_tree = FenwickTree(np.ones(10))
+        fenwick_tree.set(np.array([3, 3, 7]), np.array([5.0, 2.0, 0.0]))
+        array_of_expected_weights = np.ones(10)
+        array_of_expected_weights[[3, 7]] = [2.0, 0.0]
+        self.assertTrue(np.array_equal(fenwick_tree.get_array_of_values(), array_of_expected_weights))
+        self.assertTrue(np.allclose(fenwick_tree._array_of_partial_sums, FenwickTree(array_of_expected_weights)._array_of_partial_sums))
+
+        fenwick_tree.set(np.arange(10), np.arange(10.0))
+        self.assertTrue(np.allclose(fenwick_tree._array_of_partial_sums, FenwickTree(np.arange(10.0))._array_of_partial_sums))
+
+        with self.assertRaises(ValueError):
+            fenwick_tree.set(np.array([1, 2]), np.array([1.0, -1.0]))
+        self.assertTrue(np.array_equal(fenwick_tree.get_array_of_values(), np.arange(10.0)))
+
+        generator = np.random.default_rng(0)
+        fenwick_tree = FenwickTree(np.ones(8))
+        for _ in range(2000):
+            fenwick_tree.set(np.array([generator.integers(8)]), generator.random() * 3)
+            self.assertLess(fenwick_tree._number_of_updates_since_rebuild, 8)
+        fenwick_tree.set(np.arange(2, 8), 0.0)
+        self.assertGreaterEqual(fenwick_tree._array_of_partial_sums.min(), 0.0)
+        self.assertTrue(np.all(fenwick_tree.sample(10000, generator) < 2))
+
+    def test_find(self):
+        '''
+        Tests FenwickTree.find
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures finding targets agrees with a binary search over the cumulative weights and never finds an index with weight zero, including a target equal to the total after the last positive weight changes
+
+        Exceptions raised:
+            AssertionError if finding targets disagrees with a binary search or finds an index with weight zero
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_weights = np.array([0.0, 3.0, 0.0, 0.0, 1.0, 2.0, 0.0, 4.0, 0.0])
+        fenwick_tree = FenwickTree(array_of_weights)
+        array_of_targets = np.linspace(0.0, array_of_weights.sum(), 1001)[:-1]
+        array_of_expected_indices = np.searchsorted(np.cumsum(array_of_weights), array_of_targets, side = 'right')
+        self.assertTrue(np.array_equal(fenwick_tree.find(array_of_targets), array_of_expected_indices))
+        self.assertTrue(np.array_equal(fenwick_tree.find([array_of_weights.sum()]), [7]))
+        self.assertTrue(np.array_equal(FenwickTree(np.array([1.0, 0.0])).find([1.0]), [0]))
+        fenwick_tree.set(np.array([7]), 0.0)
+        self.assertTrue(np.array_equal(fenwick_tree.find([fenwick_tree.get_total()]), [5]))
+        fenwick_tree.add(np.array([8]), 1.0)
+        self.assertTrue(np.array_equal(fenwick_tree.find([fenwick_tree.get_total()]), [8]))
+
+    def test_sample(self):
+        '''
+        Tests FenwickTree.sample
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the relative frequencies of sampled indices approximate the normalized weights, and
+                    sampling from weights that sum to zero raises a value error
+
+        Exceptions raised:
+            AssertionError if the relative frequencies of sampled indices do not approximate the normalized weights, or
+                              sampling from weights that sum to zero succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_weights = np.array([1.0, 5.0, 0.0, 2.0])
+        fenwick_tree = FenwickTree(array_of_weights)
+        generator = np.random.default_rng(0)
+        array_of_indices = fenwick_tree.sample(100000, generator)
+        array_of_relative_frequencies = np.bincount(array_of_indices, minlength = len(array_of_weights)) / len(array_of_indices)
+        self.assertEqual(array_of_relative_frequencies[2], 0.0)
+        self.assertTrue(np.allclose(array_of_relative_frequencies, array_of_weights / array_of_weights.sum(), atol = 0.01))
+
+        with self.assertRaises(ValueError):
+            FenwickTree(np.zeros(3)).sample(1, generator)
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
@@ -4,8 +4,15 @@ Module for class TestGame, which tests the methods of a Game object
 
 from montecarlosimulator import Die
 from montecarlosimulator import Game
+from montecarlosimulator import count_codes_of_rows
+from montecarlosimulator import generate_generator_for_chunk
 import numpy as np
 import pandas as pd
+import gc
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 
 class TestGame(unittest.TestCase):
@@ -17,8 +24,21 @@ class TestGame(unittest.TestCase):
 
     Public methods:
         test_init
+        test_attach
+        test_open
         test_play
+        test_release
+        test_get_array_of_faces
+        test_get_matrix_of_codes
+        test_get_accumulator
+        test_get_matrix_of_face_counts
+        test_get_matrix_of_packed_codes
+        test_get_number_of_rolls
+        test_get_number_of_dice
+        test_get_version
+        test_get_metadata
         test_show
+        test_iter_narrow
     '''
 
     def test_init(self):
@@ -41,21 +61,119 @@ class TestGame(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         shown_data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
-        for i in range(0, 10):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        Die._roll_is_being_tested = False
+        # Identical dice are rolled together, row by row, with the generator of the first chunk of the seed sequence of the first die.
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(10)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 10)).reshape(20, 10))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        game.play(20, seed = 0)
+        self.assertTrue(game.show('wide').equals(shown_data_frame_of_rolls_and_dice))
+
+    def test_attach(self):
+        '''
+        Tests Game.attach
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game attached to the shared memory of a played game, in this process or in another process, views the same codes and shows the same faces without copying them, and that attaching in the process that played the game leaves the registration of the block with the resource tracker to the game that created it
+
+        Exceptions raised:
+            AssertionError if an attached game does not view the codes or show the faces of the played game, or if the resource tracker fails to unregister the block
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        list_of_dice = [Die(np.array(['H', 'T'])), Die(np.array(['T', 'H']))]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0, shared_memory = True)
+        name_of_shared_memory = game.get_name_of_shared_memory()
+        self.assertIsNotNone(name_of_shared_memory)
+        attached_game = Game.attach(name_of_shared_memory)
+        self.assertTrue(np.array_equal(attached_game.get_array_of_faces(), game.get_array_of_faces()))
+        self.assertTrue(np.array_equal(attached_game.get_matrix_of_codes(), game.get_matrix_of_codes()))
+        self.assertTrue(attached_game.show('wide').equals(game.show('wide')))
+        game.get_matrix_of_codes()[0, 0] = 1 - game.get_matrix_of_codes()[0, 0]
+        self.assertEqual(attached_game.get_matrix_of_codes()[0, 0], game.get_matrix_of_codes()[0, 0])
+        attached_game.release()
+
+        list_of_lists_of_rolled_faces = game.get_array_of_faces()[game.get_matrix_of_codes()].tolist()
+        code = 'from montecarlosimulator import Game; game = Game.attach(' + repr(name_of_shared_memory) + '); print(game.show(\'wide\').to_numpy().tolist() == ' + repr(list_of_lists_of_rolled_faces) + '); game.release()'
+        completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+        self.assertEqual(completed_process.stdout.strip(), 'True')
+        attached_game = Game.attach(name_of_shared_memory)
+        self.assertTrue(np.array_equal(attached_game.get_matrix_of_codes(), game.get_matrix_of_codes()))
+        attached_game.release()
+        game.release()
+
+        code = 'import numpy as np; from montecarlosimulator import Die, Game; game = Game([Die(np.array([1, 2, 3]))]); game.play(10, seed = 0, shared_memory = True); attached_game = Game.attach(game.get_name_of_shared_memory()); attached_game.release(); game.release()'
+        completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+        self.assertEqual(completed_process.returncode, 0)
+        self.assertNotIn('KeyError', completed_process.stderr)
+
+    def test_open(self):
+        '''
+        Tests Game.open
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game played into a file by one or more workers rolls the same faces as a game played in memory, and
+                    a game opened from that file, in this process or in a later process, maps the same codes and shows the same faces without playing again
+
+        Exceptions raised:
+            AssertionError if a game in a file or an opened game differs from a game played in memory, or
+                              a path to a file is accepted with shared memory
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        list_of_dice = [Die(np.array(['H', 'T'])), Die(np.array(['T', 'H']))]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0, chunk_size = 256)
+        matrix_of_codes = game.get_matrix_of_codes()
+        self.assertIsNone(game.get_path_of_file())
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'game.bin')
+            game_in_file = Game(list_of_dice)
+            for workers in [1, 2]:
+                game_in_file.play(1000, seed = 0, chunk_size = 256, workers = workers, path_to_file = path_to_file)
+                self.assertIsInstance(game_in_file.get_matrix_of_codes(), np.memmap)
+                self.assertEqual(game_in_file.get_path_of_file(), path_to_file)
+                self.assertTrue(np.array_equal(game_in_file.get_matrix_of_codes(), matrix_of_codes))
+            game_in_file.release()
+
+            opened_game = Game.open(path_to_file)
+            self.assertTrue(np.array_equal(opened_game.get_array_of_faces(), game.get_array_of_faces()))
+            self.assertTrue(np.array_equal(opened_game.get_matrix_of_codes(), matrix_of_codes))
+            self.assertFalse(opened_game.get_matrix_of_codes().flags.writeable)
+            self.assertEqual(opened_game.get_metadata(), game.get_metadata())
+            self.assertTrue(opened_game.show('wide').equals(game.show('wide')))
+            opened_game.release()
+
+            list_of_lists_of_rolled_faces = game.get_array_of_faces()[matrix_of_codes].tolist()
+            code = 'from montecarlosimulator import Game; game = Game.open(' + repr(path_to_file) + '); print(game.show(\'wide\').to_numpy().tolist() == ' + repr(list_of_lists_of_rolled_faces) + '); game.release()'
+            completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+            self.assertEqual(completed_process.stdout.strip(), 'True')
+            with self.assertRaises(ValueError):
+                game.play(10, shared_memory = True, path_to_file = path_to_file)
 
     def test_play(self):
         '''
@@ -69,29 +187,509 @@ class TestGame(unittest.TestCase):
 
         Side effects:
             Compares data frames of rolls and dice, where each number of rows and observations is the number of rolls, each number of columns and features is the number of dice, and each cell value is a face rolled
+            Ensures a game played with a seed by several worker processes rolls the same faces as a game played by one
+            Ensures rolls appended in memory, in a file, or to counts keep earlier rolls and roll the same faces for the same plays and appends in either order, and rolls cannot be appended with a seed, another store, more workers in private memory, shared memory, or changed dice
 
         Exceptions raised:
-            AssertionError if a shown data frame of rolls and dice does not equal an expected data frame of rolls and dice
+            AssertionError if a shown data frame of rolls and dice does not equal an expected data frame of rolls and dice, or
+                              the faces rolled depend on the number of worker processes
 
         Restrictions on when this method can be called:
             none
         '''
         
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         shown_data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
-        for i in range(0, 10):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        Die._roll_is_being_tested = False
+        # Identical dice are rolled together, row by row, with the generator of the first chunk of the seed sequence of the first die.
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(10)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 10)).reshape(20, 10))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        self.assertFalse(np.array_equal(shown_data_frame_of_rolls_and_dice[0].to_numpy(), shown_data_frame_of_rolls_and_dice[1].to_numpy()))
+
+        array_of_weights = np.array([1.0, 2.0, 3.0, 4.0])
+        list_of_dice = [Die(array_of_faces), Die.from_weights(array_of_faces, array_of_weights), Die(array_of_faces), Die.from_weights(array_of_faces, array_of_weights)]
+        self.assertEqual(list_of_dice[0].get_fingerprint(), list_of_dice[2].get_fingerprint())
+        self.assertIs(list_of_dice[1]._get_sampler(), list_of_dice[3]._get_sampler())
+        game = Game(list_of_dice)
+        game.play(20, seed = 0)
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(4)
+        array_of_rolled_faces_of_fair_dice = np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 2)).reshape(20, 2)
+        array_of_rolled_faces_of_loaded_dice = np.array(Die.from_weights(array_of_faces, array_of_weights, seed = generate_generator_for_chunk(list_of_seed_sequences[1], 0)).roll(20 * 2)).reshape(20, 2)
+        array_of_expected_rolled_faces = np.column_stack([array_of_rolled_faces_of_fair_dice[:, 0], array_of_rolled_faces_of_loaded_dice[:, 0], array_of_rolled_faces_of_fair_dice[:, 1], array_of_rolled_faces_of_loaded_dice[:, 1]])
+        self.assertTrue(np.array_equal(game.show('wide').to_numpy(), array_of_expected_rolled_faces))
+
+        game.play(1000, seed = 0, chunk_size = 64)
+        matrix_of_codes_rolled_by_one_worker = game.get_matrix_of_codes().copy()
+        self.assertIsNone(game.get_name_of_shared_memory())
+        for workers in [2, 3]:
+            game.play(1000, seed = 0, workers = workers, chunk_size = 64)
+            self.assertIsNotNone(game.get_name_of_shared_memory())
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_codes_rolled_by_one_worker))
+        game.release()
+        with self.assertRaises(ValueError):
+            game.play(10, workers = 0)
+        with self.assertRaises(ValueError):
+            game.play(10, chunk_size = 0)
+
+        # Appended rolls continue the streams of the played rolls, so the same plays and appends roll the same faces, and earlier rolls are kept.
+        list_of_matrices_of_codes = []
+        for order in ['C', 'F']:
+            game = Game(list_of_dice)
+            game.play(100, seed = 0, chunk_size = 64, order = order)
+            matrix_of_codes_of_first_play = game.get_matrix_of_codes().copy()
+            data_frame_of_first_play = game.show('wide')
+            for number_of_rolls in [50, 1, 200]:
+                game.play(number_of_rolls, chunk_size = 64, append = True)
+            self.assertEqual(game.get_matrix_of_codes().shape, (351, 4))
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes()[:100], matrix_of_codes_of_first_play))
+            self.assertTrue(np.array_equal(game.show('wide').to_numpy(), game.get_array_of_faces()[game.get_matrix_of_codes()]))
+            self.assertTrue(np.array_equal(data_frame_of_first_play.to_numpy(), game.get_array_of_faces()[matrix_of_codes_of_first_play]))
+            list_of_matrices_of_codes.append(game.get_matrix_of_codes().copy())
+        self.assertTrue(np.array_equal(list_of_matrices_of_codes[0], list_of_matrices_of_codes[1]))
+        self.assertFalse(np.array_equal(list_of_matrices_of_codes[0][100:150], list_of_matrices_of_codes[0][:50]))
+        for store in ['counts', 'face_counts']:
+            game.play(100, seed = 0, chunk_size = 64, store = store)
+            for number_of_rolls in [50, 1, 200]:
+                game.play(number_of_rolls, append = True)
+            self.assertEqual(game.get_number_of_rolls(), 351)
+            self.assertTrue(np.array_equal(game.get_accumulator().get_array_of_totals_of_faces(), np.bincount(list_of_matrices_of_codes[0].ravel(), minlength = 4)))
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'game.bin')
+            game.play(100, seed = 0, chunk_size = 64, path_to_file = path_to_file)
+            game.play(50, chunk_size = 64, append = True)
+            game.play(1, chunk_size = 64, append = True)
+            game.play(200, chunk_size = 64, append = True, workers = 2)
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes(), list_of_matrices_of_codes[0]))
+            opened_game = Game.open(path_to_file)
+            self.assertTrue(np.array_equal(opened_game.get_matrix_of_codes(), list_of_matrices_of_codes[0]))
+            opened_game.release()
+            game.release()
+        # Appended rolls are rolled with the chunk size of the played rolls, so appending whole chunks rolls what one play of all rolls does.
+        game.play(96, seed = 0, chunk_size = 64)
+        game.play(160, append = True)
+        matrix_of_appended_codes = game.get_matrix_of_codes().copy()
+        game.play(256, seed = 0, chunk_size = 64)
+        self.assertTrue(np.array_equal(matrix_of_appended_codes, game.get_matrix_of_codes()))
+        game.play(10, seed = 0)
+        with self.assertRaises(ValueError):
+            game.play(10, seed = 0, append = True)
+        with self.assertRaises(ValueError):
+            game.play(10, store = 'counts', append = True)
+        with self.assertRaises(ValueError):
+            game.play(10, chunk_size = 64, append = True)
+        with self.assertRaises(ValueError):
+            game.play(10, workers = 2, append = True)
+        game.play(10, shared_memory = True)
+        with self.assertRaises(ValueError):
+            game.play(10, append = True)
+        game.release()
+        list_of_dice[0].change_weight(1, 2.0)
+        game.play(10)
+        list_of_dice[0].change_weight(1, 1.0)
+        with self.assertRaises(ValueError):
+            game.play(10, append = True)
+
+    def test_release(self):
+        '''
+        Tests Game.release
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a released game has not been played and its block of shared memory can no longer be attached to, that the block of shared memory of a game played by workers is unlinked when the game is garbage-collected without being released, and that views of a matrix of codes in shared memory can still be read after their game is released or garbage-collected
+
+        Exceptions raised:
+            AssertionError if a released game has been played, a block of shared memory can still be attached to, or a view cannot be read after its game is released or garbage-collected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3]))])
+        game.play(10, seed = 0, shared_memory = True)
+        name_of_shared_memory = game.get_name_of_shared_memory()
+        game.release()
+        with self.assertRaises(AssertionError):
+            game.show('wide')
+        with self.assertRaises(FileNotFoundError):
+            Game.attach(name_of_shared_memory)
+        game.release()
+        game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])
+        game.play(1000, seed = 0, workers = 2)
+        name_of_shared_memory = game.get_name_of_shared_memory()
+        del game
+        gc.collect()
+        with self.assertRaises(FileNotFoundError):
+            Game.attach(name_of_shared_memory)
+
+        code = '\n'.join([
+            'import gc',
+            'import numpy as np',
+            'from montecarlosimulator import Die, Game',
+            'def play(workers):',
+            '    game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])',
+            '    game.play(1000, seed = 0, workers = workers, shared_memory = True)',
+            '    return game.get_matrix_of_codes()',
+            'game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])',
+            'game.play(1000, seed = 0, shared_memory = True)',
+            'matrix_of_codes = game.get_matrix_of_codes()',
+            'data_frame = game.show(\'codes\')',
+            'attached_game = Game.attach(game.get_name_of_shared_memory())',
+            'matrix_of_attached_codes = attached_game.get_matrix_of_codes()',
+            'matrix_of_expected_codes = matrix_of_codes.copy()',
+            'attached_game.release()',
+            'game.release()',
+            'del game, attached_game',
+            'matrix_of_codes_of_dropped_game = play(2)',
+            'gc.collect()',
+            'print(np.array_equal(matrix_of_codes, matrix_of_expected_codes) and np.array_equal(data_frame.to_numpy(), matrix_of_expected_codes) and np.array_equal(matrix_of_attached_codes, matrix_of_expected_codes) and np.array_equal(matrix_of_codes_of_dropped_game, play(1)))'
+        ])
+        completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+        self.assertEqual(completed_process.returncode, 0)
+        self.assertEqual(completed_process.stdout.strip(), 'True')
+
+    def test_get_array_of_faces(self):
+        '''
+        Tests Game.get_array_of_faces
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the array of faces of a game holds the faces of the first die followed by any other faces of the other dice, and
+                    getting the array of faces of a game that has not been played raises an assertion error
+
+        Exceptions raised:
+            AssertionError if the array of faces of a game is not as expected, or
+                              getting the array of faces of a game that has not been played succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array(['H', 'T'])), Die(np.array(['T', 'H', 'E']))])
+        with self.assertRaises(AssertionError):
+            game.get_array_of_faces()
+        game.play(10, seed = 0)
+        self.assertEqual(game.get_array_of_faces().tolist(), ['H', 'T', 'E'])
+
+    def test_get_matrix_of_codes(self):
+        '''
+        Tests Game.get_matrix_of_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the matrix of codes of a game has the smallest unsigned integer data type, the requested order, and codes that index the faces shown, including for dice whose faces are in different orders, and
+                    playing with an order other than C or F raises a value error
+
+        Exceptions raised:
+            AssertionError if the matrix of codes of a game does not have the expected data type, order, or codes, or
+                              playing with an invalid order succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        list_of_dice = [Die(np.array(['H', 'T'])), Die(np.array(['T', 'H'])), Die(np.array(['H', 'T']))]
+        game = Game(list_of_dice)
+        for order in ['C', 'F']:
+            game.play(100, seed = 0, order = order)
+            matrix_of_codes = game.get_matrix_of_codes()
+            self.assertEqual(matrix_of_codes.shape, (100, 3))
+            self.assertEqual(matrix_of_codes.dtype, np.uint8)
+            self.assertTrue(matrix_of_codes.flags.c_contiguous if order == 'C' else matrix_of_codes.flags.f_contiguous)
+            self.assertTrue(np.array_equal(game.get_array_of_faces()[matrix_of_codes], game.show('wide').to_numpy()))
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(3)
+        self.assertEqual(game.show('wide')[1].tolist(), Die(np.array(['T', 'H']), seed = generate_generator_for_chunk(list_of_seed_sequences[1], 0)).roll(100))
+
+        with self.assertRaises(ValueError):
+            game.play(10, order = 'A')
+
+    def test_get_accumulator(self):
+        '''
+        Tests Game.get_accumulator
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game that stores only counts accumulates the face totals, jackpots, and face combinations of the faces that the same seed rolls when codes are stored, by one or more workers, and
+                    a game that stores only counts cannot show or provide codes
+
+        Exceptions raised:
+            AssertionError if the accumulator of a game differs from the aggregates of the codes of the same play, or
+                              a game that stores only counts shows or provides codes
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        list_of_dice = [Die(array_of_faces) for i in range(0, 4)] + [Die.from_weights(array_of_faces[::-1], np.array([1.0, 2.0, 3.0, 4.0]))]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0, chunk_size = 256)
+        self.assertIsNone(game.get_accumulator())
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        for workers in [1, 2]:
+            game.play(1000, seed = 0, chunk_size = 256, workers = workers, store = 'counts')
+            accumulator = game.get_accumulator()
+            self.assertEqual(accumulator.get_number_of_rolls(), 1000)
+            self.assertTrue(np.array_equal(accumulator.get_array_of_totals_of_faces(), np.bincount(matrix_of_codes.ravel(), minlength = 4)))
+            self.assertEqual(accumulator.get_number_of_jackpots(), int(np.sum(matrix_of_codes.min(axis = 1) == matrix_of_codes.max(axis = 1))))
+            self.assertEqual(accumulator.get_combinations_and_counts()[1].sum(), 1000)
+        with self.assertRaises(ValueError):
+            game.show('wide')
+        with self.assertRaises(ValueError):
+            game.get_matrix_of_codes()
+        with self.assertRaises(ValueError):
+            game.play(10, store = 'rolls')
+
+    def test_get_matrix_of_face_counts(self):
+        '''
+        Tests Game.get_matrix_of_face_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game of different dice that stores face counts counts the faces of the codes that the same seed rolls, by one or more workers,
+                    a game of many identical dice that stores face counts draws face counts that agree with its accumulator and have means near the expected means, and
+                    a game that does not store face counts provides none
+
+        Exceptions raised:
+            AssertionError if a matrix of face counts differs from the counts of the codes of the same play, disagrees with the accumulator of the game, or has an unexpected mean, or
+                              a game that does not store face counts provides a matrix of face counts
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        game = Game([Die(array_of_faces) for i in range(0, 3)] + [Die(array_of_faces[::-1])])
+        game.play(1000, seed = 0, chunk_size = 256)
+        self.assertIsNone(game.get_matrix_of_face_counts())
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        matrix_of_expected_face_counts = np.stack([np.bincount(array_of_codes, minlength = 4) for array_of_codes in matrix_of_codes])
+        for workers in [1, 2]:
+            game.play(1000, seed = 0, chunk_size = 256, workers = workers, store = 'face_counts')
+            self.assertEqual(game.get_matrix_of_face_counts().dtype, np.uint8)
+            self.assertTrue(np.array_equal(game.get_matrix_of_face_counts(), matrix_of_expected_face_counts))
+
+        game = Game([Die.from_weights(array_of_faces, np.array([1.0, 1.0, 1.0, 5.0])) for i in range(0, 64)])
+        for workers in [1, 2]:
+            game.play(2000, seed = 0, chunk_size = 4096, workers = workers, store = 'face_counts')
+            matrix_of_face_counts = game.get_matrix_of_face_counts()
+            accumulator = game.get_accumulator()
+            self.assertTrue(np.all(matrix_of_face_counts.sum(axis = 1) == 64))
+            self.assertTrue(np.array_equal(accumulator.get_array_of_totals_of_faces(), matrix_of_face_counts.sum(axis = 0)))
+            self.assertEqual(accumulator.get_combinations_and_counts()[1].sum(), 2000)
+            self.assertTrue(np.allclose(matrix_of_face_counts.mean(axis = 0), [8.0, 8.0, 8.0, 40.0], atol = 0.3))
+            if workers == 1:
+                matrix_of_face_counts_of_one_worker = matrix_of_face_counts.copy()
+            else:
+                self.assertTrue(np.array_equal(matrix_of_face_counts, matrix_of_face_counts_of_one_worker))
+
+    def test_get_matrix_of_packed_codes(self):
+        '''
+        Tests Game.get_matrix_of_packed_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures coins that store bits pack the codes rolled by coins that store codes, by one or more workers and when rolls are appended, and provide codes, face counts, and data frames unpacked from their bits
+            Ensures only a game of two faces may store bits, and a game that stores codes has no packed codes
+
+        Exceptions raised:
+            AssertionError if packed codes, unpacked codes, face counts, or data frames are unexpected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'])
+        list_of_coins = [Die(array_of_faces) for _ in range(11)] + [Die.from_weights(array_of_faces, np.array([1.0, 3.0]))]
+        game = Game(list_of_coins)
+        with self.assertRaises(AssertionError):
+            game.get_matrix_of_packed_codes()
+        game.play(100, seed = 0, chunk_size = 120)
+        self.assertIsNone(game.get_matrix_of_packed_codes())
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        data_frame_of_rolls_and_dice = game.show('wide')
+        for workers in [1, 2]:
+            game.play(100, seed = 0, chunk_size = 120, store = 'bits', workers = workers)
+            matrix_of_packed_codes = game.get_matrix_of_packed_codes()
+            self.assertEqual(matrix_of_packed_codes.shape, (100, 2))
+            self.assertTrue(np.array_equal(matrix_of_packed_codes, np.packbits(matrix_of_codes, axis = 1)))
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_codes))
+            self.assertTrue(np.array_equal(game.get_matrix_of_face_counts(), count_codes_of_rows(matrix_of_codes, 2)))
+            self.assertTrue(game.show('wide').equals(data_frame_of_rolls_and_dice))
+            self.assertTrue(pd.concat(list(game.iter_narrow(chunk_size = 30))).equals(game.show('narrow')))
+            self.assertEqual(game.get_accumulator().get_number_of_rolls(), 100)
+            self.assertTrue(np.array_equal(game.get_accumulator().get_array_of_totals_of_faces(), np.bincount(matrix_of_codes.ravel(), minlength = 2)))
+        game.play(40, seed = 0, chunk_size = 120)
+        game.play(60, chunk_size = 120, append = True)
+        matrix_of_appended_codes = game.get_matrix_of_codes().copy()
+        game.play(40, seed = 0, chunk_size = 120, store = 'bits')
+        game.play(60, append = True)
+        self.assertEqual(game.get_number_of_rolls(), 100)
+        self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_appended_codes))
+        with self.assertRaises(ValueError):
+            Game([Die(np.array([1, 2, 3]))]).play(10, store = 'bits')
+
+    def test_get_number_of_rolls(self):
+        '''
+        Tests Game.get_number_of_rolls
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the number of rolls of a game counts the rolls played and appended, for games that store codes and counts
+
+        Exceptions raised:
+            AssertionError if the number of rolls of a game is unexpected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3, 4], dtype = np.int8))])
+        with self.assertRaises(AssertionError):
+            game.get_number_of_rolls()
+        for store in ['codes', 'counts']:
+            game.play(10, store = store)
+            self.assertEqual(game.get_number_of_rolls(), 10)
+            game.play(5, store = store, append = True)
+            self.assertEqual(game.get_number_of_rolls(), 15)
+
+    def test_get_number_of_dice(self):
+        '''
+        Tests Game.get_number_of_dice
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the number of dice of a game is the number of dice it was initialized with, before and after it is played, and that of the game it views for a game created by open or attach
+
+        Exceptions raised:
+            AssertionError if the number of dice of a game is unexpected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3, 4], dtype = np.int8)) for _ in range(3)])
+        self.assertEqual(game.get_number_of_dice(), 3)
+        game.play(10, seed = 0, store = 'counts')
+        self.assertEqual(game.get_number_of_dice(), 3)
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(10, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            opened_game = Game.open(game.get_path_of_file())
+            self.assertEqual(opened_game.get_number_of_dice(), 3)
+            opened_game.release()
+            game.release()
+        game.play(10, seed = 0, shared_memory = True)
+        attached_game = Game.attach(game.get_name_of_shared_memory())
+        self.assertEqual(attached_game.get_number_of_dice(), 3)
+        attached_game.release()
+        game.release()
+
+    def test_get_version(self):
+        '''
+        Tests Game.get_version
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the version of a game increases when its rolls are replaced and not when rolls are appended
+
+        Exceptions raised:
+            AssertionError if the version of a game changes unexpectedly
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3, 4], dtype = np.int8))])
+        game.play(10, append = True)
+        version = game.get_version()
+        game.play(10, append = True)
+        self.assertEqual(game.get_version(), version)
+        game.play(10)
+        self.assertGreater(game.get_version(), version)
+
+    def test_get_metadata(self):
+        '''
+        Tests Game.get_metadata
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the metadata of a play holds the fingerprints of the dice, a seed from which the play may be repeated, and the chunk size
+
+        Exceptions raised:
+            AssertionError if the metadata of a play is unexpected or does not repeat the play
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        list_of_dice = [Die(array_of_faces), Die.from_weights(array_of_faces, np.array([1.0, 2.0, 3.0, 4.0]))]
+        game = Game(list_of_dice)
+        game.play(100, seed = 0, chunk_size = 64)
+        dictionary_of_metadata = game.get_metadata()
+        self.assertEqual(dictionary_of_metadata['fingerprints'], [die.get_fingerprint().hex() for die in list_of_dice])
+        self.assertEqual(dictionary_of_metadata['chunk_size'], 64)
+        dictionary_of_seed = dictionary_of_metadata['seed']
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        game.play(100, seed = np.random.SeedSequence(dictionary_of_seed['entropy'], spawn_key = dictionary_of_seed['spawn_key']), chunk_size = dictionary_of_metadata['chunk_size'])
+        self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_codes))
+        game.play(100)
+        self.assertIsNone(game.get_metadata()['seed'])
 
     def test_show(self):
         '''
@@ -106,6 +704,9 @@ class TestGame(unittest.TestCase):
         Side effects:
             Compares data frames of rolls and dice with integer and string faces, where each number of rows and observations is the number of rolls, each number of columns and features is the number of dice, and each cell value is a face rolled.
             Compares data frames of rolls, dice, and integer and string faces, where each row corresponds to a roll, each data frame has a face column, and each cell value is a face rolled.
+            Ensures a data frame of codes views the matrix of codes of a game in C and F order without copying it.
+            Ensures a data frame in narrow form is cached until the game is played again.
+            Ensures string faces are shown as categories of the faces of the game and numeric faces are not.
 
         Exceptions raised:
             AssertionError if a shown data frame of rolls and dice does not equal an expected data frame of rolls and dice, or
@@ -115,24 +716,31 @@ class TestGame(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         shown_data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
-        for i in range(0, 10):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        shown_data_frame_of_rolls_and_dice = game.show('narrow')
-        expected_data_frame_of_rolls_and_dice = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
-        expected_data_frame_of_rolls_and_dice.index.rename(['roll_index', 'die_index'], inplace = True)
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
+        # Identical dice are rolled together, row by row, with the generator of the first chunk of the seed sequence of the first die.
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(10)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 10)).reshape(20, 10))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        shown_data_frame_of_rolls_dice_and_faces = game.show('narrow')
+        expected_data_frame_of_rolls_dice_and_faces = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
+        expected_data_frame_of_rolls_dice_and_faces.index.rename(['roll_index', 'die_index'], inplace = True)
+        self.assertTrue(shown_data_frame_of_rolls_dice_and_faces.index.equals(expected_data_frame_of_rolls_dice_and_faces.index))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_dice_and_faces['face'].to_numpy(), expected_data_frame_of_rolls_dice_and_faces['face'].to_numpy()))
+        self.assertIs(game.show('narrow'), shown_data_frame_of_rolls_dice_and_faces)
+        for order in ['C', 'F']:
+            game.play(20, seed = 0, order = order)
+            self.assertTrue(np.shares_memory(game.show('codes').to_numpy(), game.get_matrix_of_codes()))
+            self.assertTrue(np.array_equal(game.show('wide').to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+            self.assertEqual(game.show('wide').index.name, 'roll_index')
+            self.assertIsNot(game.show('narrow'), shown_data_frame_of_rolls_dice_and_faces)
+            self.assertTrue(game.show('narrow').equals(shown_data_frame_of_rolls_dice_and_faces))
 
         list_of_fair_coins = []
         for i in range(0, 3):
@@ -141,18 +749,61 @@ class TestGame(unittest.TestCase):
             list_of_fair_coins.append(fair_coin)
         game_with_three_fair_coins = Game(list_of_fair_coins)
         number_of_rolls = 10
-        game_with_three_fair_coins.play(number_of_rolls)
+        game_with_three_fair_coins.play(number_of_rolls, seed = 0)
         shown_data_frame_of_rolls_and_dice = game_with_three_fair_coins.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = ['T', 'T', 'T', 'T', 'H', 'T', 'H', 'T', 'T', 'H']
-        for i in range(0, 3):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        shown_data_frame_of_rolls_and_dice = game_with_three_fair_coins.show('narrow')
-        expected_data_frame_of_rolls_and_dice = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
-        expected_data_frame_of_rolls_and_dice.index.rename(['roll_index', 'die_index'], inplace = True)
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        Die._roll_is_being_tested = False
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(3)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(number_of_rolls * 3)).reshape(number_of_rolls, 3))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        shown_data_frame_of_rolls_dice_and_faces = game_with_three_fair_coins.show('narrow')
+        expected_data_frame_of_rolls_dice_and_faces = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
+        expected_data_frame_of_rolls_dice_and_faces.index.rename(['roll_index', 'die_index'], inplace = True)
+        self.assertTrue(shown_data_frame_of_rolls_dice_and_faces.index.equals(expected_data_frame_of_rolls_dice_and_faces.index))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_dice_and_faces['face'].to_numpy(), expected_data_frame_of_rolls_dice_and_faces['face'].to_numpy()))
+        # String faces are categories of the vocabulary of the game, whose codes take one byte per cell.
+        for data_frame_of_faces in [shown_data_frame_of_rolls_and_dice, shown_data_frame_of_rolls_dice_and_faces]:
+            for series_of_faces in [data_frame_of_faces[column] for column in data_frame_of_faces.columns]:
+                self.assertIsInstance(series_of_faces.dtype, pd.CategoricalDtype)
+                self.assertEqual(series_of_faces.cat.categories.tolist(), ['H', 'T'])
+                self.assertEqual(series_of_faces.cat.codes.dtype, np.int8)
+        self.assertFalse(isinstance(game.show('wide')[0].dtype, pd.CategoricalDtype))
+
+    def test_iter_narrow(self):
+        '''
+        Tests Game.iter_narrow
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the chunks of a game in narrow form, in C and F order and in a file, together equal the data frame of the game in narrow form
+            Ensures a game cannot be provided in chunks before it is played, when it stores only counts, or with a chunk size that is not positive
+
+        Exceptions raised:
+            AssertionError if concatenated chunks do not equal the data frame in narrow form, or a chunk has an unexpected number of rows
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array(['H', 'T'])) for _ in range(3)])
+        with self.assertRaises(AssertionError):
+            next(game.iter_narrow())
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            for order, path_to_file in [('C', None), ('F', None), ('C', os.path.join(path_to_directory, 'game.bin'))]:
+                game.play(25, seed = 0, order = order, path_to_file = path_to_file)
+                list_of_data_frames_of_rolls_dice_and_faces = list(game.iter_narrow(chunk_size = 10))
+                self.assertEqual([len(data_frame) for data_frame in list_of_data_frames_of_rolls_dice_and_faces], [30, 30, 15])
+                self.assertTrue(pd.concat(list_of_data_frames_of_rolls_dice_and_faces).equals(game.show('narrow')))
+            game.release()
+        with self.assertRaises(ValueError):
+            game.play(10)
+            game.iter_narrow(chunk_size = 0)
+        game.play(10, store = 'counts')
+        with self.assertRaises(ValueError):
+            game.iter_narrow()
 
 if __name__ == "__main__":
     verbose = 2
@@ -0,0 +1,84 @@
+'''
+Module for class TestSampler, which tests the methods of Sampler, UniformSampler, and CumulativeDistributionSampler objects
+'''
+
+from montecarlosimulator import Sampler
+from montecarlosimulator import UniformSampler
+from montecarlosimulator import CumulativeDistributionSampler
+import numpy as np
+import unittest
+
+class TestSampler(unittest.TestCase):
+    '''
+    Tests the methods of Sampler, UniformSampler, and CumulativeDistributionSampler objects
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_init
+        test_sample
+    '''
+
+    def test_init(self):
+        '''
+        Tests Sampler.__init__, UniformSampler.__init__, and CumulativeDistributionSampler.__init__
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures building a sampler from an empty array of weights, a negative weight, or weights that sum to zero raises a value error,
+                    building a uniform sampler from unequal weights raises a value error, and
+                    sampling from the base sampler raises a not-implemented error
+
+        Exceptions raised:
+            AssertionError if building a sampler from invalid weights succeeds or sampling from the base sampler succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        for type_of_sampler in [Sampler, UniformSampler, CumulativeDistributionSampler]:
+            for array_of_invalid_weights in [np.array([]), np.array([1.0, -1.0]), np.array([0.0, 0.0])]:
+                with self.assertRaises(ValueError):
+                    type_of_sampler(array_of_invalid_weights)
+        with self.assertRaises(ValueError):
+            UniformSampler(np.array([1.0, 2.0]))
+        with self.assertRaises(NotImplementedError):
+            Sampler(np.array([1.0, 2.0])).sample(10, np.random.default_rng(0))
+
+    def test_sample(self):
+        '''
+        Tests UniformSampler.sample and CumulativeDistributionSampler.sample
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the relative frequencies of sampled indices approximate the normalized weights and indices with weight zero, including the last index, are never sampled
+
+        Exceptions raised:
+            AssertionError if the relative frequencies of sampled indices do not approximate the normalized weights or an index with weight zero is sampled
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        generator = np.random.default_rng(0)
+        for type_of_sampler, array_of_weights in [(UniformSampler, np.array([3.0, 3.0, 3.0])), (CumulativeDistributionSampler, np.array([1.0, 5.0, 0.0, 2.0, 0.0]))]:
+            sampler = type_of_sampler(array_of_weights)
+            array_of_indices = sampler.sample(100000, generator)
+            array_of_relative_frequencies = np.bincount(array_of_indices, minlength = len(array_of_weights)) / len(array_of_indices)
+            self.assertTrue(np.all(array_of_relative_frequencies[array_of_weights == 0] == 0))
+            self.assertTrue(np.allclose(array_of_relative_frequencies, array_of_weights / array_of_weights.sum(), atol = 0.01))
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
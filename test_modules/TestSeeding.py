@@ -0,0 +1,134 @@
+'''
+Module for class TestSeeding, which tests the functions of module Seeding
+'''
+
+from montecarlosimulator import generate_seed_sequence
+from montecarlosimulator import generate_generator
+from montecarlosimulator import generate_list_of_generators
+from montecarlosimulator import generate_generator_for_chunk
+import numpy as np
+import unittest
+
+class TestSeeding(unittest.TestCase):
+    '''
+    Tests the functions of module Seeding
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_generate_seed_sequence
+        test_generate_generator
+        test_generate_list_of_generators
+        test_generate_generator_for_chunk
+    '''
+
+    def test_generate_seed_sequence(self):
+        '''
+        Tests generate_seed_sequence
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a seed sequence is used as is, an integer seed generates the same seed sequence every time, and a random number generator spawns a new child seed sequence every time
+
+        Exceptions raised:
+            AssertionError if a seed sequence is not used as is, an integer seed generates different seed sequences, or a random number generator spawns the same child seed sequence twice
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        seed_sequence = np.random.SeedSequence(0)
+        self.assertIs(generate_seed_sequence(seed_sequence), seed_sequence)
+        self.assertEqual(generate_seed_sequence(0).generate_state(4).tolist(), seed_sequence.generate_state(4).tolist())
+        generator = np.random.default_rng(0)
+        first_child_seed_sequence = generate_seed_sequence(generator)
+        second_child_seed_sequence = generate_seed_sequence(generator)
+        self.assertNotEqual(first_child_seed_sequence.generate_state(4).tolist(), second_child_seed_sequence.generate_state(4).tolist())
+        with self.assertRaises(TypeError):
+            generate_seed_sequence('seed_of_unsupported_type')
+
+    def test_generate_generator(self):
+        '''
+        Tests generate_generator
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a random number generator is used as is and an integer seed generates reproducible streams
+
+        Exceptions raised:
+            AssertionError if a random number generator is not used as is or an integer seed generates different streams
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        generator = np.random.default_rng(0)
+        self.assertIs(generate_generator(generator), generator)
+        self.assertTrue(np.array_equal(generate_generator(0).random(10), generate_generator(0).random(10)))
+
+    def test_generate_list_of_generators(self):
+        '''
+        Tests generate_list_of_generators
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures generators spawned from the same seed draw the same streams, and generators spawned together draw different streams
+
+        Exceptions raised:
+            AssertionError if generators spawned from the same seed draw different streams, or generators spawned together draw the same stream
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        list_of_first_streams = [generator.random(10) for generator in generate_list_of_generators(0, 3)]
+        list_of_second_streams = [generator.random(10) for generator in generate_list_of_generators(0, 3)]
+        for first_stream, second_stream in zip(list_of_first_streams, list_of_second_streams):
+            self.assertTrue(np.array_equal(first_stream, second_stream))
+        self.assertFalse(np.array_equal(list_of_first_streams[0], list_of_first_streams[1]))
+
+    def test_generate_generator_for_chunk(self):
+        '''
+        Tests generate_generator_for_chunk
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the generator for a chunk draws the same stream as the child spawned at the same index and does not advance the spawn counter of the seed sequence
+
+        Exceptions raised:
+            AssertionError if the generator for a chunk draws a different stream than the child spawned at the same index or advances the spawn counter
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        seed_sequence = np.random.SeedSequence(0)
+        stream_of_chunk = generate_generator_for_chunk(seed_sequence, 2).random(10)
+        self.assertEqual(seed_sequence.n_children_spawned, 0)
+        stream_of_child = np.random.default_rng(seed_sequence.spawn(3)[2]).random(10)
+        self.assertTrue(np.array_equal(stream_of_chunk, stream_of_child))
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
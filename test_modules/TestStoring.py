@@ -0,0 +1,147 @@
+'''
+Module for class TestStoring, which tests the functions of module Storing
+'''
+
+from montecarlosimulator import create_memory_mapped_matrix_of_codes
+from montecarlosimulator import extend_memory_mapped_matrix_of_codes
+from montecarlosimulator import open_memory_mapped_matrix_of_codes
+import numpy as np
+import os
+import tempfile
+import unittest
+
+class TestStoring(unittest.TestCase):
+    '''
+    Tests the functions of module Storing
+
+    Instance variables:
+        none
+
+    Public methods:
+        test_create_memory_mapped_matrix_of_codes
+        test_open_memory_mapped_matrix_of_codes
+        test_extend_memory_mapped_matrix_of_codes
+    '''
+
+    def test_create_memory_mapped_matrix_of_codes(self):
+        '''
+        Tests create_memory_mapped_matrix_of_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a created matrix of codes maps a file in C and F order with an aligned offset, and an empty matrix of codes is created in memory
+
+        Exceptions raised:
+            AssertionError if a created matrix of codes has an unexpected type, shape, data type, order, or offset
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C'])
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'game.bin')
+            for order in ['C', 'F']:
+                matrix_of_codes = create_memory_mapped_matrix_of_codes(path_to_file, array_of_faces, (100, 4), np.uint8, order)
+                self.assertIsInstance(matrix_of_codes, np.memmap)
+                self.assertEqual(matrix_of_codes.shape, (100, 4))
+                self.assertEqual(matrix_of_codes.dtype, np.uint8)
+                self.assertTrue(matrix_of_codes.flags.c_contiguous if order == 'C' else matrix_of_codes.flags.f_contiguous)
+                self.assertEqual(matrix_of_codes.offset % 64, 0)
+                del matrix_of_codes
+            matrix_of_codes = create_memory_mapped_matrix_of_codes(path_to_file, array_of_faces, (0, 4), np.uint8, 'C')
+            self.assertNotIsInstance(matrix_of_codes, np.memmap)
+            self.assertEqual(matrix_of_codes.shape, (0, 4))
+
+    def test_open_memory_mapped_matrix_of_codes(self):
+        '''
+        Tests open_memory_mapped_matrix_of_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures an opened file provides the faces, codes, and metadata written into it, read-only by default and writable on request
+
+        Exceptions raised:
+            AssertionError if an opened file provides unexpected faces, codes, or metadata, or has unexpected writability
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1.5, 2.5, 3.5])
+        dictionary_of_metadata = {'fingerprints': ['00'], 'seed': {'entropy': 2 ** 100, 'spawn_key': [1]}, 'chunk_size': 8}
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'game.bin')
+            matrix_of_codes = create_memory_mapped_matrix_of_codes(path_to_file, array_of_faces, (10, 2), np.uint8, 'F', dictionary_of_metadata)
+            matrix_of_codes[:] = np.arange(20).reshape(10, 2) % 3
+            matrix_of_codes.flush()
+            del matrix_of_codes
+            array_of_opened_faces, matrix_of_opened_codes, dictionary_of_opened_metadata = open_memory_mapped_matrix_of_codes(path_to_file)
+            self.assertTrue(np.array_equal(array_of_opened_faces, array_of_faces))
+            self.assertEqual(array_of_opened_faces.dtype, array_of_faces.dtype)
+            self.assertTrue(np.array_equal(matrix_of_opened_codes, np.arange(20).reshape(10, 2) % 3))
+            self.assertTrue(matrix_of_opened_codes.flags.f_contiguous)
+            self.assertFalse(matrix_of_opened_codes.flags.writeable)
+            self.assertEqual(dictionary_of_opened_metadata, dictionary_of_metadata)
+            del matrix_of_opened_codes
+            _, matrix_of_opened_codes, _ = open_memory_mapped_matrix_of_codes(path_to_file, mode = 'r+')
+            self.assertTrue(matrix_of_opened_codes.flags.writeable)
+            del matrix_of_opened_codes
+
+    def test_extend_memory_mapped_matrix_of_codes(self):
+        '''
+        Tests extend_memory_mapped_matrix_of_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures an extended file keeps its codes and metadata, records the new number of rolls, and provides a matrix with the requested capacity, and a file in F order cannot be extended
+
+        Exceptions raised:
+            AssertionError if an extended file loses codes or metadata, records an unexpected number of rolls, or provides a matrix of unexpected shape
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3])
+        dictionary_of_metadata = {'chunk_size': 8}
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'game.bin')
+            matrix_of_codes = create_memory_mapped_matrix_of_codes(path_to_file, array_of_faces, (10, 2), np.uint8, 'C', dictionary_of_metadata)
+            matrix_of_codes[:] = np.arange(20).reshape(10, 2) % 3
+            matrix_of_codes.flush()
+            del matrix_of_codes
+            matrix_of_codes_with_capacity = extend_memory_mapped_matrix_of_codes(path_to_file, 15, 40)
+            self.assertEqual(matrix_of_codes_with_capacity.shape, (40, 2))
+            self.assertTrue(np.array_equal(matrix_of_codes_with_capacity[:10], np.arange(20).reshape(10, 2) % 3))
+            matrix_of_codes_with_capacity[10:15] = 1
+            matrix_of_codes_with_capacity.flush()
+            del matrix_of_codes_with_capacity
+            _, matrix_of_opened_codes, dictionary_of_opened_metadata = open_memory_mapped_matrix_of_codes(path_to_file)
+            self.assertEqual(matrix_of_opened_codes.shape, (15, 2))
+            self.assertTrue(np.array_equal(matrix_of_opened_codes[10:], np.ones((5, 2))))
+            self.assertEqual(dictionary_of_opened_metadata, dictionary_of_metadata)
+            del matrix_of_opened_codes
+            matrix_of_codes = create_memory_mapped_matrix_of_codes(path_to_file, array_of_faces, (10, 2), np.uint8, 'F')
+            del matrix_of_codes
+            with self.assertRaises(ValueError):
+                extend_memory_mapped_matrix_of_codes(path_to_file, 15, 40)
+
+if __name__ == "__main__":
+    verbose = 2
+    unittest.main(verbosity = verbose)
@@ -7,6 +7,11 @@ TestAnalyzer, which tests the methods of an Analyzer object
 from montecarlosimulator import Die
 import numpy as np
 import pandas as pd
+from montecarlosimulator import AliasTable
+from montecarlosimulator import CumulativeDistributionSampler
+from montecarlosimulator import UniformSampler
+import os
+import tempfile
 import unittest
 
 class TestDie(unittest.TestCase):
@@ -18,8 +23,18 @@ class TestDie(unittest.TestCase):
 
     Public methods:
         test_init
+        test_from_weights
+        test_from_data_frame
+        test_from_file
         test_change_weight
+        test_change_weights
+        test_set_sampler
         test_roll
+        test_roll_codes
+        test_roll_face_counts
+        test_iter_rolls
+        test_get_array_of_faces
+        test_get_fingerprint
         test_show
     '''
 
@@ -57,6 +72,103 @@ class TestDie(unittest.TestCase):
         shown_data_frame_of_faces_and_weights = die.show()
         self.assertTrue(shown_data_frame_of_faces_and_weights.equals(expected_data_frame_of_faces_and_weights))
 
+    def test_from_weights(self):
+        '''
+        Tests Die.from_weights
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the data frame of faces and weights of a die created from faces and weights with an expected data frame of faces and weights, and
+                    ensures creating a die from duplicate faces, mismatched numbers of faces and weights, negative weights, or weights that sum to zero raises a value error
+
+        Exceptions raised:
+            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights, or
+                              creating a die from invalid faces or weights succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'], dtype = str)
+        array_of_weights = np.array([5.0, 1.0])
+        expected_data_frame_of_faces_and_weights = pd.DataFrame({'face': array_of_faces, 'weight': array_of_weights})
+        die = Die.from_weights(array_of_faces, array_of_weights)
+        self.assertTrue(die.show().equals(expected_data_frame_of_faces_and_weights))
+        self.assertEqual(len(die._dictionary_of_types_and_samplers), 1)
+
+        for array_of_invalid_faces, array_of_invalid_weights in [(np.array(['H', 'H']), np.array([1.0, 1.0])), (array_of_faces, np.array([1.0])), (array_of_faces, np.array([1.0, -1.0])), (array_of_faces, np.array([0.0, 0.0]))]:
+            with self.assertRaises(ValueError):
+                Die.from_weights(array_of_invalid_faces, array_of_invalid_weights)
+
+    def test_from_data_frame(self):
+        '''
+        Tests Die.from_data_frame
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a die created from the shown data frame of faces and weights of another die has the same data frame of faces and weights
+            Ensures a die created from a column of objects that are integers keeps integer faces whose weights can be changed
+
+        Exceptions raised:
+            AssertionError if the shown data frames of faces and weights of the two dice are not equal
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C'], dtype = str)
+        die = Die(array_of_faces)
+        die.change_weights({'A': 3.0, 'B': 2.0})
+        copy_of_die = Die.from_data_frame(die.show())
+        self.assertTrue(copy_of_die.show().equals(die.show()))
+
+        data_frame_of_faces_and_weights = pd.DataFrame({'face': pd.Series([1, 2, 3], dtype = object), 'weight': [1.0, 2.0, 3.0]})
+        die_with_object_faces = Die.from_data_frame(data_frame_of_faces_and_weights)
+        self.assertEqual(die_with_object_faces.get_array_of_faces().tolist(), [1, 2, 3])
+        die_with_object_faces.change_weight(1, 5.0)
+        self.assertEqual(die_with_object_faces.show().loc[0, 'weight'], 5.0)
+
+    def test_from_file(self):
+        '''
+        Tests Die.from_file
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Writes a temporary tab-delimited file of letters and weights and compares the data frames of faces and weights of dice read from the file with and without memory mapping with an expected data frame of faces and weights
+
+        Exceptions raised:
+            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C'], dtype = str)
+        array_of_weights = np.array([8.4966, 2.0720, 4.5388])
+        expected_data_frame_of_faces_and_weights = pd.DataFrame({'face': array_of_faces, 'weight': array_of_weights})
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'Letter_Weights.txt')
+            with open(path_to_file, 'w') as file:
+                file.write('A\t8.4966\nB\t2.0720\nC\t4.5388\n')
+            for memory_map in [False, True]:
+                die = Die.from_file(path_to_file, memory_map = memory_map)
+                self.assertTrue(die.show().equals(expected_data_frame_of_faces_and_weights))
+
     def test_change_weight(self):
         '''
         Tests Die.change_weight
@@ -102,6 +214,103 @@ class TestDie(unittest.TestCase):
         except ValueError as e:
             pass
 
+    def test_change_weights(self):
+        '''
+        Tests Die.change_weights
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures weights in the data frame of faces and weights of a die are changed from a dictionary, a series, and an aligned array of weights, and
+                    attempting to change weights with a face that does not exist, an aligned array with the wrong length, or a weight that cannot be converted to np.float64 raises a value error and changes no weight
+
+        Exceptions raised:
+            AssertionError if weights in the data frame of faces and weights of a die are not changed, or
+                              attempting to change weights with invalid faces or weights succeeds or changes a weight
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C', 'D'], dtype = str)
+        die = Die(array_of_faces)
+        die.change_weights({'A': 2.0, 'C': 3.0})
+        self.assertEqual(die.show()['weight'].to_list(), [2.0, 1.0, 3.0, 1.0])
+        die.change_weights(pd.Series([5.0, 6.0], index = ['D', 'B']))
+        self.assertEqual(die.show()['weight'].to_list(), [2.0, 6.0, 3.0, 5.0])
+        die.change_weights(np.array([4.0, 3.0, 2.0, 1.0]))
+        self.assertEqual(die.show()['weight'].to_list(), [4.0, 3.0, 2.0, 1.0])
+
+        for invalid_weights in [{'A': 7.0, 'face_that_does_not_exist_in_data_frame_of_faces_and_weights_of_die': 7.0}, np.array([7.0, 7.0]), {'A': 'weight_that_cannot_be_converted_to_np.float64'}]:
+            with self.assertRaises(ValueError):
+                die.change_weights(invalid_weights)
+            self.assertEqual(die.show()['weight'].to_list(), [4.0, 3.0, 2.0, 1.0])
+
+    def test_set_sampler(self):
+        '''
+        Tests Die.set_sampler
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a die with equal weights, few faces, and many faces is rolled with the expected automatically selected type of sampler,
+                    a die whose alias table has been built, such as a die created by from_weights, reuses it for few rolls,
+                    a forced type of sampler is used and builds a sampler only once until a weight changes,
+                    forcing a uniform sampler on a die with unequal weights raises a value error when the die is rolled, and
+                    forcing an unknown type of sampler raises a value error
+
+        Exceptions raised:
+            AssertionError if a die is rolled with an unexpected type of sampler, or
+                              rolling with a forced uniform sampler and unequal weights or forcing an unknown type of sampler succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        die = Die(np.array(['H', 'T'], dtype = str), seed = 0)
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [UniformSampler])
+        die.change_weight('H', 5.0)
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [CumulativeDistributionSampler])
+
+        die = Die(np.arange(100), seed = 0)
+        die.change_weights(np.arange(2.0, 102.0))
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [CumulativeDistributionSampler])
+        die.roll(200)
+        self.assertIn(AliasTable, die._dictionary_of_types_and_samplers)
+
+        die = Die.from_weights(np.arange(100), np.arange(1.0, 101.0), seed = 0)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [AliasTable])
+        alias_table = die._dictionary_of_types_and_samplers[AliasTable]
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [AliasTable])
+        self.assertIs(Die.from_weights(np.arange(100), np.arange(1.0, 101.0))._get_sampler(10), alias_table)
+        die.set_sampler('alias_table')
+        die.roll(10)
+        self.assertIs(die._dictionary_of_types_and_samplers[AliasTable], alias_table)
+        die.change_weight(0, 2.0)
+        die.roll(10)
+        self.assertEqual(list(die._dictionary_of_types_and_samplers), [AliasTable])
+        self.assertIsNot(die._dictionary_of_types_and_samplers[AliasTable], alias_table)
+
+        die.set_sampler('uniform')
+        with self.assertRaises(ValueError):
+            die.roll(10)
+        die.set_sampler(None)
+        die.roll(10)
+        with self.assertRaises(ValueError):
+            die.set_sampler('name_of_sampler_that_does_not_exist')
+
     def test_roll(self):
         '''
         Tests Die.roll
@@ -113,33 +322,200 @@ class TestDie(unittest.TestCase):
             none
 
         Side effects:
-            Ensures a list of rolled faces for a die is equal to an expected list of rolled faces when roll is being tested
+            Ensures a list of rolled faces for a die with a seed is equal to an expected list of rolled faces, and
+                    two dice with the same seed roll the same faces
 
         Exceptions raised:
-            AssertionError if a list of rolled faces for a die is not equal to an expected list of rolled faces when roll is being tested
+            AssertionError if a list of rolled faces for a die with a seed is not equal to an expected list of rolled faces, or
+                              two dice with the same seed roll different faces
 
         Restrictions on when this method can be called:
             none
         '''
         
-        Die._roll_is_being_tested = True
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
-        die = Die(array_of_faces)
+        die = Die(array_of_faces, seed = 0)
         list_of_rolled_faces = die.roll(20)
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
+        expected_list_of_rolled_faces = [4, 3, 3, 2, 2, 1, 1, 1, 1, 4, 3, 4, 3, 3, 4, 3, 3, 3, 3, 4]
         self.assertEqual(list_of_rolled_faces, expected_list_of_rolled_faces)
+        self.assertEqual(Die(array_of_faces, seed = 0).roll(20), expected_list_of_rolled_faces)
+        self.assertEqual(die.roll(20, np.random.default_rng(0)), expected_list_of_rolled_faces)
 
         array_of_faces = np.array(['H', 'T'], dtype = str)
-        die = Die(array_of_faces)
+        die = Die(array_of_faces, seed = 0)
         list_of_rolled_faces = die.roll(10000)
         number_of_heads = list_of_rolled_faces.count('H')
-        self.assertEqual(5064, number_of_heads)
+        self.assertEqual(4970, number_of_heads)
 
         die.change_weight('H', 5.0)
         list_of_rolled_faces = die.roll(10000)
         number_of_heads = list_of_rolled_faces.count('H')
-        self.assertEqual(8345, number_of_heads)
-        Die._roll_is_being_tested = False
+        self.assertEqual(8333, number_of_heads)
+
+    def test_roll_codes(self):
+        '''
+        Tests Die.roll_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures an array of codes of rolled faces for a die has the smallest unsigned integer data type that fits the number of faces and decodes to the list of rolled faces provided by roll
+
+        Exceptions raised:
+            AssertionError if an array of codes of rolled faces has an unexpected data type or does not decode to the list of rolled faces provided by roll
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'], dtype = str)
+        die = Die(array_of_faces)
+        array_of_codes_of_rolled_faces = die.roll_codes(20, np.random.default_rng(0))
+        self.assertEqual(array_of_codes_of_rolled_faces.dtype, np.uint8)
+        list_of_rolled_faces = die.roll(20, np.random.default_rng(0))
+        self.assertEqual(die.get_array_of_faces()[array_of_codes_of_rolled_faces].tolist(), list_of_rolled_faces)
+
+        array_of_faces = np.arange(300)
+        die = Die(array_of_faces)
+        array_of_codes_of_rolled_faces = die.roll_codes(20)
+        self.assertEqual(array_of_codes_of_rolled_faces.dtype, np.uint16)
+        self.assertTrue(np.all(array_of_codes_of_rolled_faces < 300))
+
+    def test_roll_face_counts(self):
+        '''
+        Tests Die.roll_face_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the face counts of rolls of copies of a weighted die sum to the number of copies in each roll, never count a face with weight zero, and have means near the expected means
+            Ensures face counts cannot be drawn for a die whose weights sum to zero
+
+        Exceptions raised:
+            AssertionError if face counts have an unexpected shape, sum, or mean, or
+                              face counts are drawn for a die whose weights sum to zero
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        die = Die.from_weights(array_of_faces, np.array([1.0, 2.0, 0.0, 5.0]), seed = 0)
+        matrix_of_face_counts = die.roll_face_counts(10000, 40)
+        self.assertEqual(matrix_of_face_counts.shape, (10000, 4))
+        self.assertTrue(np.all(matrix_of_face_counts.sum(axis = 1) == 40))
+        self.assertTrue(np.all(matrix_of_face_counts[:, 2] == 0))
+        self.assertTrue(np.allclose(matrix_of_face_counts.mean(axis = 0), [5.0, 10.0, 0.0, 25.0], atol = 0.1))
+        die.change_weights(np.zeros(4))
+        with self.assertRaises(ValueError):
+            die.roll_face_counts(10, 40)
+
+    def test_iter_rolls(self):
+        '''
+        Tests Die.iter_rolls
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures chunks of codes of rolled faces have the expected sizes, are the same for the same seed and chunk size, and do not depend on how many chunks are consumed,
+                    an unbounded stream of chunks keeps yielding chunks, and
+                    a chunk size that is not positive raises a value error
+
+        Exceptions raised:
+            AssertionError if chunks of codes of rolled faces have unexpected sizes or differ for the same seed and chunk size, an unbounded stream stops, or a chunk size that is not positive is accepted
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        die = Die(np.array(['A', 'B', 'C'], dtype = str))
+        list_of_chunks = list(die.iter_rolls(10, chunk_size = 4, seed = 0))
+        self.assertEqual([len(chunk) for chunk in list_of_chunks], [4, 4, 2])
+        self.assertEqual(list_of_chunks[0].dtype, np.uint8)
+        list_of_chunks_for_same_seed = list(die.iter_rolls(10, chunk_size = 4, seed = 0))
+        for chunk, chunk_for_same_seed in zip(list_of_chunks, list_of_chunks_for_same_seed):
+            self.assertTrue(np.array_equal(chunk, chunk_for_same_seed))
+        unbounded_stream_of_chunks = die.iter_rolls(chunk_size = 4, seed = 0)
+        for chunk in list_of_chunks[:2]:
+            self.assertTrue(np.array_equal(next(unbounded_stream_of_chunks), chunk))
+        self.assertEqual(len(next(unbounded_stream_of_chunks)), 4)
+        with self.assertRaises(ValueError):
+            die.iter_rolls(10, chunk_size = 0)
+
+    def test_get_array_of_faces(self):
+        '''
+        Tests Die.get_array_of_faces
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the array of faces of a die with the array of faces with which the die was initialized
+
+        Exceptions raised:
+            AssertionError if the array of faces of a die is not equal to the array of faces with which the die was initialized
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        die = Die(array_of_faces)
+        self.assertTrue(np.array_equal(die.get_array_of_faces(), array_of_faces))
+
+    def test_get_fingerprint(self):
+        '''
+        Tests Die.get_fingerprint
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures dice with equal faces and weights have equal fingerprints and share one read-only sampler, and
+                    changing a weight changes the fingerprint of a die
+
+        Exceptions raised:
+            AssertionError if dice with equal faces and weights have different fingerprints or do not share a read-only sampler, or
+                              changing a weight does not change the fingerprint of a die
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.arange(20)
+        array_of_weights = np.arange(1.0, 21.0)
+        die_1 = Die.from_weights(array_of_faces, array_of_weights)
+        die_2 = Die.from_weights(array_of_faces.copy(), array_of_weights.copy())
+        self.assertEqual(die_1.get_fingerprint(), die_2.get_fingerprint())
+        self.assertNotEqual(die_1.get_fingerprint(), Die(array_of_faces).get_fingerprint())
+        self.assertNotEqual(die_1.get_fingerprint(), Die.from_weights(array_of_faces.astype(np.float64), array_of_weights).get_fingerprint())
+        sampler = die_1._get_sampler()
+        self.assertIsInstance(sampler, AliasTable)
+        self.assertIs(die_2._get_sampler(), sampler)
+        self.assertFalse(sampler._array_of_probabilities.flags.writeable)
+
+        die_2.change_weight(0, 2.0)
+        self.assertNotEqual(die_1.get_fingerprint(), die_2.get_fingerprint())
+        self.assertIsNot(die_2._get_sampler(), sampler)
+        self.assertIs(die_1._get_sampler(), sampler)
 
     def test_show(self):
         '''
@@ -153,9 +529,11 @@ class TestDie(unittest.TestCase):
 
         Side effects:
             Compares data frames of faces and weights for numpy arrays of integer and string faces
+            Ensures a shown data frame of faces and weights is cached until a weight is changed
 
         Exceptions raised:
-            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights
+            AssertionError if a shown data frame of faces and weights does not equal an expected data frame of faces and weights, or
+                              a shown data frame of faces and weights is not cached until a weight is changed
 
         Restrictions on when this method can be called:
             none
@@ -175,7 +553,18 @@ class TestDie(unittest.TestCase):
         expected_data_frame_of_faces_and_weights = pd.DataFrame({'face': array_of_faces, 'weight': array_of_weights})
         self.assertTrue(shown_data_frame_of_faces_and_weights.equals(expected_data_frame_of_faces_and_weights))
 
+        self.assertIs(fair_coin.show(), shown_data_frame_of_faces_and_weights)
+        fair_coin.change_weight('H', 3.0)
+        self.assertIsNot(fair_coin.show(), shown_data_frame_of_faces_and_weights)
+        self.assertEqual(fair_coin.show().at[0, 'weight'], 3.0)
+        self.assertFalse(hasattr(fair_coin, '__dict__'))
+
 from montecarlosimulator import Game
+from montecarlosimulator import count_codes_of_rows
+from montecarlosimulator import generate_generator_for_chunk
+import gc
+import subprocess
+import sys
 
 class TestGame(unittest.TestCase):
     '''
@@ -186,8 +575,21 @@ class TestGame(unittest.TestCase):
 
     Public methods:
         test_init
+        test_attach
+        test_open
         test_play
+        test_release
+        test_get_array_of_faces
+        test_get_matrix_of_codes
+        test_get_accumulator
+        test_get_matrix_of_face_counts
+        test_get_matrix_of_packed_codes
+        test_get_number_of_rolls
+        test_get_number_of_dice
+        test_get_version
+        test_get_metadata
         test_show
+        test_iter_narrow
     '''
 
     def test_init(self):
@@ -210,21 +612,119 @@ class TestGame(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         shown_data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
-        for i in range(0, 10):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        Die._roll_is_being_tested = False
+        # Identical dice are rolled together, row by row, with the generator of the first chunk of the seed sequence of the first die.
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(10)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 10)).reshape(20, 10))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        game.play(20, seed = 0)
+        self.assertTrue(game.show('wide').equals(shown_data_frame_of_rolls_and_dice))
+
+    def test_attach(self):
+        '''
+        Tests Game.attach
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game attached to the shared memory of a played game, in this process or in another process, views the same codes and shows the same faces without copying them, and that attaching in the process that played the game leaves the registration of the block with the resource tracker to the game that created it
+
+        Exceptions raised:
+            AssertionError if an attached game does not view the codes or show the faces of the played game, or if the resource tracker fails to unregister the block
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        list_of_dice = [Die(np.array(['H', 'T'])), Die(np.array(['T', 'H']))]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0, shared_memory = True)
+        name_of_shared_memory = game.get_name_of_shared_memory()
+        self.assertIsNotNone(name_of_shared_memory)
+        attached_game = Game.attach(name_of_shared_memory)
+        self.assertTrue(np.array_equal(attached_game.get_array_of_faces(), game.get_array_of_faces()))
+        self.assertTrue(np.array_equal(attached_game.get_matrix_of_codes(), game.get_matrix_of_codes()))
+        self.assertTrue(attached_game.show('wide').equals(game.show('wide')))
+        game.get_matrix_of_codes()[0, 0] = 1 - game.get_matrix_of_codes()[0, 0]
+        self.assertEqual(attached_game.get_matrix_of_codes()[0, 0], game.get_matrix_of_codes()[0, 0])
+        attached_game.release()
+
+        list_of_lists_of_rolled_faces = game.get_array_of_faces()[game.get_matrix_of_codes()].tolist()
+        code = 'from montecarlosimulator import Game; game = Game.attach(' + repr(name_of_shared_memory) + '); print(game.show(\'wide\').to_numpy().tolist() == ' + repr(list_of_lists_of_rolled_faces) + '); game.release()'
+        completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+        self.assertEqual(completed_process.stdout.strip(), 'True')
+        attached_game = Game.attach(name_of_shared_memory)
+        self.assertTrue(np.array_equal(attached_game.get_matrix_of_codes(), game.get_matrix_of_codes()))
+        attached_game.release()
+        game.release()
+
+        code = 'import numpy as np; from montecarlosimulator import Die, Game; game = Game([Die(np.array([1, 2, 3]))]); game.play(10, seed = 0, shared_memory = True); attached_game = Game.attach(game.get_name_of_shared_memory()); attached_game.release(); game.release()'
+        completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+        self.assertEqual(completed_process.returncode, 0)
+        self.assertNotIn('KeyError', completed_process.stderr)
+
+    def test_open(self):
+        '''
+        Tests Game.open
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game played into a file by one or more workers rolls the same faces as a game played in memory, and
+                    a game opened from that file, in this process or in a later process, maps the same codes and shows the same faces without playing again
+
+        Exceptions raised:
+            AssertionError if a game in a file or an opened game differs from a game played in memory, or
+                              a path to a file is accepted with shared memory
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        list_of_dice = [Die(np.array(['H', 'T'])), Die(np.array(['T', 'H']))]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0, chunk_size = 256)
+        matrix_of_codes = game.get_matrix_of_codes()
+        self.assertIsNone(game.get_path_of_file())
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'game.bin')
+            game_in_file = Game(list_of_dice)
+            for workers in [1, 2]:
+                game_in_file.play(1000, seed = 0, chunk_size = 256, workers = workers, path_to_file = path_to_file)
+                self.assertIsInstance(game_in_file.get_matrix_of_codes(), np.memmap)
+                self.assertEqual(game_in_file.get_path_of_file(), path_to_file)
+                self.assertTrue(np.array_equal(game_in_file.get_matrix_of_codes(), matrix_of_codes))
+            game_in_file.release()
+
+            opened_game = Game.open(path_to_file)
+            self.assertTrue(np.array_equal(opened_game.get_array_of_faces(), game.get_array_of_faces()))
+            self.assertTrue(np.array_equal(opened_game.get_matrix_of_codes(), matrix_of_codes))
+            self.assertFalse(opened_game.get_matrix_of_codes().flags.writeable)
+            self.assertEqual(opened_game.get_metadata(), game.get_metadata())
+            self.assertTrue(opened_game.show('wide').equals(game.show('wide')))
+            opened_game.release()
+
+            list_of_lists_of_rolled_faces = game.get_array_of_faces()[matrix_of_codes].tolist()
+            code = 'from montecarlosimulator import Game; game = Game.open(' + repr(path_to_file) + '); print(game.show(\'wide\').to_numpy().tolist() == ' + repr(list_of_lists_of_rolled_faces) + '); game.release()'
+            completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+            self.assertEqual(completed_process.stdout.strip(), 'True')
+            with self.assertRaises(ValueError):
+                game.play(10, shared_memory = True, path_to_file = path_to_file)
 
     def test_play(self):
         '''
@@ -238,29 +738,509 @@ class TestGame(unittest.TestCase):
 
         Side effects:
             Compares data frames of rolls and dice, where each number of rows and observations is the number of rolls, each number of columns and features is the number of dice, and each cell value is a face rolled
+            Ensures a game played with a seed by several worker processes rolls the same faces as a game played by one
+            Ensures rolls appended in memory, in a file, or to counts keep earlier rolls and roll the same faces for the same plays and appends in either order, and rolls cannot be appended with a seed, another store, more workers in private memory, shared memory, or changed dice
 
         Exceptions raised:
-            AssertionError if a shown data frame of rolls and dice does not equal an expected data frame of rolls and dice
+            AssertionError if a shown data frame of rolls and dice does not equal an expected data frame of rolls and dice, or
+                              the faces rolled depend on the number of worker processes
 
         Restrictions on when this method can be called:
             none
         '''
         
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         shown_data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
-        for i in range(0, 10):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        Die._roll_is_being_tested = False
+        # Identical dice are rolled together, row by row, with the generator of the first chunk of the seed sequence of the first die.
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(10)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 10)).reshape(20, 10))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        self.assertFalse(np.array_equal(shown_data_frame_of_rolls_and_dice[0].to_numpy(), shown_data_frame_of_rolls_and_dice[1].to_numpy()))
+
+        array_of_weights = np.array([1.0, 2.0, 3.0, 4.0])
+        list_of_dice = [Die(array_of_faces), Die.from_weights(array_of_faces, array_of_weights), Die(array_of_faces), Die.from_weights(array_of_faces, array_of_weights)]
+        self.assertEqual(list_of_dice[0].get_fingerprint(), list_of_dice[2].get_fingerprint())
+        self.assertIs(list_of_dice[1]._get_sampler(), list_of_dice[3]._get_sampler())
+        game = Game(list_of_dice)
+        game.play(20, seed = 0)
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(4)
+        array_of_rolled_faces_of_fair_dice = np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 2)).reshape(20, 2)
+        array_of_rolled_faces_of_loaded_dice = np.array(Die.from_weights(array_of_faces, array_of_weights, seed = generate_generator_for_chunk(list_of_seed_sequences[1], 0)).roll(20 * 2)).reshape(20, 2)
+        array_of_expected_rolled_faces = np.column_stack([array_of_rolled_faces_of_fair_dice[:, 0], array_of_rolled_faces_of_loaded_dice[:, 0], array_of_rolled_faces_of_fair_dice[:, 1], array_of_rolled_faces_of_loaded_dice[:, 1]])
+        self.assertTrue(np.array_equal(game.show('wide').to_numpy(), array_of_expected_rolled_faces))
+
+        game.play(1000, seed = 0, chunk_size = 64)
+        matrix_of_codes_rolled_by_one_worker = game.get_matrix_of_codes().copy()
+        self.assertIsNone(game.get_name_of_shared_memory())
+        for workers in [2, 3]:
+            game.play(1000, seed = 0, workers = workers, chunk_size = 64)
+            self.assertIsNotNone(game.get_name_of_shared_memory())
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_codes_rolled_by_one_worker))
+        game.release()
+        with self.assertRaises(ValueError):
+            game.play(10, workers = 0)
+        with self.assertRaises(ValueError):
+            game.play(10, chunk_size = 0)
+
+        # Appended rolls continue the streams of the played rolls, so the same plays and appends roll the same faces, and earlier rolls are kept.
+        list_of_matrices_of_codes = []
+        for order in ['C', 'F']:
+            game = Game(list_of_dice)
+            game.play(100, seed = 0, chunk_size = 64, order = order)
+            matrix_of_codes_of_first_play = game.get_matrix_of_codes().copy()
+            data_frame_of_first_play = game.show('wide')
+            for number_of_rolls in [50, 1, 200]:
+                game.play(number_of_rolls, chunk_size = 64, append = True)
+            self.assertEqual(game.get_matrix_of_codes().shape, (351, 4))
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes()[:100], matrix_of_codes_of_first_play))
+            self.assertTrue(np.array_equal(game.show('wide').to_numpy(), game.get_array_of_faces()[game.get_matrix_of_codes()]))
+            self.assertTrue(np.array_equal(data_frame_of_first_play.to_numpy(), game.get_array_of_faces()[matrix_of_codes_of_first_play]))
+            list_of_matrices_of_codes.append(game.get_matrix_of_codes().copy())
+        self.assertTrue(np.array_equal(list_of_matrices_of_codes[0], list_of_matrices_of_codes[1]))
+        self.assertFalse(np.array_equal(list_of_matrices_of_codes[0][100:150], list_of_matrices_of_codes[0][:50]))
+        for store in ['counts', 'face_counts']:
+            game.play(100, seed = 0, chunk_size = 64, store = store)
+            for number_of_rolls in [50, 1, 200]:
+                game.play(number_of_rolls, append = True)
+            self.assertEqual(game.get_number_of_rolls(), 351)
+            self.assertTrue(np.array_equal(game.get_accumulator().get_array_of_totals_of_faces(), np.bincount(list_of_matrices_of_codes[0].ravel(), minlength = 4)))
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            path_to_file = os.path.join(path_to_directory, 'game.bin')
+            game.play(100, seed = 0, chunk_size = 64, path_to_file = path_to_file)
+            game.play(50, chunk_size = 64, append = True)
+            game.play(1, chunk_size = 64, append = True)
+            game.play(200, chunk_size = 64, append = True, workers = 2)
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes(), list_of_matrices_of_codes[0]))
+            opened_game = Game.open(path_to_file)
+            self.assertTrue(np.array_equal(opened_game.get_matrix_of_codes(), list_of_matrices_of_codes[0]))
+            opened_game.release()
+            game.release()
+        # Appended rolls are rolled with the chunk size of the played rolls, so appending whole chunks rolls what one play of all rolls does.
+        game.play(96, seed = 0, chunk_size = 64)
+        game.play(160, append = True)
+        matrix_of_appended_codes = game.get_matrix_of_codes().copy()
+        game.play(256, seed = 0, chunk_size = 64)
+        self.assertTrue(np.array_equal(matrix_of_appended_codes, game.get_matrix_of_codes()))
+        game.play(10, seed = 0)
+        with self.assertRaises(ValueError):
+            game.play(10, seed = 0, append = True)
+        with self.assertRaises(ValueError):
+            game.play(10, store = 'counts', append = True)
+        with self.assertRaises(ValueError):
+            game.play(10, chunk_size = 64, append = True)
+        with self.assertRaises(ValueError):
+            game.play(10, workers = 2, append = True)
+        game.play(10, shared_memory = True)
+        with self.assertRaises(ValueError):
+            game.play(10, append = True)
+        game.release()
+        list_of_dice[0].change_weight(1, 2.0)
+        game.play(10)
+        list_of_dice[0].change_weight(1, 1.0)
+        with self.assertRaises(ValueError):
+            game.play(10, append = True)
+
+    def test_release(self):
+        '''
+        Tests Game.release
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a released game has not been played and its block of shared memory can no longer be attached to, that the block of shared memory of a game played by workers is unlinked when the game is garbage-collected without being released, and that views of a matrix of codes in shared memory can still be read after their game is released or garbage-collected
+
+        Exceptions raised:
+            AssertionError if a released game has been played, a block of shared memory can still be attached to, or a view cannot be read after its game is released or garbage-collected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3]))])
+        game.play(10, seed = 0, shared_memory = True)
+        name_of_shared_memory = game.get_name_of_shared_memory()
+        game.release()
+        with self.assertRaises(AssertionError):
+            game.show('wide')
+        with self.assertRaises(FileNotFoundError):
+            Game.attach(name_of_shared_memory)
+        game.release()
+        game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])
+        game.play(1000, seed = 0, workers = 2)
+        name_of_shared_memory = game.get_name_of_shared_memory()
+        del game
+        gc.collect()
+        with self.assertRaises(FileNotFoundError):
+            Game.attach(name_of_shared_memory)
+
+        code = '\n'.join([
+            'import gc',
+            'import numpy as np',
+            'from montecarlosimulator import Die, Game',
+            'def play(workers):',
+            '    game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])',
+            '    game.play(1000, seed = 0, workers = workers, shared_memory = True)',
+            '    return game.get_matrix_of_codes()',
+            'game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])',
+            'game.play(1000, seed = 0, shared_memory = True)',
+            'matrix_of_codes = game.get_matrix_of_codes()',
+            'data_frame = game.show(\'codes\')',
+            'attached_game = Game.attach(game.get_name_of_shared_memory())',
+            'matrix_of_attached_codes = attached_game.get_matrix_of_codes()',
+            'matrix_of_expected_codes = matrix_of_codes.copy()',
+            'attached_game.release()',
+            'game.release()',
+            'del game, attached_game',
+            'matrix_of_codes_of_dropped_game = play(2)',
+            'gc.collect()',
+            'print(np.array_equal(matrix_of_codes, matrix_of_expected_codes) and np.array_equal(data_frame.to_numpy(), matrix_of_expected_codes) and np.array_equal(matrix_of_attached_codes, matrix_of_expected_codes) and np.array_equal(matrix_of_codes_of_dropped_game, play(1)))'
+        ])
+        completed_process = subprocess.run([sys.executable, '-c', code], capture_output = True, text = True)
+        self.assertEqual(completed_process.returncode, 0)
+        self.assertEqual(completed_process.stdout.strip(), 'True')
+
+    def test_get_array_of_faces(self):
+        '''
+        Tests Game.get_array_of_faces
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the array of faces of a game holds the faces of the first die followed by any other faces of the other dice, and
+                    getting the array of faces of a game that has not been played raises an assertion error
+
+        Exceptions raised:
+            AssertionError if the array of faces of a game is not as expected, or
+                              getting the array of faces of a game that has not been played succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array(['H', 'T'])), Die(np.array(['T', 'H', 'E']))])
+        with self.assertRaises(AssertionError):
+            game.get_array_of_faces()
+        game.play(10, seed = 0)
+        self.assertEqual(game.get_array_of_faces().tolist(), ['H', 'T', 'E'])
+
+    def test_get_matrix_of_codes(self):
+        '''
+        Tests Game.get_matrix_of_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the matrix of codes of a game has the smallest unsigned integer data type, the requested order, and codes that index the faces shown, including for dice whose faces are in different orders, and
+                    playing with an order other than C or F raises a value error
+
+        Exceptions raised:
+            AssertionError if the matrix of codes of a game does not have the expected data type, order, or codes, or
+                              playing with an invalid order succeeds
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        list_of_dice = [Die(np.array(['H', 'T'])), Die(np.array(['T', 'H'])), Die(np.array(['H', 'T']))]
+        game = Game(list_of_dice)
+        for order in ['C', 'F']:
+            game.play(100, seed = 0, order = order)
+            matrix_of_codes = game.get_matrix_of_codes()
+            self.assertEqual(matrix_of_codes.shape, (100, 3))
+            self.assertEqual(matrix_of_codes.dtype, np.uint8)
+            self.assertTrue(matrix_of_codes.flags.c_contiguous if order == 'C' else matrix_of_codes.flags.f_contiguous)
+            self.assertTrue(np.array_equal(game.get_array_of_faces()[matrix_of_codes], game.show('wide').to_numpy()))
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(3)
+        self.assertEqual(game.show('wide')[1].tolist(), Die(np.array(['T', 'H']), seed = generate_generator_for_chunk(list_of_seed_sequences[1], 0)).roll(100))
+
+        with self.assertRaises(ValueError):
+            game.play(10, order = 'A')
+
+    def test_get_accumulator(self):
+        '''
+        Tests Game.get_accumulator
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game that stores only counts accumulates the face totals, jackpots, and face combinations of the faces that the same seed rolls when codes are stored, by one or more workers, and
+                    a game that stores only counts cannot show or provide codes
+
+        Exceptions raised:
+            AssertionError if the accumulator of a game differs from the aggregates of the codes of the same play, or
+                              a game that stores only counts shows or provides codes
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        list_of_dice = [Die(array_of_faces) for i in range(0, 4)] + [Die.from_weights(array_of_faces[::-1], np.array([1.0, 2.0, 3.0, 4.0]))]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0, chunk_size = 256)
+        self.assertIsNone(game.get_accumulator())
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        for workers in [1, 2]:
+            game.play(1000, seed = 0, chunk_size = 256, workers = workers, store = 'counts')
+            accumulator = game.get_accumulator()
+            self.assertEqual(accumulator.get_number_of_rolls(), 1000)
+            self.assertTrue(np.array_equal(accumulator.get_array_of_totals_of_faces(), np.bincount(matrix_of_codes.ravel(), minlength = 4)))
+            self.assertEqual(accumulator.get_number_of_jackpots(), int(np.sum(matrix_of_codes.min(axis = 1) == matrix_of_codes.max(axis = 1))))
+            self.assertEqual(accumulator.get_combinations_and_counts()[1].sum(), 1000)
+        with self.assertRaises(ValueError):
+            game.show('wide')
+        with self.assertRaises(ValueError):
+            game.get_matrix_of_codes()
+        with self.assertRaises(ValueError):
+            game.play(10, store = 'rolls')
+
+    def test_get_matrix_of_face_counts(self):
+        '''
+        Tests Game.get_matrix_of_face_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures a game of different dice that stores face counts counts the faces of the codes that the same seed rolls, by one or more workers,
+                    a game of many identical dice that stores face counts draws face counts that agree with its accumulator and have means near the expected means, and
+                    a game that does not store face counts provides none
+
+        Exceptions raised:
+            AssertionError if a matrix of face counts differs from the counts of the codes of the same play, disagrees with the accumulator of the game, or has an unexpected mean, or
+                              a game that does not store face counts provides a matrix of face counts
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        game = Game([Die(array_of_faces) for i in range(0, 3)] + [Die(array_of_faces[::-1])])
+        game.play(1000, seed = 0, chunk_size = 256)
+        self.assertIsNone(game.get_matrix_of_face_counts())
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        matrix_of_expected_face_counts = np.stack([np.bincount(array_of_codes, minlength = 4) for array_of_codes in matrix_of_codes])
+        for workers in [1, 2]:
+            game.play(1000, seed = 0, chunk_size = 256, workers = workers, store = 'face_counts')
+            self.assertEqual(game.get_matrix_of_face_counts().dtype, np.uint8)
+            self.assertTrue(np.array_equal(game.get_matrix_of_face_counts(), matrix_of_expected_face_counts))
+
+        game = Game([Die.from_weights(array_of_faces, np.array([1.0, 1.0, 1.0, 5.0])) for i in range(0, 64)])
+        for workers in [1, 2]:
+            game.play(2000, seed = 0, chunk_size = 4096, workers = workers, store = 'face_counts')
+            matrix_of_face_counts = game.get_matrix_of_face_counts()
+            accumulator = game.get_accumulator()
+            self.assertTrue(np.all(matrix_of_face_counts.sum(axis = 1) == 64))
+            self.assertTrue(np.array_equal(accumulator.get_array_of_totals_of_faces(), matrix_of_face_counts.sum(axis = 0)))
+            self.assertEqual(accumulator.get_combinations_and_counts()[1].sum(), 2000)
+            self.assertTrue(np.allclose(matrix_of_face_counts.mean(axis = 0), [8.0, 8.0, 8.0, 40.0], atol = 0.3))
+            if workers == 1:
+                matrix_of_face_counts_of_one_worker = matrix_of_face_counts.copy()
+            else:
+                self.assertTrue(np.array_equal(matrix_of_face_counts, matrix_of_face_counts_of_one_worker))
+
+    def test_get_matrix_of_packed_codes(self):
+        '''
+        Tests Game.get_matrix_of_packed_codes
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures coins that store bits pack the codes rolled by coins that store codes, by one or more workers and when rolls are appended, and provide codes, face counts, and data frames unpacked from their bits
+            Ensures only a game of two faces may store bits, and a game that stores codes has no packed codes
+
+        Exceptions raised:
+            AssertionError if packed codes, unpacked codes, face counts, or data frames are unexpected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'])
+        list_of_coins = [Die(array_of_faces) for _ in range(11)] + [Die.from_weights(array_of_faces, np.array([1.0, 3.0]))]
+        game = Game(list_of_coins)
+        with self.assertRaises(AssertionError):
+            game.get_matrix_of_packed_codes()
+        game.play(100, seed = 0, chunk_size = 120)
+        self.assertIsNone(game.get_matrix_of_packed_codes())
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        data_frame_of_rolls_and_dice = game.show('wide')
+        for workers in [1, 2]:
+            game.play(100, seed = 0, chunk_size = 120, store = 'bits', workers = workers)
+            matrix_of_packed_codes = game.get_matrix_of_packed_codes()
+            self.assertEqual(matrix_of_packed_codes.shape, (100, 2))
+            self.assertTrue(np.array_equal(matrix_of_packed_codes, np.packbits(matrix_of_codes, axis = 1)))
+            self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_codes))
+            self.assertTrue(np.array_equal(game.get_matrix_of_face_counts(), count_codes_of_rows(matrix_of_codes, 2)))
+            self.assertTrue(game.show('wide').equals(data_frame_of_rolls_and_dice))
+            self.assertTrue(pd.concat(list(game.iter_narrow(chunk_size = 30))).equals(game.show('narrow')))
+            self.assertEqual(game.get_accumulator().get_number_of_rolls(), 100)
+            self.assertTrue(np.array_equal(game.get_accumulator().get_array_of_totals_of_faces(), np.bincount(matrix_of_codes.ravel(), minlength = 2)))
+        game.play(40, seed = 0, chunk_size = 120)
+        game.play(60, chunk_size = 120, append = True)
+        matrix_of_appended_codes = game.get_matrix_of_codes().copy()
+        game.play(40, seed = 0, chunk_size = 120, store = 'bits')
+        game.play(60, append = True)
+        self.assertEqual(game.get_number_of_rolls(), 100)
+        self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_appended_codes))
+        with self.assertRaises(ValueError):
+            Game([Die(np.array([1, 2, 3]))]).play(10, store = 'bits')
+
+    def test_get_number_of_rolls(self):
+        '''
+        Tests Game.get_number_of_rolls
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the number of rolls of a game counts the rolls played and appended, for games that store codes and counts
+
+        Exceptions raised:
+            AssertionError if the number of rolls of a game is unexpected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3, 4], dtype = np.int8))])
+        with self.assertRaises(AssertionError):
+            game.get_number_of_rolls()
+        for store in ['codes', 'counts']:
+            game.play(10, store = store)
+            self.assertEqual(game.get_number_of_rolls(), 10)
+            game.play(5, store = store, append = True)
+            self.assertEqual(game.get_number_of_rolls(), 15)
+
+    def test_get_number_of_dice(self):
+        '''
+        Tests Game.get_number_of_dice
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the number of dice of a game is the number of dice it was initialized with, before and after it is played, and that of the game it views for a game created by open or attach
+
+        Exceptions raised:
+            AssertionError if the number of dice of a game is unexpected
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3, 4], dtype = np.int8)) for _ in range(3)])
+        self.assertEqual(game.get_number_of_dice(), 3)
+        game.play(10, seed = 0, store = 'counts')
+        self.assertEqual(game.get_number_of_dice(), 3)
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(10, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            opened_game = Game.open(game.get_path_of_file())
+            self.assertEqual(opened_game.get_number_of_dice(), 3)
+            opened_game.release()
+            game.release()
+        game.play(10, seed = 0, shared_memory = True)
+        attached_game = Game.attach(game.get_name_of_shared_memory())
+        self.assertEqual(attached_game.get_number_of_dice(), 3)
+        attached_game.release()
+        game.release()
+
+    def test_get_version(self):
+        '''
+        Tests Game.get_version
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the version of a game increases when its rolls are replaced and not when rolls are appended
+
+        Exceptions raised:
+            AssertionError if the version of a game changes unexpectedly
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array([1, 2, 3, 4], dtype = np.int8))])
+        game.play(10, append = True)
+        version = game.get_version()
+        game.play(10, append = True)
+        self.assertEqual(game.get_version(), version)
+        game.play(10)
+        self.assertGreater(game.get_version(), version)
+
+    def test_get_metadata(self):
+        '''
+        Tests Game.get_metadata
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the metadata of a play holds the fingerprints of the dice, a seed from which the play may be repeated, and the chunk size
+
+        Exceptions raised:
+            AssertionError if the metadata of a play is unexpected or does not repeat the play
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
+        list_of_dice = [Die(array_of_faces), Die.from_weights(array_of_faces, np.array([1.0, 2.0, 3.0, 4.0]))]
+        game = Game(list_of_dice)
+        game.play(100, seed = 0, chunk_size = 64)
+        dictionary_of_metadata = game.get_metadata()
+        self.assertEqual(dictionary_of_metadata['fingerprints'], [die.get_fingerprint().hex() for die in list_of_dice])
+        self.assertEqual(dictionary_of_metadata['chunk_size'], 64)
+        dictionary_of_seed = dictionary_of_metadata['seed']
+        matrix_of_codes = game.get_matrix_of_codes().copy()
+        game.play(100, seed = np.random.SeedSequence(dictionary_of_seed['entropy'], spawn_key = dictionary_of_seed['spawn_key']), chunk_size = dictionary_of_metadata['chunk_size'])
+        self.assertTrue(np.array_equal(game.get_matrix_of_codes(), matrix_of_codes))
+        game.play(100)
+        self.assertIsNone(game.get_metadata()['seed'])
 
     def test_show(self):
         '''
@@ -275,6 +1255,9 @@ class TestGame(unittest.TestCase):
         Side effects:
             Compares data frames of rolls and dice with integer and string faces, where each number of rows and observations is the number of rolls, each number of columns and features is the number of dice, and each cell value is a face rolled.
             Compares data frames of rolls, dice, and integer and string faces, where each row corresponds to a roll, each data frame has a face column, and each cell value is a face rolled.
+            Ensures a data frame of codes views the matrix of codes of a game in C and F order without copying it.
+            Ensures a data frame in narrow form is cached until the game is played again.
+            Ensures string faces are shown as categories of the faces of the game and numeric faces are not.
 
         Exceptions raised:
             AssertionError if a shown data frame of rolls and dice does not equal an expected data frame of rolls and dice, or
@@ -284,24 +1267,31 @@ class TestGame(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         shown_data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = [3, 3, 3, 3, 2, 3, 2, 4, 4, 2, 4, 3, 3, 4, 1, 1, 1, 4, 4, 4]
-        for i in range(0, 10):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        shown_data_frame_of_rolls_and_dice = game.show('narrow')
-        expected_data_frame_of_rolls_and_dice = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
-        expected_data_frame_of_rolls_and_dice.index.rename(['roll_index', 'die_index'], inplace = True)
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
+        # Identical dice are rolled together, row by row, with the generator of the first chunk of the seed sequence of the first die.
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(10)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(20 * 10)).reshape(20, 10))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        shown_data_frame_of_rolls_dice_and_faces = game.show('narrow')
+        expected_data_frame_of_rolls_dice_and_faces = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
+        expected_data_frame_of_rolls_dice_and_faces.index.rename(['roll_index', 'die_index'], inplace = True)
+        self.assertTrue(shown_data_frame_of_rolls_dice_and_faces.index.equals(expected_data_frame_of_rolls_dice_and_faces.index))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_dice_and_faces['face'].to_numpy(), expected_data_frame_of_rolls_dice_and_faces['face'].to_numpy()))
+        self.assertIs(game.show('narrow'), shown_data_frame_of_rolls_dice_and_faces)
+        for order in ['C', 'F']:
+            game.play(20, seed = 0, order = order)
+            self.assertTrue(np.shares_memory(game.show('codes').to_numpy(), game.get_matrix_of_codes()))
+            self.assertTrue(np.array_equal(game.show('wide').to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+            self.assertEqual(game.show('wide').index.name, 'roll_index')
+            self.assertIsNot(game.show('narrow'), shown_data_frame_of_rolls_dice_and_faces)
+            self.assertTrue(game.show('narrow').equals(shown_data_frame_of_rolls_dice_and_faces))
 
         list_of_fair_coins = []
         for i in range(0, 3):
@@ -310,18 +1300,61 @@ class TestGame(unittest.TestCase):
             list_of_fair_coins.append(fair_coin)
         game_with_three_fair_coins = Game(list_of_fair_coins)
         number_of_rolls = 10
-        game_with_three_fair_coins.play(number_of_rolls)
+        game_with_three_fair_coins.play(number_of_rolls, seed = 0)
         shown_data_frame_of_rolls_and_dice = game_with_three_fair_coins.show('wide')
-        expected_data_frame_of_rolls_and_dice = pd.DataFrame()
-        expected_list_of_rolled_faces = ['T', 'T', 'T', 'T', 'H', 'T', 'H', 'T', 'T', 'H']
-        for i in range(0, 3):
-            expected_data_frame_of_rolls_and_dice[i] = expected_list_of_rolled_faces
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        shown_data_frame_of_rolls_and_dice = game_with_three_fair_coins.show('narrow')
-        expected_data_frame_of_rolls_and_dice = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
-        expected_data_frame_of_rolls_and_dice.index.rename(['roll_index', 'die_index'], inplace = True)
-        self.assertTrue(shown_data_frame_of_rolls_and_dice.equals(shown_data_frame_of_rolls_and_dice))
-        Die._roll_is_being_tested = False
+        list_of_seed_sequences = np.random.SeedSequence(0).spawn(3)
+        expected_data_frame_of_rolls_and_dice = pd.DataFrame(np.array(Die(array_of_faces, seed = generate_generator_for_chunk(list_of_seed_sequences[0], 0)).roll(number_of_rolls * 3)).reshape(number_of_rolls, 3))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_and_dice.to_numpy(), expected_data_frame_of_rolls_and_dice.to_numpy()))
+        shown_data_frame_of_rolls_dice_and_faces = game_with_three_fair_coins.show('narrow')
+        expected_data_frame_of_rolls_dice_and_faces = expected_data_frame_of_rolls_and_dice.stack().to_frame('face')
+        expected_data_frame_of_rolls_dice_and_faces.index.rename(['roll_index', 'die_index'], inplace = True)
+        self.assertTrue(shown_data_frame_of_rolls_dice_and_faces.index.equals(expected_data_frame_of_rolls_dice_and_faces.index))
+        self.assertTrue(np.array_equal(shown_data_frame_of_rolls_dice_and_faces['face'].to_numpy(), expected_data_frame_of_rolls_dice_and_faces['face'].to_numpy()))
+        # String faces are categories of the vocabulary of the game, whose codes take one byte per cell.
+        for data_frame_of_faces in [shown_data_frame_of_rolls_and_dice, shown_data_frame_of_rolls_dice_and_faces]:
+            for series_of_faces in [data_frame_of_faces[column] for column in data_frame_of_faces.columns]:
+                self.assertIsInstance(series_of_faces.dtype, pd.CategoricalDtype)
+                self.assertEqual(series_of_faces.cat.categories.tolist(), ['H', 'T'])
+                self.assertEqual(series_of_faces.cat.codes.dtype, np.int8)
+        self.assertFalse(isinstance(game.show('wide')[0].dtype, pd.CategoricalDtype))
+
+    def test_iter_narrow(self):
+        '''
+        Tests Game.iter_narrow
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the chunks of a game in narrow form, in C and F order and in a file, together equal the data frame of the game in narrow form
+            Ensures a game cannot be provided in chunks before it is played, when it stores only counts, or with a chunk size that is not positive
+
+        Exceptions raised:
+            AssertionError if concatenated chunks do not equal the data frame in narrow form, or a chunk has an unexpected number of rows
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        game = Game([Die(np.array(['H', 'T'])) for _ in range(3)])
+        with self.assertRaises(AssertionError):
+            next(game.iter_narrow())
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            for order, path_to_file in [('C', None), ('F', None), ('C', os.path.join(path_to_directory, 'game.bin'))]:
+                game.play(25, seed = 0, order = order, path_to_file = path_to_file)
+                list_of_data_frames_of_rolls_dice_and_faces = list(game.iter_narrow(chunk_size = 10))
+                self.assertEqual([len(data_frame) for data_frame in list_of_data_frames_of_rolls_dice_and_faces], [30, 30, 15])
+                self.assertTrue(pd.concat(list_of_data_frames_of_rolls_dice_and_faces).equals(game.show('narrow')))
+            game.release()
+        with self.assertRaises(ValueError):
+            game.play(10)
+            game.iter_narrow(chunk_size = 0)
+        game.play(10, store = 'counts')
+        with self.assertRaises(ValueError):
+            game.iter_narrow()
 
 from montecarlosimulator import Analyzer
 
@@ -347,7 +1380,7 @@ class TestAnalyzer(unittest.TestCase):
             none
 
         Side effects:
-            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
+            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face, built from the faces or from the face counts stored by a game
 
         Exceptions raised:
             AssertionError if a shown data frame of rolls and face counts does not equal an expected data frame of rolls and face counts
@@ -356,20 +1389,22 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         data_frame_of_rolls_and_face_counts = analyzer.generate_data_frame_of_rolls_and_face_counts()
         data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).fillna(0).astype(dtype = np.int8)
+        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).reindex(columns = game.get_array_of_faces()).fillna(0).astype(dtype = np.uint8).rename_axis(columns = 'face')
         self.assertTrue(data_frame_of_rolls_and_face_counts.equals(expected_data_frame_of_rolls_and_face_counts))
-        Die._roll_is_being_tested = False
+
+        game.play(20, seed = 0, store = 'face_counts')
+        data_frame_of_rolls_and_stored_face_counts = Analyzer(game).generate_data_frame_of_rolls_and_face_counts()
+        self.assertTrue(data_frame_of_rolls_and_stored_face_counts.equals(expected_data_frame_of_rolls_and_face_counts))
 
     def test_generate_data_frame_of_rolls_and_face_counts(self):
         '''
@@ -382,7 +1417,8 @@ class TestAnalyzer(unittest.TestCase):
             none
 
         Side effects:
-            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face
+            Compares data frames of rolls and face counts, where the number of rows and observations is the number of rolls, the number of columns and features is the number of faces, and each cell value is a count of the number of dice for one roll with a face, for coins that store codes and coins that store bits
+            Ensures a data frame of rolls and face counts has integer counts of every face, including a face never rolled, for string faces in memory and in a file
 
         Exceptions raised:
             AssertionError if a shown data frame of rolls and face counts does not equal an expected data frame of rolls and face counts
@@ -391,20 +1427,43 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         data_frame_of_rolls_and_face_counts = analyzer.generate_data_frame_of_rolls_and_face_counts()
         data_frame_of_rolls_and_dice = game.show('wide')
-        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).fillna(0).astype(dtype = np.int8)
+        expected_data_frame_of_rolls_and_face_counts = data_frame_of_rolls_and_dice.apply(lambda series_of_faces: series_of_faces.value_counts(), axis = 1).reindex(columns = game.get_array_of_faces()).fillna(0).astype(dtype = np.uint8).rename_axis(columns = 'face')
         self.assertTrue(data_frame_of_rolls_and_face_counts.equals(expected_data_frame_of_rolls_and_face_counts))
-        Die._roll_is_being_tested = False
+
+        # The face counts of coins that store bits are counts of bits, which equal the face counts of coins that store codes.
+        game_with_twenty_coins = Game([Die(np.array([0, 1], dtype = np.int64)) for _ in range(20)])
+        game_with_twenty_coins.play(50, seed = 0)
+        data_frame_of_rolls_and_face_counts_of_codes = Analyzer(game_with_twenty_coins).generate_data_frame_of_rolls_and_face_counts()
+        game_with_twenty_coins.play(50, seed = 0, store = 'bits')
+        data_frame_of_rolls_and_face_counts_of_bits = Analyzer(game_with_twenty_coins).generate_data_frame_of_rolls_and_face_counts()
+        self.assertTrue(data_frame_of_rolls_and_face_counts_of_bits.equals(data_frame_of_rolls_and_face_counts_of_codes))
+
+        # Every face is a column of integer counts, including a face that is never rolled and faces that are strings, for codes in memory and in a file.
+        array_of_faces = np.array(['A', 'B', 'C', 'D'])
+        list_of_dice = [Die.from_weights(array_of_faces, np.array([1.0, 2.0, 3.0, 0.0])) for _ in range(5)]
+        game = Game(list_of_dice)
+        game.play(1000, seed = 0)
+        data_frame_of_rolls_and_face_counts = Analyzer(game).generate_data_frame_of_rolls_and_face_counts()
+        self.assertEqual(data_frame_of_rolls_and_face_counts.columns.tolist(), ['A', 'B', 'C', 'D'])
+        self.assertTrue((data_frame_of_rolls_and_face_counts.dtypes == np.uint8).all())
+        self.assertEqual(data_frame_of_rolls_and_face_counts['D'].sum(), 0)
+        self.assertTrue((data_frame_of_rolls_and_face_counts.sum(axis = 1) == 5).all())
+        for face in ['A', 'B', 'C']:
+            self.assertTrue(np.array_equal(data_frame_of_rolls_and_face_counts[face].to_numpy(), (game.show('wide') == face).sum(axis = 1).to_numpy()))
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(1000, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            self.assertTrue(Analyzer(game).generate_data_frame_of_rolls_and_face_counts().equals(data_frame_of_rolls_and_face_counts))
+            game.release()
 
     def test_get_number_of_rolls_where_all_dice_have_the_same_face(self):
         '''
@@ -419,6 +1478,7 @@ class TestAnalyzer(unittest.TestCase):
         Side effects:
             Compares a number of rolls with a number of faces with counts greater than zero equal to one with an expected number of rolls with a number of faces with counts greater than zero equal to one
             Compares data frames of rolls and face counts where all dice for one roll have the same face
+            Compares the numbers of rolls where all coins have the same face and the face combinations of coins that store codes and coins that store bits
 
         Exceptions raised:
             AssertionError if a number of rolls with a number of faces with counts greater than zero equal to one is not equal to an expected number of rolls with a number of faces with counts greater than zero equal to one, or
@@ -428,19 +1488,19 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one = analyzer.get_number_of_rolls_where_all_dice_have_the_same_face()
-        self.assertEqual(number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one, 20)
+        expected_number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one = (game.show('wide').nunique(axis = 1) == 1).sum()
+        self.assertEqual(number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one, expected_number_of_rolls_with_number_of_faces_with_counts_greater_than_zero_equal_to_one)
         data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same = analyzer.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same
-        data_frame_of_face_combinations_and_counts = analyzer.data_frame_of_face_combinations_and_counts
+        data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
         first_face_combination = data_frame_of_face_combinations_and_counts.index[0]
         number_of_faces = len(first_face_combination)
         list_with_elements_face = ['face'] * number_of_faces
@@ -452,7 +1512,8 @@ class TestAnalyzer(unittest.TestCase):
             if number_of_unique_faces == 1:
                 count = series_of_face_combination_and_count['count']
                 expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.loc[face_combination, :] = count
-        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same))
+        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index))
+        self.assertEqual(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist(), expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist())
 
         list_of_fair_coins = []
         for i in range(0, 3):
@@ -460,12 +1521,14 @@ class TestAnalyzer(unittest.TestCase):
             fair_coin = Die(array_of_faces)
             list_of_fair_coins.append(fair_coin)
         game_with_three_fair_coins = Game(list_of_fair_coins)
-        game_with_three_fair_coins.play(1000)
+        game_with_three_fair_coins.play(1000, seed = 0)
         analyzer = Analyzer(game_with_three_fair_coins)
         number_of_jackpots = analyzer.get_number_of_rolls_where_all_dice_have_the_same_face()
-        self.assertEqual(number_of_jackpots, 1000)
+        expected_number_of_jackpots = (game_with_three_fair_coins.show('wide').nunique(axis = 1) == 1).sum()
+        self.assertGreater(expected_number_of_jackpots, 0)
+        self.assertEqual(number_of_jackpots, expected_number_of_jackpots)
         data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same = analyzer.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same
-        data_frame_of_face_combinations_and_counts = analyzer.data_frame_of_face_combinations_and_counts
+        data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
         first_face_combination = data_frame_of_face_combinations_and_counts.index[0]
         number_of_faces = len(first_face_combination)
         list_with_elements_face = ['face'] * number_of_faces
@@ -477,8 +1540,145 @@ class TestAnalyzer(unittest.TestCase):
             if number_of_unique_faces == 1:
                 count = series_of_face_combination_and_count['count']
                 expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.loc[face_combination, :] = count
-        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same))
-        Die._roll_is_being_tested = False
+        self.assertTrue(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index.equals(expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index))
+        self.assertEqual(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist(), expected_data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same['count'].tolist())
+
+        game_with_three_fair_coins.play(1000, seed = 0, store = 'bits')
+        analyzer = Analyzer(game_with_three_fair_coins)
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), expected_number_of_jackpots)
+        self.assertTrue(analyzer.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.equals(data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same))
+        self.assertTrue(analyzer.generate_data_frame_of_face_combinations_and_counts().equals(data_frame_of_face_combinations_and_counts))
+        self.assertFalse(hasattr(Analyzer(game_with_three_fair_coins), 'data_frame_of_face_combinations_and_counts'))
+
+    def test_find_rolls_where_all_dice_have_the_same_face(self):
+        '''
+        Tests Analyzer.find_rolls_where_all_dice_have_the_same_face
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares the rolls where all dice have the same face, and their faces, with those found in the data frame of rolls and dice, for games that store codes in memory or in a file, face counts, or bits, and after rolls are appended, including by an analyzer to a game that does not store codes
+
+        Exceptions raised:
+            AssertionError if the rolls where all dice have the same face or their faces are unexpected, or ValueError is not raised for a game that stores only counts
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['H', 'T'])
+        game = Game([Die(array_of_faces) for _ in range(4)])
+        game.play(1000, seed = 0)
+        data_frame_of_rolls_and_dice = game.show('wide')
+        array_of_rolls_are_jackpots = (data_frame_of_rolls_and_dice.nunique(axis = 1) == 1).to_numpy()
+        expected_array_of_indices_of_rolls = np.flatnonzero(array_of_rolls_are_jackpots)
+        expected_list_of_faces = data_frame_of_rolls_and_dice.iloc[expected_array_of_indices_of_rolls, 0].astype(str).tolist()
+        analyzer = Analyzer(game)
+        number_of_jackpots, data_frame_of_rolls_where_all_dice_have_the_same_face = analyzer.find_rolls_where_all_dice_have_the_same_face()
+        self.assertGreater(number_of_jackpots, 0)
+        self.assertEqual(number_of_jackpots, len(expected_array_of_indices_of_rolls))
+        self.assertEqual(data_frame_of_rolls_where_all_dice_have_the_same_face.index.name, 'roll_index')
+        self.assertTrue(np.array_equal(data_frame_of_rolls_where_all_dice_have_the_same_face.index, expected_array_of_indices_of_rolls))
+        self.assertEqual(data_frame_of_rolls_where_all_dice_have_the_same_face['face'].tolist(), expected_list_of_faces)
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots)
+
+        game_with_appended_rolls = Game([Die(array_of_faces) for _ in range(4)])
+        game_with_appended_rolls.play(1000, seed = 0)
+        game_with_appended_rolls.play(500, append = True)
+        number_of_jackpots_after_append, data_frame_of_rolls_where_all_dice_have_the_same_face_after_append = Analyzer(game_with_appended_rolls).find_rolls_where_all_dice_have_the_same_face()
+        for store in ['face_counts', 'bits']:
+            game.play(1000, seed = 0, store = store)
+            number_of_jackpots_of_store, data_frame_of_rolls_where_all_dice_have_the_same_face_of_store = Analyzer(game).find_rolls_where_all_dice_have_the_same_face()
+            self.assertEqual(number_of_jackpots_of_store, number_of_jackpots)
+            self.assertTrue(data_frame_of_rolls_where_all_dice_have_the_same_face_of_store.equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+            analyzer_of_store = Analyzer(game)
+            analyzer_of_store.play(500, append = True)
+            self.assertEqual(game.get_number_of_rolls(), 1500)
+            self.assertTrue(analyzer_of_store.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append))
+        game.play(1000, seed = 0, store = 'counts')
+        analyzer_of_counts = Analyzer(game)
+        analyzer_of_counts.play(500, append = True)
+        self.assertEqual(analyzer_of_counts.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots_after_append)
+
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(1000, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            analyzer = Analyzer(game)
+            self.assertTrue(analyzer.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+            analyzer.play(500, append = True)
+            matrix_of_codes = game.get_matrix_of_codes()
+            number_of_jackpots_after_append, data_frame_of_rolls_where_all_dice_have_the_same_face_after_append = analyzer.find_rolls_where_all_dice_have_the_same_face()
+            self.assertEqual(number_of_jackpots_after_append, int(np.sum(matrix_of_codes.min(axis = 1) == matrix_of_codes.max(axis = 1))))
+            self.assertTrue(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append.iloc[0:number_of_jackpots].equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+            self.assertTrue(np.array_equal(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append.index, np.flatnonzero(matrix_of_codes.min(axis = 1) == matrix_of_codes.max(axis = 1))))
+            opened_game = Game.open(game.get_path_of_file())
+            analyzer_of_opened_game = Analyzer(opened_game)
+            self.assertTrue(analyzer_of_opened_game.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face_after_append))
+            self.assertEqual(analyzer_of_opened_game.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots_after_append)
+            self.assertEqual(analyzer_of_opened_game.data_frame_of_face_combinations_and_counts_where_combinations_have_all_faces_the_same.index.nlevels, 4)
+            opened_game.release()
+            game.release()
+
+        game.play(1000, seed = 0, shared_memory = True)
+        attached_game = Game.attach(game.get_name_of_shared_memory())
+        analyzer_of_attached_game = Analyzer(attached_game)
+        self.assertTrue(analyzer_of_attached_game.find_rolls_where_all_dice_have_the_same_face()[1].equals(data_frame_of_rolls_where_all_dice_have_the_same_face))
+        self.assertEqual(analyzer_of_attached_game.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots)
+        attached_game.release()
+        game.release()
+
+        game.play(1000, seed = 0, store = 'counts')
+        analyzer = Analyzer(game)
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), number_of_jackpots)
+        with self.assertRaises(ValueError):
+            analyzer.find_rolls_where_all_dice_have_the_same_face()
+
+    def test_generate_combination_index(self):
+        '''
+        Tests Analyzer.generate_combination_index
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Ensures the combination index of a game counts each face combination as many times as it was rolled, is kept until rolls are appended, agrees between games that store codes and games that store only counts, and merges across games
+
+        Exceptions raised:
+            AssertionError if a count of a face combination is wrong or a combination index is not kept or regenerated
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['A', 'B', 'C'])
+        game = Game([Die(array_of_faces) for _ in range(4)])
+        game.play(10000, seed = 0)
+        analyzer = Analyzer(game)
+        combination_index = analyzer.generate_combination_index()
+        self.assertIs(analyzer.generate_combination_index(), combination_index)
+        self.assertEqual(combination_index.get_number_of_combinations(), 15)
+        matrix_of_sorted_codes = np.sort(game.get_matrix_of_codes(), axis = 1)
+        self.assertEqual(combination_index.get_count([2, 1, 0, 1]), np.count_nonzero(np.all(matrix_of_sorted_codes == [0, 1, 1, 2], axis = 1)))
+        self.assertTrue(np.array_equal(combination_index.get_counts(game.get_matrix_of_codes()), [np.count_nonzero(np.all(matrix_of_sorted_codes == array_of_codes, axis = 1)) for array_of_codes in matrix_of_sorted_codes]))
+
+        analyzer.play(500, append = True)
+        combination_index_after_append = analyzer.generate_combination_index()
+        self.assertIsNot(combination_index_after_append, combination_index)
+        self.assertEqual(int(combination_index_after_append.get_ranks_and_counts()[1].sum()), 10500)
+
+        game_of_counts = Game([Die(array_of_faces) for _ in range(4)])
+        game_of_counts.play(10000, seed = 0, store = 'counts')
+        combination_index_of_counts = Analyzer(game_of_counts).generate_combination_index()
+        for array_of_counts, array_of_counts_of_codes in zip(combination_index_of_counts.get_ranks_and_counts(), combination_index.get_ranks_and_counts()):
+            self.assertTrue(np.array_equal(array_of_counts, array_of_counts_of_codes))
+        combination_index_of_counts.merge(combination_index_after_append)
+        self.assertEqual(combination_index_of_counts.get_count([0, 1, 1, 2]), combination_index.get_count([0, 1, 1, 2]) + combination_index_after_append.get_count([0, 1, 1, 2]))
 
     def test_generate_data_frame_of_face_combinations_and_counts(self):
         '''
@@ -491,7 +1691,8 @@ class TestAnalyzer(unittest.TestCase):
             none
 
         Side effects:
-            Compares data frames of face combinations and counts of how many times each face combination was rolled
+            Compares data frames of face combinations and counts of how many times each face combination was rolled, in order of face combination, for games that store codes in memory, games that store codes in a file, and games that store only counts, with a data frame counted roll by roll
+            Ensures face combinations of string faces and of many rolls are counted, and of many coins that store codes or bits
 
         Exceptions raised:
             AssertionError if two data frames of face combinations and counts of how many times each face combination was rolled are not equal
@@ -500,14 +1701,13 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
         data_frame_of_rolls_and_dice = game.show('wide')
@@ -523,8 +1723,104 @@ class TestAnalyzer(unittest.TestCase):
                 expected_data_frame_of_face_combinations_and_counts.at[face_combination, 'count'] += 1
             else:
                 expected_data_frame_of_face_combinations_and_counts.at[face_combination, 'count'] = 1
-        self.assertTrue(data_frame_of_face_combinations_and_counts.equals(expected_data_frame_of_face_combinations_and_counts))
-        Die._roll_is_being_tested = False
+        self.assertTrue(data_frame_of_face_combinations_and_counts.index.equals(expected_data_frame_of_face_combinations_and_counts.sort_index().index))
+        self.assertEqual(data_frame_of_face_combinations_and_counts['count'].tolist(), expected_data_frame_of_face_combinations_and_counts.sort_index()['count'].tolist())
+
+        data_frame_of_face_combinations_and_counts_of_codes = data_frame_of_face_combinations_and_counts
+        game.play(20, seed = 0, store = 'counts')
+        analyzer = Analyzer(game)
+        data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
+        self.assertTrue(data_frame_of_face_combinations_and_counts.equals(data_frame_of_face_combinations_and_counts_of_codes))
+        self.assertEqual(analyzer.get_number_of_rolls_where_all_dice_have_the_same_face(), game.get_accumulator().get_number_of_jackpots())
+        with self.assertRaises(ValueError):
+            analyzer.generate_data_frame_of_rolls_and_face_counts()
+
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(20, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            data_frame_of_face_combinations_and_counts_of_file = Analyzer(game).generate_data_frame_of_face_combinations_and_counts()
+            self.assertTrue(data_frame_of_face_combinations_and_counts_of_file.equals(data_frame_of_face_combinations_and_counts))
+            game.release()
+
+        array_of_faces = np.array(['A', 'B', 'C'])
+        game = Game([Die(array_of_faces) for _ in range(4)])
+        game.play(200000, seed = 0)
+        data_frame_of_face_combinations_and_counts = Analyzer(game).generate_data_frame_of_face_combinations_and_counts()
+        self.assertEqual(len(data_frame_of_face_combinations_and_counts), 15)
+        self.assertEqual(data_frame_of_face_combinations_and_counts['count'].sum(), 200000)
+        self.assertTrue(data_frame_of_face_combinations_and_counts.index.is_monotonic_increasing)
+        matrix_of_sorted_codes = np.sort(game.get_matrix_of_codes(), axis = 1)
+        self.assertEqual(data_frame_of_face_combinations_and_counts.loc[('A', 'B', 'B', 'C'), 'count'], np.count_nonzero(np.all(matrix_of_sorted_codes == [0, 1, 1, 2], axis = 1)))
+
+        game_of_coins = Game([Die(np.array(['H', 'T'])) for _ in range(100)])
+        game_of_coins.play(1000, seed = 0)
+        data_frame_of_face_combinations_and_counts = Analyzer(game_of_coins).generate_data_frame_of_face_combinations_and_counts()
+        array_of_numbers_of_tails, array_of_counts = np.unique(game_of_coins.get_matrix_of_codes().sum(axis = 1), return_counts = True)
+        self.assertEqual(data_frame_of_face_combinations_and_counts.index.nlevels, 100)
+        self.assertEqual(data_frame_of_face_combinations_and_counts['count'].tolist(), array_of_counts.tolist())
+        self.assertEqual([face_combination.count('T') for face_combination in data_frame_of_face_combinations_and_counts.index], array_of_numbers_of_tails.tolist())
+        game_of_coins.play(1000, seed = 0, store = 'bits')
+        self.assertTrue(Analyzer(game_of_coins).generate_data_frame_of_face_combinations_and_counts().equals(data_frame_of_face_combinations_and_counts))
+
+    def test_generate_data_frame_of_face_permutations_and_counts(self):
+        '''
+        Tests Analyzer.generate_data_frame_of_face_permutations_and_counts
+
+        Keyword arguments:
+            none
+
+        Return values:
+            none
+
+        Side effects:
+            Compares data frames of face permutations and counts, in order of face permutation, with the counts of the rows of the data frame of rolls and dice, for faces that are not sorted, games that store codes in memory or in a file or bits, and permutations that do not fit in 64 bits
+            Ensures ValueError is raised for a game that stores only counts
+
+        Exceptions raised:
+            AssertionError if a data frame of face permutations and counts is not equal to the counts of rows, or ValueError is not raised
+
+        Restrictions on when this method can be called:
+            none
+        '''
+
+        array_of_faces = np.array(['Z', 'Y', 'X', 'W'])
+        game = Game([Die(array_of_faces) for _ in range(3)])
+        game.play(5000, seed = 0)
+        analyzer = Analyzer(game)
+        data_frame_of_face_permutations_and_counts = analyzer.generate_data_frame_of_face_permutations_and_counts()
+        series_of_counts_of_rows = game.show('wide').astype(str).value_counts().sort_index()
+        self.assertEqual(data_frame_of_face_permutations_and_counts.index.names, ['face'] * 3)
+        self.assertTrue(data_frame_of_face_permutations_and_counts.index.is_monotonic_increasing)
+        self.assertEqual(data_frame_of_face_permutations_and_counts.index.tolist(), series_of_counts_of_rows.index.tolist())
+        self.assertEqual(data_frame_of_face_permutations_and_counts['count'].tolist(), series_of_counts_of_rows.tolist())
+        self.assertEqual(len(data_frame_of_face_permutations_and_counts), 64)
+        self.assertEqual(data_frame_of_face_permutations_and_counts.loc[('X', 'W', 'Z'), 'count'], np.count_nonzero(np.all(game.get_matrix_of_codes() == [2, 3, 0], axis = 1)))
+        self.assertTrue(analyzer.data_frame_of_face_permutations_and_counts.equals(data_frame_of_face_permutations_and_counts))
+        self.assertEqual(analyzer.generate_data_frame_of_face_combinations_and_counts()['count'].sum(), data_frame_of_face_permutations_and_counts['count'].sum())
+
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(5000, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            self.assertTrue(Analyzer(game).generate_data_frame_of_face_permutations_and_counts().equals(data_frame_of_face_permutations_and_counts))
+            opened_game = Game.open(game.get_path_of_file())
+            self.assertTrue(Analyzer(opened_game).generate_data_frame_of_face_permutations_and_counts().equals(data_frame_of_face_permutations_and_counts))
+            opened_game.release()
+            game.release()
+        game.play(5000, seed = 0, store = 'counts')
+        with self.assertRaises(ValueError):
+            Analyzer(game).generate_data_frame_of_face_permutations_and_counts()
+
+        game_of_coins = Game([Die(np.array(['T', 'H'])) for _ in range(10)])
+        game_of_coins.play(5000, seed = 0)
+        data_frame_of_face_permutations_and_counts_of_codes = Analyzer(game_of_coins).generate_data_frame_of_face_permutations_and_counts()
+        game_of_coins.play(5000, seed = 0, store = 'bits')
+        self.assertTrue(Analyzer(game_of_coins).generate_data_frame_of_face_permutations_and_counts().equals(data_frame_of_face_permutations_and_counts_of_codes))
+
+        game_of_many_faces = Game([Die(np.arange(300, 0, -1, dtype = np.int16)) for _ in range(8)])
+        game_of_many_faces.play(1000, seed = 0)
+        data_frame_of_face_permutations_and_counts = Analyzer(game_of_many_faces).generate_data_frame_of_face_permutations_and_counts()
+        matrix_of_distinct_rolls, array_of_counts = np.unique(game_of_many_faces.get_array_of_faces()[game_of_many_faces.get_matrix_of_codes()], axis = 0, return_counts = True)
+        self.assertTrue(data_frame_of_face_permutations_and_counts.index.is_monotonic_increasing)
+        self.assertEqual(data_frame_of_face_permutations_and_counts.index.tolist(), [tuple(array_of_faces_of_roll) for array_of_faces_of_roll in matrix_of_distinct_rolls.tolist()])
+        self.assertEqual(data_frame_of_face_permutations_and_counts['count'].tolist(), array_of_counts.tolist())
 
     def test_play(self):
         '''
@@ -538,6 +1834,7 @@ class TestAnalyzer(unittest.TestCase):
 
         Side effects:
             Compares an indicator of whether a data frame of face combinations and counts needs to be generated when an analyzer is initialized, after the data frame is generated, and when the analyzer plays with an expected indicator
+            Ensures an analyzer that appends rolls to a game in a file scans only the appended rolls
 
         Exceptions raised:
             AssertionError if an indicator of whether a data frame of face combinations and counts needs to be generated is not equal to an expected indicator
@@ -546,21 +1843,36 @@ class TestAnalyzer(unittest.TestCase):
             none
         '''
 
-        Die._roll_is_being_tested = True
         list_of_dice = []
         array_of_faces = np.array([1, 2, 3, 4], dtype = np.int8)
         for i in range(0, 10):
             die = Die(array_of_faces)
             list_of_dice.append(die)
         game = Game(list_of_dice)
-        game.play(20)
+        game.play(20, seed = 0)
         analyzer = Analyzer(game)
         self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
         analyzer.get_number_of_rolls_where_all_dice_have_the_same_face()
+        self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
+        analyzer.generate_data_frame_of_face_combinations_and_counts()
         self.assertFalse(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
-        analyzer.play(1000)
+        analyzer.play(1000, seed = 1)
         self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
 
+        with tempfile.TemporaryDirectory() as path_to_directory:
+            game.play(100, seed = 0, path_to_file = os.path.join(path_to_directory, 'game.bin'))
+            analyzer = Analyzer(game)
+            analyzer.generate_data_frame_of_face_combinations_and_counts()
+            accumulator_of_scanned_rolls = analyzer._accumulator_of_scanned_rolls
+            analyzer.play(50, append = True)
+            self.assertTrue(analyzer._data_frame_of_face_combinations_and_counts_needs_to_be_generated)
+            data_frame_of_face_combinations_and_counts = analyzer.generate_data_frame_of_face_combinations_and_counts()
+            self.assertIs(analyzer._accumulator_of_scanned_rolls, accumulator_of_scanned_rolls)
+            self.assertEqual(data_frame_of_face_combinations_and_counts['count'].sum(), 150)
+            analyzer.play(20, seed = 0)
+            self.assertEqual(analyzer.generate_data_frame_of_face_combinations_and_counts()['count'].sum(), 20)
+            game.release()
+
 if __name__ == "__main__":
     verbose = 2
     unittest.main(verbosity = verbose)
\ No newline at end of file